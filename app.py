@@ -1,8 +1,9 @@
 import streamlit as st
 import time
-import re
 import graphviz
 from nlp_automatos.loader import get_engine
+from nlp_automatos.pipeline import CorrectionPipeline
+from nlp_automatos.search_stats import SearchStats
 from nlp_automatos.trie import Trie
 from nlp_automatos.dawg import DAWG
 
@@ -27,18 +28,8 @@ st.markdown("""
 # Função de Carregamento
 @st.cache_resource(show_spinner="Carregando Motor de NLP...")
 def load_nlp_engine(algorithm_type):
-    return get_engine(algorithm_type, "data")
-
-# Funções Auxiliares de Texto
-def tokenize(text):
-    return re.findall(r'\w+|[^\w]+', text, re.UNICODE)
-
-def check_word_in_dict(engine, word):
-    if len(word) < 2 or word.isdigit(): return True
-    results = engine.search(word, 0)
-    for w, dist in results:
-        if dist == 0 and w.lower() == word.lower(): return True
-    return False
+    # Cache LRU de consultas: erros comuns ("caza", "escloa") se repetem muito
+    return get_engine(algorithm_type, "data", cache_entries=10_000, cache_bytes=64 * 2**20)
 
 # Função Geradora de Gráficos
 def generate_dot_code(word_list, algo_type):
@@ -157,11 +148,22 @@ tab1, tab2, tab3 = st.tabs(["Palavra Única", "Editor de Frase", "Visualizador d
 with tab1:
     st.subheader("Teste Unitário")
     word_input = st.text_input("Digite uma palavra:", placeholder="Ex: escloa")
+    show_stats = st.checkbox("Mostrar estatísticas da busca", value=False)
     if word_input:
+        stats = SearchStats() if show_stats else None
         start = time.time()
-        results = engine.search(word_input, k_value)
+        results = engine.search(word_input, k_value, stats=stats)
         tempo = (time.time() - start) * 1000
         st.write(f"⏱Tempo: **{tempo:.2f}ms** | {len(results)} sugestões")
+
+        if stats is not None:
+            c1, c2, c3, c4, c5 = st.columns(5)
+            c1.metric("Nós visitados", stats.nodes_visited)
+            c2.metric("Células de DP", stats.dp_cells)
+            c3.metric("Subárvores podadas", stats.pruned)
+            c4.metric("Profundidade máx.", stats.max_depth)
+            c5.metric("Resultados", stats.results)
+            st.caption(f"Núcleo: `{stats.core}` | {stats.elapsed_ms:.2f}ms dentro do motor")
         
         cols = st.columns(3)
         if not results: st.warning("Nenhuma sugestão encontrada.")
@@ -174,35 +176,28 @@ with tab2:
     sentence_input = st.text_area("Digite sua frase:", height=100, placeholder="Ex: Eu gosto de comer batata frita na minha caza.")
 
     if sentence_input:
-        tokens = tokenize(sentence_input)
-        unknown_words = []
-        token_status = []
-        
-        for token in tokens:
-            if re.match(r'\w+', token):
-                is_valid = check_word_in_dict(engine, token)
-                token_status.append((token, is_valid))
-                if not is_valid: unknown_words.append(token)
-            else:
-                token_status.append((token, True))
+        # Deduplica as palavras e faz uma única travessia para as desconhecidas
+        pipeline = CorrectionPipeline(engine, k_value, limit=10) # Só 10 sugestões por palavra
+        tokens = [t for chunk in pipeline.run([sentence_input]) for t in chunk.tokens]
+        unknown_words = [t for t in tokens if not t.known]
 
         st.markdown("### Análise do Autômato")
-        annotated = "".join([t if v else f'<span class="error">{t}</span>' for t, v in token_status])
+        annotated = "".join([t.text if t.known else f'<span class="error">{t.text}</span>' for t in tokens])
         st.markdown(f'<div style="background-color:#fff; color:#000; padding:15px; border-radius:5px; border:1px solid #ddd; font-family:monospace; font-size:1.1em;">{annotated}</div>', unsafe_allow_html=True)
         st.divider()
 
         if unknown_words:
             st.subheader("Correção")
             corrections = {}
-            cols = st.columns(min(len(set(unknown_words)), 3))
-            for idx, error_word in enumerate(set(unknown_words)):
-                suggestions = engine.search(error_word, k_value)
-                options = [error_word] + [s[0] for s in suggestions]
+            error_tokens = list({t.text: t for t in unknown_words}.values())
+            cols = st.columns(min(len(error_tokens), 3))
+            for idx, token in enumerate(error_tokens):
+                options = [token.text] + [s[0] for s in token.suggestions]
                 with cols[idx % 3]:
-                    corrections[error_word] = st.selectbox(f"Correção: '{error_word}'", options, key=f"fix_{idx}")
+                    corrections[token.text] = st.selectbox(f"Correção: '{token.text}'", options, key=f"fix_{idx}")
             
             st.subheader("Resultado Final")
-            final_sen = "".join([corrections[t] if not v and t in corrections else t for t, v in token_status])
+            final_sen = "".join([t.text if t.known else corrections[t.text] for t in tokens])
             st.success(final_sen)
         else:
             st.success("Texto validado!")
@@ -0,0 +1,47 @@
+"""
+Índice sem acentos x busca comum para erros de acentuação: tempo por
+consulta e fração das consultas em que a palavra original foi sugerida,
+sobre as consultas 'accent_drop' da carga reprodutível (workload.py) e
+palavras com vários acentos, em que a busca comum precisa de k maior.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.accent_folding
+"""
+import time
+from pathlib import Path
+from benchmarks.workload import build_workload
+from nlp_automatos.folding import fold
+from nlp_automatos.loader import get_engine
+
+DICT_PATH = Path("data/dicionario_pt.txt")
+
+def measure(search, cases):
+    start = time.perf_counter()
+    recovered = sum(any(word == original for word, _ in search(query)) for query, original in cases)
+    return (time.perf_counter() - start) / len(cases) * 1000, recovered / len(cases)
+
+def main():
+    engine = get_engine("dawg")
+    start = time.perf_counter()
+    index = engine.build_folded_index()
+    print(f"Índice sem acentos: {len(index)} chaves, {index.keys.num_states} estados, "
+          f"{time.perf_counter() - start:.2f}s")
+
+    single = [(item["query"], item["original"]) for item in build_workload(DICT_PATH, 900)
+              if item["kind"] == "accent_drop"]
+    # Todos os acentos removidos: 'coração' -> 'coracao' (duas edições)
+    multi = [(fold(w), w) for w in engine.iter_words() if sum(a != b for a, b in zip(w, fold(w))) >= 2][:300]
+
+    print(f"{'Carga':<16}{'Método':<26}{'ms/consulta':>12}{'Recall':>8}")
+    for name, cases in (("um acento", single), ("vários acentos", multi)):
+        for label, search in (
+            ("search k=1", lambda q: engine.search(q, 1)),
+            ("search k=2", lambda q: engine.search(q, 2)),
+            ("search_folded k=0", lambda q: engine.search_folded(q, 0)),
+            ("search_folded k=1", lambda q: engine.search_folded(q, 1)),
+        ):
+            ms, recall = measure(search, cases)
+            print(f"{name:<16}{label:<26}{ms:>12.3f}{recall:>8.2f}")
+
+if __name__ == "__main__":
+    main()
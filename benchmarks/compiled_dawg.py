@@ -0,0 +1,49 @@
+"""
+Compara o DAWG em objetos (DawgNode) com a sua forma compilada (CSR).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.compiled_dawg
+"""
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+from nlp_automatos.dawg import DAWG
+
+DICT_PATH = Path("data/dicionario_pt.txt")
+QUERIES = ["caza", "escloa", "batata", "computador", "ortografia", "exceção", "paralelepipedo"]
+
+def measure_latency(engine, k, repeat=3):
+    """Retorna a latência média (ms) de uma busca, considerando todas as consultas."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in QUERIES:
+            engine.search(query, k)
+        best = min(best, time.perf_counter() - start)
+    return best / len(QUERIES) * 1000
+
+def main():
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    dawg = DAWG()
+    dawg.load_from_file(DICT_PATH)
+    # O registro de minimização não é necessário após finish()
+    dawg.release_register()
+    gc.collect()
+    dawg_bytes = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+
+    compiled = dawg.compile()
+
+    print(f"Estados: {compiled.num_states} | Arestas: {compiled.num_edges}")
+    print(f"{'':<12}{'DAWG (objetos)':>18}{'Compilado (CSR)':>18}")
+    print(f"{'Memória':<12}{dawg_bytes / 2**20:>15.2f} MB{compiled.nbytes() / 2**20:>15.2f} MB")
+    for k in (1, 2, 3):
+        t_dawg = measure_latency(dawg, k)
+        t_comp = measure_latency(compiled, k)
+        print(f"{f'Busca k={k}':<12}{t_dawg:>15.2f} ms{t_comp:>15.2f} ms")
+
+if __name__ == "__main__":
+    main()
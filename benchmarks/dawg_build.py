@@ -0,0 +1,76 @@
+"""
+Tempo de construção e pico de memória do DAWG: registro de minimização
+antigo (chave = nó, hash/eq montando string a cada chamada) contra o atual
+(chave = assinatura em tupla, calculada uma vez por nó), além do modo
+streaming com ordenação externa em blocos.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.dawg_build
+"""
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+from nlp_automatos.dawg import DAWG
+
+DICT_PATH = Path("data/dicionario_pt.txt")
+
+def _legacy_signature(node) -> str:
+    """Assinatura original de DawgNode (antigo __repr__)."""
+    signature = f"{node.is_word}"
+    for char in sorted(node.edges.keys()):
+        signature += f"|{char}:{node.edges[char].id}"
+    return signature
+
+class _LegacyKey:
+    """Reproduz o hash/eq original de DawgNode (string refeita a cada chamada)."""
+    __slots__ = ['node']
+
+    def __init__(self, node):
+        self.node = node
+
+    def __hash__(self):
+        return hash(_legacy_signature(self.node))
+
+    def __eq__(self, other):
+        return _legacy_signature(self.node) == _legacy_signature(other.node)
+
+class LegacyDAWG(DAWG):
+    def _minimize(self, down_to):
+        for i in range(len(self.unchecked_nodes) - 1, down_to - 1, -1):
+            char, parent, child = self.unchecked_nodes.pop()
+            key = _LegacyKey(child)
+            if key in self.minimized_nodes:
+                parent.edges[char] = self.minimized_nodes[key]
+            else:
+                self.minimized_nodes[key] = child
+
+def build_time(cls, **options):
+    gc.collect()
+    start = time.perf_counter()
+    cls().load_from_file(DICT_PATH, **options)
+    return time.perf_counter() - start
+
+def build_peak_memory(cls, **options):
+    gc.collect()
+    tracemalloc.start()
+    dawg = cls()
+    dawg.load_from_file(DICT_PATH, **options)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+def main():
+    variants = (
+        ("Antes (string hash)", LegacyDAWG, {}),
+        ("Depois (assinatura)", DAWG, {}),
+        ("Ordenação externa", DAWG, {"chunk_size": 20_000}),
+    )
+    print(f"{'':<22}{'Tempo (s)':>12}{'Pico (MB)':>12}")
+    for label, cls, options in variants:
+        seconds = build_time(cls, **options)
+        peak = build_peak_memory(cls, **options)
+        print(f"{label:<22}{seconds:>12.2f}{peak / 2**20:>12.1f}")
+
+if __name__ == "__main__":
+    main()
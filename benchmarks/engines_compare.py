@@ -0,0 +1,75 @@
+"""
+Trie x DAWG x Trie Radix: número de nós, memória residente (RSS) e
+latência de busca. Cada motor é construído em um processo separado para
+que a medida de RSS de um não contamine a do outro.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.engines_compare
+"""
+import multiprocessing
+import os
+import resource
+import time
+from pathlib import Path
+from nlp_automatos.dawg import DAWG
+from nlp_automatos.radix_trie import RadixTrie
+from nlp_automatos.trie import Trie
+
+DICT_PATH = Path("data/dicionario_pt.txt")
+QUERIES = ["caza", "escloa", "batata", "computador", "ortografia", "exceção",
+           "paralelepipedo", "mesa", "cachorro", "felicidade", "programasão", "voce"]
+ENGINES = {"Trie": Trie, "DAWG": DAWG, "Radix": RadixTrie}
+
+def rss_bytes():
+    """RSS atual (Linux); nos outros sistemas, o pico informado por getrusage."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def count_nodes(engine):
+    """Estados distintos alcançáveis a partir da raiz (nós compartilhados contam uma vez)."""
+    root = engine._root_state()
+    seen = {id(root)}
+    pending = [root]
+    while pending:
+        for _, child in engine._edges(pending.pop()):
+            if id(child) not in seen:
+                seen.add(id(child))
+                pending.append(child)
+    return len(seen)
+
+def measure(name, queue):
+    before = rss_bytes()
+    engine = ENGINES[name]()
+    engine.load_from_file(DICT_PATH)
+    if name == "DAWG":
+        engine.release_register() # Registro só é usado na construção
+    rss = rss_bytes() - before
+
+    latencies = {}
+    for k in (1, 2, 3):
+        engine.search(QUERIES[0], k) # Aquece as tabelas do autômato
+        start = time.perf_counter()
+        for query in QUERIES:
+            engine.search(query, k)
+        latencies[k] = (time.perf_counter() - start) / len(QUERIES) * 1000
+    queue.put((name, count_nodes(engine), rss, latencies))
+
+def main():
+    queue = multiprocessing.Queue()
+    rows = []
+    for name in ENGINES:
+        worker = multiprocessing.Process(target=measure, args=(name, queue))
+        worker.start()
+        rows.append(queue.get())
+        worker.join()
+
+    print(f"{'Motor':<8}{'Nós':>10}{'RSS (MB)':>12}{'k=1 (ms)':>11}{'k=2 (ms)':>11}{'k=3 (ms)':>11}")
+    for name, nodes, rss, latencies in rows:
+        print(f"{name:<8}{nodes:>10}{rss / 2**20:>12.1f}"
+              f"{latencies[1]:>11.2f}{latencies[2]:>11.2f}{latencies[3]:>11.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Poda por limites de comprimento (menor/maior sufixo por estado): nós
+visitados e tempo por consulta, com e sem os limites, nos núcleos que os
+usam (a linha bit-paralela não mantém o mínimo da linha e os ignora).
+
+Um nó conta como visitado quando a travessia lista as suas arestas.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.length_bounds
+"""
+import time
+from nlp_automatos.loader import get_engine
+
+QUERIES = ["sol", "mar", "caza", "voce", "escloa", "batata", "computador", "paralelepipedo"]
+ROW_ENGINES = ("classic", "automaton")
+
+def run(engine, row_engine, k, with_bounds):
+    visited = 0
+    def edges_of(state):
+        nonlocal visited
+        visited += 1
+        return engine._edges(state)
+
+    bounds_of = engine._length_bounds if with_bounds else None
+    start = time.perf_counter()
+    for query in QUERIES:
+        core = engine._search_core(query, k, row_engine)
+        for _ in core(engine._root_state(), edges_of, engine._is_final, query, k, bounds_of=bounds_of):
+            pass
+    return visited, (time.perf_counter() - start) / len(QUERIES) * 1000
+
+def main():
+    engine = get_engine("dawg")
+    engine.search(QUERIES[0], 3) # Aquece as tabelas do autômato
+
+    print(f"{'Núcleo':<13}{'k':>3}{'Nós sem':>11}{'Nós com':>11}{'Economia':>10}{'ms sem':>9}{'ms com':>9}")
+    for row_engine in ROW_ENGINES:
+        for k in (1, 2, 3):
+            plain, plain_ms = run(engine, row_engine, k, False)
+            bounded, bounded_ms = run(engine, row_engine, k, True)
+            print(f"{row_engine:<13}{k:>3}{plain:>11}{bounded:>11}{1 - bounded / plain:>10.1%}"
+                  f"{plain_ms:>9.2f}{bounded_ms:>9.2f}")
+
+if __name__ == "__main__":
+    main()
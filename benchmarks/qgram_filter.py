@@ -0,0 +1,73 @@
+"""
+Índice de q-gramas x travessia do autômato: tempo total por k sobre
+consultas longas (12+ caracteres, uma substituição, semente fixa), quantas
+o índice vence e quanto ele precisa ler das listas de postings. É a medição
+que mantém o índice opcional (search(..., row_engine='qgram')) em vez de
+escolhido pelo modo 'auto'.
+
+Resultado de referência (dicionário completo, 2-gramas; o índice é
+verificado contra a busca comum em toda consulta):
+    k=2 (30 consultas): travessia   79 ms, índice  2284 ms, índice vence 0
+    k=3 (30 consultas): travessia  310 ms, índice  3303 ms, índice vence 0
+    k=4 (30 consultas): travessia 3862 ms, índice  6188 ms, índice vence 7
+    k=5 (12 consultas): travessia 3014 ms, índice  5753 ms, índice vence 5
+    k=6 (11 consultas): travessia 4606 ms, índice 20162 ms, índice vence 1
+As vitórias são consultas de 17+ caracteres com poucos candidatos; a soma
+das postings (200 a 500 mil entradas por consulta, --verbose) não as
+separa das derrotas, então nenhum limiar por consulta compensa.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.qgram_filter
+"""
+import argparse
+import random
+import time
+from nlp_automatos.loader import get_engine
+from benchmarks.workload import misspell
+
+def long_queries(engine, size: int, seed: int, min_length: int = 12):
+    words = [w for w in engine.iter_words() if len(w) >= min_length]
+    rng = random.Random(seed)
+    return [misspell(word, "substitution", rng) for word in rng.sample(words, size)]
+
+def timed(search, query, k):
+    start = time.perf_counter()
+    results = search(query, k)
+    return results, (time.perf_counter() - start) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Índice de q-gramas x travessia.")
+    parser.add_argument("--queries", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("-k", type=int, nargs="+", default=[2, 3, 4])
+    parser.add_argument("--verbose", action="store_true", help="uma linha por consulta")
+    args = parser.parse_args()
+
+    engine = get_engine("dawg")
+    start = time.perf_counter()
+    index = engine.build_qgram_index(q=2)
+    print(f"Índice de 2-gramas: {len(index)} palavras, {len(index.postings)} q-gramas, "
+          f"{time.perf_counter() - start:.2f}s")
+    queries = long_queries(engine, args.queries, args.seed)
+
+    print(f"{'k':>3}{'Consultas':>11}{'Travessia (ms)':>16}{'Q-gramas (ms)':>15}{'Vitórias':>10}")
+    for k in args.k:
+        engine.search(queries[0], k) # Aquece as tabelas do autômato
+        traversal_total = index_total = wins = measured = 0
+        for query in queries:
+            if len(index._grams(query)) - k * index.q < 1:
+                continue # Filtro de contagem inválido para esta consulta
+            expected, traversal = timed(lambda q, k: engine.search(q, k), query, k)
+            found, filtered = timed(lambda q, k: engine.search(q, k, row_engine='qgram'), query, k)
+            assert sorted(found) == sorted(expected)
+            measured += 1
+            traversal_total += traversal
+            index_total += filtered
+            wins += filtered < traversal
+            if args.verbose:
+                postings = sum(len(index.postings.get(gram, ())) for gram in index._grams(query))
+                print(f"    {query:<22}{traversal:>10.1f}{filtered:>10.1f}{postings:>10} postings")
+        print(f"{k:>3}{measured:>11}{traversal_total:>16.0f}{index_total:>15.0f}{wins:>10}")
+
+if __name__ == "__main__":
+    main()
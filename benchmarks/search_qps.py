@@ -0,0 +1,82 @@
+"""
+Consultas por segundo da busca de Levenshtein em Trie e DAWG: a versão
+recursiva original contra o núcleo iterativo compartilhado, com a linha
+clássica, com a linha bit-paralela (Myers/Hyyrö) e com o autômato de
+Levenshtein universal (Schulz-Mihov). Por fim, um lote de consultas em
+uma travessia única (search_many) contra uma busca por consulta.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.search_qps
+"""
+import time
+from pathlib import Path
+from nlp_automatos.dawg import DAWG
+from nlp_automatos.trie import Trie
+
+DICT_PATH = Path("data/dicionario_pt.txt")
+QUERIES = ["caza", "escloa", "batata", "computador", "ortografia", "exceção",
+           "paralelepipedo", "mesa", "cachorro", "felicidade", "programasão", "voce"]
+
+def legacy_search(engine, word, max_k):
+    """Busca recursiva original (uma lista e uma string novas por nó)."""
+    def children_of(node):
+        return node.children if isinstance(engine, Trie) else node.edges
+
+    def recurse(node, char, target_word, prev_row, results, current_word):
+        columns = len(target_word) + 1
+        current_row = [prev_row[0] + 1]
+        for col in range(1, columns):
+            insert_cost = current_row[col - 1] + 1
+            delete_cost = prev_row[col] + 1
+            replace_cost = prev_row[col - 1] + (0 if target_word[col - 1] == char else 1)
+            current_row.append(min(insert_cost, delete_cost, replace_cost))
+        if current_row[-1] <= max_k and node.is_word:
+            results.append((current_word, current_row[-1]))
+        if min(current_row) <= max_k:
+            for next_char, next_node in children_of(node).items():
+                recurse(next_node, next_char, target_word, current_row, results, current_word + next_char)
+
+    word = word.lower()
+    results = []
+    for char, node in children_of(engine.root).items():
+        recurse(node, char, word, range(len(word) + 1), results, char)
+    return sorted(results, key=lambda x: x[1])
+
+def qps(search, k, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in QUERIES:
+            search(query, k)
+        best = min(best, time.perf_counter() - start)
+    return len(QUERIES) / best
+
+def main():
+    trie = Trie()
+    trie.load_from_file(DICT_PATH)
+    dawg = DAWG()
+    dawg.load_from_file(DICT_PATH)
+
+    print(f"{'':<14}{'Recursiva (q/s)':>18}{'Clássica (q/s)':>18}{'Bit-paralela (q/s)':>20}{'Autômato (q/s)':>18}")
+    for name, engine in (("Trie", trie), ("DAWG", dawg)):
+        for k in (1, 2):
+            before = qps(lambda w, k: legacy_search(engine, w, k), k)
+            classic = qps(lambda w, k: engine.search(w, k, row_engine='classic'), k)
+            bitparallel = qps(lambda w, k: engine.search(w, k, row_engine='bitparallel'), k)
+            automaton = qps(lambda w, k: engine.search(w, k, row_engine='automaton'), k)
+            print(f"{f'{name} k={k}':<14}{before:>18.1f}{classic:>18.1f}{bitparallel:>20.1f}{automaton:>18.1f}")
+
+    print(f"\n{'':<14}{'Uma a uma (s)':>18}{'search_many (s)':>18}")
+    for name, engine in (("Trie", trie), ("DAWG", dawg)):
+        for k in (1, 2, 3):
+            start = time.perf_counter()
+            for query in QUERIES:
+                engine.search(query, k)
+            single = time.perf_counter() - start
+            start = time.perf_counter()
+            engine.search_many(QUERIES, k)
+            batch = time.perf_counter() - start
+            print(f"{f'{name} k={k}':<14}{single:>18.3f}{batch:>18.3f}")
+
+if __name__ == "__main__":
+    main()
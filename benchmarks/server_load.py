@@ -0,0 +1,77 @@
+"""
+Teste de carga do servidor de consultas (nlp_automatos/server.py): várias
+conexões keep-alive simultâneas enviam /search com a carga reprodutível de
+workload.py. Mostra vazão, percentis de latência vistos pelo cliente e as
+métricas do servidor (tamanho médio do micro-lote, fila).
+
+Uso (a partir da raiz do projeto), com o servidor já rodando:
+    python -m nlp_automatos.server --port 8080
+    python -m benchmarks.server_load --port 8080 --connections 32 --k 1
+"""
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+from urllib.parse import quote
+from benchmarks.workload import build_workload
+from nlp_automatos.batch import PERCENTILES, percentile
+
+DICT_PATH = Path("data/dicionario_pt.txt")
+
+async def request(reader, writer, host, method, target, body=b""):
+    writer.write(f"{method} {target} HTTP/1.1\r\nHost: {host}\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+async def client(host, port, queries, k, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for query in queries:
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, host, "GET", f"/search?word={quote(query)}&k={k}&limit=10")
+            latencies.append((time.perf_counter() - start) * 1000)
+            if status != 200:
+                raise RuntimeError(f"Resposta {status} para '{query}'")
+    finally:
+        writer.close()
+
+async def run(args):
+    queries = [item["query"] for item in build_workload(DICT_PATH, args.queries, args.seed)]
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(args.host, args.port, queries[i::args.connections], args.k, latencies)
+                           for i in range(args.connections)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"[Load] {len(latencies)} consultas (k={args.k}) em {elapsed:.2f} s com "
+          f"{args.connections} conexões: {len(latencies) / elapsed:.0f} consultas/s")
+    print("[Load] Latência no cliente: " + " | ".join(
+        f"p{p} {percentile(latencies, p):.2f} ms" for p in PERCENTILES))
+
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    _, metrics = await request(reader, writer, args.host, "GET", "/metrics")
+    writer.close()
+    print(f"[Load] Servidor: {metrics['batches']} micro-lotes, "
+          f"{metrics['mean_batch_size']} consultas por lote em média, fila {metrics['queue_depth']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga do servidor de consultas.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--k", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Suíte de benchmarks reprodutível: construção, memória de pico, carga do
+cache binário e latência de busca (p50/p95/p99) para k = 0..3, sobre
+data/dicionario_pt.txt e uma carga fixa de erros de digitação (workload.py).
+
+Cada motor roda em um processo separado, para que a memória de um não
+contamine a do outro. O resultado sai em JSON (stdout ou --output); as
+mensagens de progresso vão para stderr. Com --compare, mostra a razão
+entre as latências p50 atuais e as de um JSON anterior.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --engines dawg --compare bench.json
+"""
+import argparse
+import contextlib
+import json
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from benchmarks.engines_compare import rss_bytes
+from benchmarks.workload import build_workload
+from nlp_automatos.batch import PERCENTILES, percentile
+from nlp_automatos.dawg import DAWG
+from nlp_automatos.radix_trie import RadixTrie
+from nlp_automatos.storage import load_automaton, save_automaton
+from nlp_automatos.trie import Trie
+
+DICT_PATH = Path("data/dicionario_pt.txt")
+ENGINES = {"trie": Trie, "dawg": DAWG, "radix": RadixTrie}
+K_VALUES = (0, 1, 2, 3)
+
+def latency_profile(engine, workload):
+    """Latências (ms) por k e a fração de consultas cuja palavra original foi sugerida."""
+    profile = {}
+    for k in K_VALUES:
+        engine.search(workload[0]["query"], k) # Aquece as tabelas do autômato
+        latencies = []
+        recovered = 0
+        for item in workload:
+            start = time.perf_counter()
+            results = engine.search(item["query"], k)
+            latencies.append((time.perf_counter() - start) * 1000)
+            recovered += any(word == item["original"] for word, _ in results)
+        latencies.sort()
+        profile[f"k={k}"] = {
+            **{f"p{p}_ms": round(percentile(latencies, p), 4) for p in PERCENTILES},
+            "mean_ms": round(sum(latencies) / len(latencies), 4),
+            "recall": round(recovered / len(workload), 4),
+        }
+    return profile
+
+def measure(name, dict_path, workload, queue):
+    """Roda em um processo novo: constrói, mede memória, grava/abre o cache e consulta."""
+    with contextlib.redirect_stdout(sys.stderr): # Mensagens dos motores não sujam o JSON
+        before = rss_bytes()
+        start = time.perf_counter()
+        engine = ENGINES[name]()
+        engine.load_from_file(dict_path)
+        build_seconds = time.perf_counter() - start
+        if name == "dawg":
+            engine.release_register() # Registro só é usado na construção
+        row = {
+            "build_seconds": round(build_seconds, 4),
+            "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 - before,
+            "rss_bytes": rss_bytes() - before,
+            "query": latency_profile(engine, workload),
+        }
+
+        # Forma compilada: tempo para abrir o cache binário (mmap) e latência nela
+        if hasattr(engine, "compile"):
+            with tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / f"bench.{name}.bin"
+                save_automaton(engine.compile(), path, name, dict_path)
+                start = time.perf_counter()
+                mapped = load_automaton(path, name, dict_path)
+                row["load_seconds"] = round(time.perf_counter() - start, 6)
+                row["query_mmap"] = latency_profile(mapped, workload)
+                del mapped # Libera o mmap antes de apagar o diretório
+    queue.put((name, row))
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(engines, dict_path: Path, size: int, seed: int) -> dict:
+    workload = build_workload(dict_path, size, seed)
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dictionary": str(dict_path),
+            "dictionary_bytes": dict_path.stat().st_size,
+            "seed": seed,
+            "queries": size,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "engines": {},
+    }
+
+    queue = multiprocessing.Queue()
+    for name in engines:
+        print(f"[Bench] {name}...", file=sys.stderr)
+        worker = multiprocessing.Process(target=measure, args=(name, dict_path, workload, queue))
+        worker.start()
+        result_name, row = queue.get()
+        worker.join()
+        report["engines"][result_name] = row
+    return report
+
+def compare(current: dict, previous: dict) -> str:
+    """Razão p50 atual / anterior por motor, forma e k (> 1 = mais lento agora)."""
+    lines = []
+    for field in ("seed", "queries", "dictionary_bytes"):
+        if current["meta"].get(field) != previous.get("meta", {}).get(field):
+            lines.append(f"[Bench] Aviso: '{field}' difere entre as execuções; as cargas não são iguais.")
+    lines.append(f"{'Motor':<14}{'k':>5}{'p50 antes':>12}{'p50 agora':>12}{'Razão':>8}")
+    for name, row in current["engines"].items():
+        old_row = previous.get("engines", {}).get(name)
+        if old_row is None:
+            continue
+        for form in ("query", "query_mmap"):
+            for k, stats in row.get(form, {}).items():
+                old = old_row.get(form, {}).get(k)
+                if old is None:
+                    continue
+                label = name if form == "query" else f"{name} (mmap)"
+                ratio = stats["p50_ms"] / old["p50_ms"] if old["p50_ms"] else float("nan")
+                lines.append(f"{label:<14}{k:>5}{old['p50_ms']:>12.3f}{stats['p50_ms']:>12.3f}{ratio:>8.2f}")
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de construção, carga e busca.")
+    parser.add_argument("--engines", nargs="+", choices=sorted(ENGINES), default=["trie", "dawg"])
+    parser.add_argument("--dict", type=Path, default=DICT_PATH)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--output", type=Path, help="arquivo JSON de saída (padrão: stdout)")
+    parser.add_argument("--compare", type=Path, help="JSON de uma execução anterior")
+    args = parser.parse_args()
+
+    report = run_suite(args.engines, args.dict, args.queries, args.seed)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+        print(f"[Bench] Resultado gravado em {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(compare(report, previous), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
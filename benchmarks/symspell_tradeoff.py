@@ -0,0 +1,62 @@
+"""
+Custo de construção e memória do índice SymSpell contra a latência de
+consulta ganha, comparado ao DAWG, para k = 1 e 2. Cada motor é construído
+em um processo separado (RSS e pico independentes).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.symspell_tradeoff
+"""
+import multiprocessing
+import resource
+import time
+from pathlib import Path
+from benchmarks.engines_compare import QUERIES, rss_bytes
+from nlp_automatos.dawg import DAWG
+from nlp_automatos.symspell import SymSpell
+
+DICT_PATH = Path("data/dicionario_pt.txt")
+ENGINES = {
+    "DAWG": DAWG,
+    "SymSpell k<=1": lambda: SymSpell(max_k=1),
+    "SymSpell k<=2": lambda: SymSpell(max_k=2),
+}
+
+def measure(name, queue):
+    before = rss_bytes()
+    start = time.perf_counter()
+    engine = ENGINES[name]()
+    engine.load_from_file(DICT_PATH)
+    build = time.perf_counter() - start
+    rss = rss_bytes() - before
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    latencies = {}
+    for k in (1, 2):
+        if isinstance(engine, SymSpell) and k > engine.max_k:
+            latencies[k] = None
+            continue
+        engine.search(QUERIES[0], k) # Aquece as tabelas do autômato
+        start = time.perf_counter()
+        for query in QUERIES:
+            engine.search(query, k)
+        latencies[k] = (time.perf_counter() - start) / len(QUERIES) * 1000
+    queue.put((name, build, rss, peak, latencies))
+
+def main():
+    queue = multiprocessing.Queue()
+    rows = []
+    for name in ENGINES:
+        worker = multiprocessing.Process(target=measure, args=(name, queue))
+        worker.start()
+        rows.append(queue.get())
+        worker.join()
+
+    def fmt(value):
+        return f"{value:>11.2f}" if value is not None else f"{'-':>11}"
+
+    print(f"{'Motor':<16}{'Build (s)':>11}{'RSS (MB)':>11}{'Pico (MB)':>11}{'k=1 (ms)':>11}{'k=2 (ms)':>11}")
+    for name, build, rss, peak, latencies in rows:
+        print(f"{name:<16}{build:>11.2f}{rss / 2**20:>11.1f}{peak / 2**20:>11.1f}{fmt(latencies[1])}{fmt(latencies[2])}")
+
+if __name__ == "__main__":
+    main()
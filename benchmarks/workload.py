@@ -0,0 +1,53 @@
+"""
+Carga de consultas reprodutível: erros de digitação realistas em português
+gerados a partir do próprio dicionário, com semente fixa.
+
+Tipos de erro (em rodízio):
+  - substitution: um caractere trocado por outra letra do alfabeto;
+  - accent_drop: um caractere acentuado perde o acento (ação -> acao);
+  - transposition: dois caracteres vizinhos diferentes trocam de lugar.
+"""
+import random
+from pathlib import Path
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyzáàâãéêíóôõúç"
+ACCENTS = str.maketrans("áàâãéêíóôõúüç", "aaaaeeiooouuc")
+KINDS = ("substitution", "accent_drop", "transposition")
+
+def _accented_positions(word: str) -> list[int]:
+    return [i for i, char in enumerate(word) if char.translate(ACCENTS) != char]
+
+def misspell(word: str, kind: str, rng: random.Random) -> str:
+    """Aplica um erro do tipo pedido (a palavra precisa admiti-lo)."""
+    if kind == "substitution":
+        i = rng.randrange(len(word))
+        char = rng.choice([c for c in ALPHABET if c != word[i]])
+        return word[:i] + char + word[i + 1:]
+    if kind == "accent_drop":
+        i = rng.choice(_accented_positions(word))
+        return word[:i] + word[i].translate(ACCENTS) + word[i + 1:]
+    if kind == "transposition":
+        i = rng.choice([i for i in range(len(word) - 1) if word[i] != word[i + 1]])
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    raise ValueError(f"Tipo de erro desconhecido: {kind}")
+
+def build_workload(dict_path: Path, size: int = 300, seed: int = 2025, min_length: int = 4):
+    """
+    Lista de {'query', 'original', 'kind'} com 'size' consultas.
+    Mesma semente + mesmo dicionário = mesma carga, em qualquer máquina.
+    """
+    with dict_path.open("r", encoding="utf-8", errors="ignore") as f:
+        words = sorted({line.strip().lower() for line in f if len(line.strip()) >= min_length})
+    accented = [w for w in words if _accented_positions(w)]
+
+    rng = random.Random(seed)
+    workload = []
+    for i in range(size):
+        kind = KINDS[i % len(KINDS)]
+        pool = accented if kind == "accent_drop" else words
+        while True:
+            original = rng.choice(pool)
+            if kind != "transposition" or len(set(original)) > 1:
+                break
+        workload.append({"query": misspell(original, kind, rng), "original": original, "kind": kind})
+    return workload
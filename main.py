@@ -1,7 +1,25 @@
+from nlp_automatos.batch import FORMATS, run_batch
 from nlp_automatos.loader import get_engine
+from pathlib import Path
+import argparse
+import sys
 import time
 
-def main():
+def batch_mode(args):
+    """Correção não interativa de um arquivo (ou stdin) com um pool de processos."""
+    source = sys.stdin if args.batch == "-" else open(args.batch, "r", encoding="utf-8", errors="ignore")
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        report = run_batch(source, output, args.algo, args.data, args.k, args.workers,
+                           args.block_lines, args.max_pending, args.limit, args.format)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    print(report.format(), file=sys.stderr)
+
+def interactive_mode():
     print("=== Corretor Ortográfico (Teste de Console) ===")
     
     # Configuração Inicial
@@ -37,20 +55,43 @@ def main():
         print(f"Buscando sugestões para '{palavra}' com k={k}...")
         
         start_search = time.time()
-        sugestoes = engine.search(palavra, k)
+        # Só as 10 melhores: a busca para assim que elas são conhecidas
+        try:
+            sugestoes = engine.search(palavra, k, limit=10)
+        except ValueError as e: # Ex.: k acima do suportado pelo motor
+            print(f"Erro na busca: {e}\n")
+            continue
         end_search = time.time()
 
         # Exibição dos Resultados
-        print(f"\n--- Resultados ({len(sugestoes)} encontrados em {(end_search - start_search)*1000:.2f}ms) ---")
+        print(f"\n--- Top {len(sugestoes)} resultados em {(end_search - start_search)*1000:.2f}ms ---")
         
         if not sugestoes:
             print("Nenhuma palavra encontrada dentro dessa distância.")
         else:
-            # Mostra as top 10 sugestões
-            for i, (sugestao, dist) in enumerate(sugestoes[:10], 1):
+            for i, (sugestao, dist) in enumerate(sugestoes, 1):
                 print(f"{i}. {sugestao} (Distância: {dist})")
         
         print("-" * 40 + "\n")
 
+def main():
+    parser = argparse.ArgumentParser(description="Corretor ortográfico: console interativo ou correção em lote.")
+    parser.add_argument("--batch", metavar="ARQUIVO", help="corrige o arquivo de palavras/texto ('-' = stdin)")
+    parser.add_argument("--algo", default="dawg", help="motor do modo em lote (padrão: dawg)")
+    parser.add_argument("--data", default="data", help="pasta do dicionário")
+    parser.add_argument("-k", type=int, nargs="+", default=[1], help="distâncias máximas (padrão: 1)")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    parser.add_argument("--output", type=Path, help="arquivo de saída (padrão: stdout)")
+    parser.add_argument("--workers", type=int, help="processos (padrão: todos os núcleos)")
+    parser.add_argument("--block-lines", type=int, default=1000, help="linhas por tarefa")
+    parser.add_argument("--max-pending", type=int, help="blocos em voo (padrão: 4 por processo)")
+    parser.add_argument("--limit", type=int, default=10, help="sugestões por palavra e k")
+    args = parser.parse_args()
+
+    if args.batch:
+        batch_mode(args)
+    else:
+        interactive_mode()
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,178 @@
+"""
+Correção em lote de um corpus (arquivo de palavras ou de texto) para
+execuções offline: as linhas são divididas em blocos e distribuídas a um
+multiprocessing.Pool, no qual cada processo mantém seu próprio motor
+carregado (o autômato compilado é aberto via mmap, então as páginas são
+compartilhadas entre os processos).
+
+A saída (JSONL ou TSV) sai na ordem da entrada. Só max_pending blocos
+ficam em voo: a leitura da entrada espera a escrita, e a memória não
+cresce com o tamanho do corpus.
+"""
+import contextlib
+import json
+import math
+import multiprocessing
+import os
+import re
+import sys
+import time
+from array import array
+from collections import deque
+from .loader import get_engine
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+FORMATS = ('jsonl', 'tsv')
+PERCENTILES = (50, 95, 99)
+
+# Motor de cada processo trabalhador (carregado uma vez, no initializer)
+_WORKER_ENGINE = None
+
+def percentile(sorted_values, p):
+    """Percentil por posição mais próxima (nearest-rank)."""
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def correct_block(engine, block, ks, limit: int | None = 10, fmt: str = 'jsonl',
+                  min_length: int = 2):
+    """
+    Corrige um bloco de linhas [(número, texto)].
+    Retorna (saída formatada, palavras processadas, {k: latências em ms}).
+
+    Tokens curtos ou não alfabéticos são ignorados, como no pipeline.
+    Palavras repetidas no bloco são validadas e buscadas uma única vez.
+    """
+    occurrences = [(number, token) for number, text in block for token in _WORD_RE.findall(text)
+                   if len(token) >= min_length and token.isalpha()]
+    keys = list(dict.fromkeys(token.lower() for _, token in occurrences))
+    known = dict(zip(keys, engine.contains_many(keys)))
+
+    latencies = {k: array('d') for k in ks}
+    suggestions = {}
+    for key in keys:
+        if known[key]:
+            continue
+        per_k = suggestions[key] = {}
+        for k in ks:
+            start = time.perf_counter()
+            per_k[k] = engine.search(key, k, limit=limit)
+            latencies[k].append((time.perf_counter() - start) * 1000)
+
+    lines = []
+    for number, token in occurrences:
+        key = token.lower()
+        if fmt == 'jsonl':
+            found = {str(k): [list(item) for item in results]
+                     for k, results in suggestions.get(key, {}).items()}
+            lines.append(json.dumps({'line': number, 'word': token, 'known': known[key],
+                                     'suggestions': found}, ensure_ascii=False))
+        elif known[key]:
+            lines.append(f"{number}\t{token}\t1\t\t")
+        else:
+            for k, results in suggestions[key].items():
+                found = ",".join(f"{word}:{dist}" for word, dist in results)
+                lines.append(f"{number}\t{token}\t0\t{k}\t{found}")
+    text = "".join(line + "\n" for line in lines)
+    return text, len(occurrences), latencies
+
+def _init_worker(algorithm_type, data_dir, cache_entries, max_k):
+    global _WORKER_ENGINE
+    with contextlib.redirect_stdout(sys.stderr): # Mensagens do loader não sujam a saída
+        _WORKER_ENGINE = get_engine(algorithm_type, data_dir, cache_entries=cache_entries, max_k=max_k)
+
+def _correct_block(block, ks, limit, fmt):
+    return correct_block(_WORKER_ENGINE, block, ks, limit, fmt)
+
+def _blocks(lines, block_lines: int):
+    """Agrupa as linhas em blocos [(número, texto)], numerados a partir de 1."""
+    block = []
+    for number, line in enumerate(lines, 1):
+        block.append((number, line))
+        if len(block) >= block_lines:
+            yield block
+            block = []
+    if block:
+        yield block
+
+class BatchReport:
+    """Vazão e latência por k acumuladas durante a execução."""
+
+    def __init__(self, ks):
+        self.words = 0
+        self.elapsed = 0.0
+        self.latencies = {k: array('d') for k in ks}
+
+    def add(self, words: int, latencies: dict):
+        self.words += words
+        for k, values in latencies.items():
+            self.latencies[k].extend(values)
+
+    def summary(self) -> dict:
+        per_k = {}
+        for k, values in self.latencies.items():
+            ordered = sorted(values)
+            row = {'searches': len(ordered)}
+            if ordered:
+                row.update({f"p{p}_ms": round(percentile(ordered, p), 4) for p in PERCENTILES})
+                row['mean_ms'] = round(sum(ordered) / len(ordered), 4)
+            per_k[f"k={k}"] = row
+        return {
+            'words': self.words,
+            'elapsed_seconds': round(self.elapsed, 3),
+            'words_per_second': round(self.words / self.elapsed, 1) if self.elapsed else 0.0,
+            'latency': per_k,
+        }
+
+    def format(self) -> str:
+        summary = self.summary()
+        lines = [f"[Batch] {summary['words']} palavras em {summary['elapsed_seconds']:.2f} s "
+                 f"({summary['words_per_second']:.0f} palavras/s)"]
+        for k, row in summary['latency'].items():
+            if row['searches']:
+                lines.append(f"[Batch] {k}: {row['searches']} buscas | p50 {row['p50_ms']:.3f} ms | "
+                             f"p95 {row['p95_ms']:.3f} ms | p99 {row['p99_ms']:.3f} ms | "
+                             f"média {row['mean_ms']:.3f} ms")
+            else:
+                lines.append(f"[Batch] {k}: nenhuma busca (todas as palavras são conhecidas)")
+        return "\n".join(lines)
+
+def run_batch(lines, output, algorithm_type: str = 'dawg', data_dir: str = 'data', ks=(1,),
+              workers: int | None = None, block_lines: int = 1000, max_pending: int | None = None,
+              limit: int | None = 10, fmt: str = 'jsonl', cache_entries: int = 10_000) -> BatchReport:
+    """
+    Lê 'lines' (qualquer iterável de str, lido sob demanda), corrige em
+    'workers' processos e escreve em 'output' na ordem da entrada.
+
+    max_pending (padrão: 4 blocos por processo) limita os blocos em voo:
+    com a fila cheia, o próximo bloco só é lido depois que o mais antigo
+    for escrito.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato desconhecido: {fmt}. Use {', '.join(FORMATS)}.")
+    ks = tuple(ks)
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 4 * workers
+
+    # Carrega (e grava o cache binário, se preciso) uma vez antes dos processos
+    with contextlib.redirect_stdout(sys.stderr):
+        get_engine(algorithm_type, data_dir, max_k=max(ks))
+
+    report = BatchReport(ks)
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(algorithm_type, data_dir, cache_entries, max(ks))) as pool:
+        in_flight = deque()
+
+        def write_oldest():
+            text, words, latencies = in_flight.popleft().get()
+            output.write(text)
+            report.add(words, latencies)
+
+        for block in _blocks(lines, block_lines):
+            if len(in_flight) >= max_pending:
+                write_oldest()
+            in_flight.append(pool.apply_async(_correct_block, (block, ks, limit, fmt)))
+        while in_flight:
+            write_oldest()
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -0,0 +1,159 @@
+import sys
+import threading
+from collections import OrderedDict
+from .search_stats import SearchStats
+
+def _estimate_bytes(key, results) -> int:
+    """Tamanho aproximado de uma entrada (lista + tuplas + strings)."""
+    size = sys.getsizeof(key[0]) + sys.getsizeof(results)
+    for word, _ in results:
+        size += sys.getsizeof(word) + 56 # tupla de 2 elementos
+    return size
+
+class CachedEngine:
+    """
+    Cache LRU de resultados na frente de um motor (Trie, DAWG, compilado...).
+
+    Cada entrada é indexada por (consulta normalizada, opções) e guarda o
+    maior k já calculado. Uma consulta com k menor é respondida filtrando
+    os resultados guardados: a ordem (distância, ordem de visita) é a mesma
+    que a busca direta produziria.
+
+    Os demais atributos (contains, compile...) são repassados ao motor.
+    stats_hook é lido e gravado no próprio motor, que o chama nas faltas; nos
+    acertos o cache chama o hook com um SearchStats marcado com cache_hit.
+    Seguro para uso concorrente entre threads.
+    """
+
+    def __init__(self, engine, max_entries: int = 10_000, max_bytes: int | None = None):
+        self.engine = engine
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict() # chave -> (k, resultados, bytes)
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name == 'engine': # Ainda não inicializado (ex.: unpickling)
+            raise AttributeError(name)
+        return getattr(self.engine, name)
+
+    @property
+    def stats_hook(self):
+        return getattr(self.engine, 'stats_hook', None)
+
+    @stats_hook.setter
+    def stats_hook(self, hook):
+        self.engine.stats_hook = hook
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.engine
+
+    def _hit_stats(self, word: str, max_k: int):
+        """SearchStats de um acerto, já iniciado, se há hook para recebê-lo."""
+        if self.stats_hook is None:
+            return None
+        stats = SearchStats()
+        stats.start(word, max_k)
+        stats.core = 'cache'
+        stats.cache_hit = True
+        return stats
+
+    def _report_hit(self, stats, results):
+        stats.stop(results)
+        self.stats_hook(stats)
+
+    def search(self, word: str, max_k: int, **options):
+        stats = options.pop('stats', None)
+        if stats is not None: # Estatísticas pedem uma travessia de verdade
+            return self.engine.search(word, max_k, stats=stats, **options)
+        hit_stats = self._hit_stats(word, max_k)
+        key = (word.lower(), tuple(sorted(options.items())))
+        results = self._lookup(key, max_k)
+        if results is None:
+            results = self.engine.search(word, max_k, **options) # O hook do motor mede a falta
+            self._store(key, max_k, results)
+        elif hit_stats is not None:
+            self._report_hit(hit_stats, results)
+        return list(results)
+
+    def search_many(self, queries, max_k: int, **options):
+        """
+        Resolve pelo cache o que já existe e manda só as faltas, em lote, ao
+        motor. As opções (limit, row_engine...) seguem para o motor e fazem
+        parte da chave do cache.
+        """
+        option_key = tuple(sorted(options.items()))
+        answers = {}
+        missing = []
+        for query in queries:
+            word = query.lower()
+            if word in answers:
+                continue
+            hit_stats = self._hit_stats(word, max_k)
+            answers[word] = self._lookup((word, option_key), max_k)
+            if answers[word] is None:
+                missing.append(word)
+            elif hit_stats is not None:
+                self._report_hit(hit_stats, answers[word])
+
+        if missing:
+            for word, results in zip(missing, self.engine.search_many(missing, max_k, **options)):
+                self._store((word, option_key), max_k, results)
+                answers[word] = results
+
+        return [list(answers[q.lower()]) for q in queries]
+
+    def _lookup(self, key, max_k):
+        """Resultados guardados para a chave (filtrados para max_k) ou None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < max_k:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            stored_k, results, _ = entry
+            if stored_k == max_k:
+                return results
+            return [r for r in results if r[1] <= max_k]
+
+    def _store(self, key, max_k, results):
+        size = _estimate_bytes(key, results)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                if old[0] > max_k: # Outra thread já guardou um k maior
+                    self._entries[key] = old
+                    return
+                self.current_bytes -= old[2]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return # Nunca caberia no orçamento
+            self._entries[key] = (max_k, results, size)
+            self.current_bytes += size
+
+            # Despeja as entradas menos usadas até caber no orçamento
+            while (len(self._entries) > self.max_entries
+                   or (self.max_bytes is not None and self.current_bytes > self.max_bytes)):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def cache_info(self) -> dict:
+        """Contadores do cache."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
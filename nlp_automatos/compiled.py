@@ -0,0 +1,173 @@
+import sys
+from bisect import bisect_left
+from array import array
+from .levenshtein import AutomatonSearchMixin
+
+class CompiledAutomaton(AutomatonSearchMixin):
+    """
+    Forma compilada (somente leitura) de um autômato de dicionário.
+
+    Os estados viram inteiros e as arestas ficam em tabelas planas no
+    estilo CSR, sem nenhum objeto Python por estado:
+      - offsets[s] .. offsets[s + 1]: intervalo das arestas do estado s;
+      - labels: rótulos das arestas, ordenados dentro de cada estado
+        (uma str compacta, um caractere por aresta);
+      - targets: estado de destino de cada aresta (uint32);
+      - finals: bitmap com os estados finais;
+      - shortest/longest: menor e maior sufixo até um estado final (uint16),
+        usados pela busca para podar ramos fora do alcance da consulta.
+    O estado 0 é sempre a raiz.
+
+    A numeração das palavras (word_index()) não vai para o disco: na
+    primeira vez em que é pedida, uma passada pelas tabelas calcula
+      - counts[s]: palavras aceitas a partir do estado s;
+      - ranks[e]: palavras que vêm antes da aresta e dentro do seu estado
+        (o próprio estado, se final, e as arestas de rótulo menor),
+    e cada passo de word_index() vira uma busca binária e uma soma.
+    """
+    __slots__ = ['offsets', 'labels', 'targets', 'finals', 'shortest', 'longest', 'counts',
+                 'ranks', 'weights', 'qgram_index', 'folded_index', 'stats_hook']
+
+    def __init__(self, offsets, labels: str, targets, finals, shortest, longest):
+        self.offsets = offsets
+        self.labels = labels
+        self.targets = targets
+        self.finals = finals
+        self.shortest = shortest
+        self.longest = longest
+        self.counts = None
+        self.ranks = None
+        self.weights = None
+        self.qgram_index = None
+        self.folded_index = None
+        self.stats_hook = None
+
+    @classmethod
+    def from_root(cls, root, children_of):
+        """
+        Numera os estados em largura (BFS) a partir da raiz e preenche as
+        tabelas. `children_of(node)` deve devolver o dicionário de arestas;
+        os nós também informam is_word e os limites shortest/longest.
+        Nós compartilhados (DAWG) recebem um único número.
+        """
+        index = {id(root): 0}
+        order = [root]
+        offsets = array('I', [0])
+        labels = []
+        targets = array('I')
+
+        # 'order' cresce enquanto é percorrida: é a própria fila da BFS
+        for node in order:
+            edges = children_of(node)
+            for char in sorted(edges):
+                child = edges[char]
+                key = id(child)
+                if key not in index:
+                    index[key] = len(order)
+                    order.append(child)
+                labels.append(char)
+                targets.append(index[key])
+            offsets.append(len(targets))
+
+        finals = bytearray((len(order) + 7) // 8)
+        for state, node in enumerate(order):
+            if node.is_word:
+                finals[state >> 3] |= 1 << (state & 7)
+        shortest = array('H', [node.shortest for node in order])
+        longest = array('H', [node.longest for node in order])
+
+        return cls(offsets, "".join(labels), targets, finals, shortest, longest)
+
+    @property
+    def num_states(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def is_final(self, state: int) -> bool:
+        return bool(self.finals[state >> 3] >> (state & 7) & 1)
+
+    def nbytes(self) -> int:
+        """Memória ocupada pelas tabelas (em bytes), mapeadas ou não."""
+        tables = (self.offsets, self.targets, self.finals, self.shortest, self.longest)
+        tables += tuple(t for t in (self.counts, self.ranks, self.weights) if t is not None)
+        return sys.getsizeof(self.labels) + sum(memoryview(t).nbytes for t in tables)
+
+    # Navegação usada pela busca compartilhada (AutomatonSearchMixin)
+    def _root_state(self):
+        return 0
+
+    def _state_key(self, state):
+        return state
+
+    def _estimated_bytes(self, states) -> int:
+        return self.nbytes()
+
+    def _edges(self, state):
+        start, end = self.offsets[state], self.offsets[state + 1]
+        return zip(self.labels[start:end], self.targets[start:end])
+
+    def _is_final(self, state):
+        return self.finals[state >> 3] >> (state & 7) & 1
+
+    def _length_bounds(self, state):
+        return self.shortest[state], self.longest[state]
+
+    def _word_count(self, state):
+        if self.counts is None:
+            self._number_words()
+        return self.counts[state]
+
+    def _word_index(self, word: str) -> int | None:
+        if self.ranks is None:
+            self._number_words()
+        labels, targets, ranks = self.labels, self.targets, self.ranks
+        state = 0
+        index = 0
+        for char in word:
+            start, end = self.offsets[state], self.offsets[state + 1]
+            i = bisect_left(labels, char, start, end)
+            if i == end or labels[i] != char:
+                return None
+            index += ranks[i]
+            state = targets[i]
+        return index if self._is_final(state) else None
+
+    def _number_words(self):
+        """Preenche counts (pós-ordem, pilha explícita) e ranks."""
+        offsets, targets = self.offsets, self.targets
+        counts = array('I', bytes(4 * self.num_states))
+        done = bytearray(self.num_states)
+        stack = [0]
+        while stack:
+            state = stack[-1]
+            if done[state]:
+                stack.pop()
+                continue
+            children = targets[offsets[state]:offsets[state + 1]]
+            pending = [child for child in children if not done[child]]
+            if pending:
+                stack.extend(pending)
+                continue
+            counts[state] = self._is_final(state) + sum(counts[child] for child in children)
+            done[state] = 1
+            stack.pop()
+
+        ranks = array('I', bytes(4 * self.num_edges))
+        for state in range(self.num_states):
+            before = self._is_final(state)
+            for edge in range(offsets[state], offsets[state + 1]):
+                ranks[edge] = before
+                before += counts[targets[edge]]
+        self.counts = counts
+        self.ranks = ranks
+
+    def _step(self, state, char):
+        # Rótulos ordenados dentro do estado: busca binária
+        start, end = self.offsets[state], self.offsets[state + 1]
+        i = bisect_left(self.labels, char, start, end)
+        if i < end and self.labels[i] == char:
+            return self.targets[i]
+        return None
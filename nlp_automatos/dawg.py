@@ -1,12 +1,26 @@
+import sys
 from pathlib import Path
+from typing import Iterable
+from .compiled import CompiledAutomaton
+from .external_sort import external_sort
+from .levenshtein import AutomatonSearchMixin
+
+# Limite superior de um nó que ainda não foi congelado
+UNBOUNDED_LENGTH = 0xFFFF
 
 class DawgNode:
     """
     Nó do Grafo Acíclico de Palavras (DAWG).
-    Implementa hashing para permitir a verificação de equivalência
-    durante a minimização.
+    A equivalência entre nós, usada na minimização, é a igualdade das
+    assinaturas de freeze(); o nó em si é comparado por identidade.
+    shortest/longest: menor e maior sufixo que completa uma palavra a
+    partir do nó, calculados em freeze() (nós equivalentes têm os mesmos).
+    words: quantas palavras são aceitas a partir do nó, também calculado em
+    freeze(); numera as palavras (hash perfeito mínimo, ver word_index()).
+    refs: arestas que chegam ao nó; só é mantido depois que o DAWG passa a
+    aceitar add()/remove() (estados com refs > 1 são de confluência).
     """
-    __slots__ = ['id', 'edges', 'is_word']
+    __slots__ = ['id', 'edges', 'is_word', 'signature', 'shortest', 'longest', 'words', 'refs']
     _next_id = 0
 
     def __init__(self):
@@ -14,31 +28,62 @@ class DawgNode:
         DawgNode._next_id += 1
         self.edges = {}
         self.is_word = False
+        self.signature = None # Preenchida em freeze()
+        # Nó ainda mutável: limites conservadores, que nunca podam
+        self.shortest = 0
+        self.longest = UNBOUNDED_LENGTH
+        self.words = 0
+        self.refs = 0
 
-    def __repr__(self):
-        # Assinatura única baseada nas arestas e se é final
-        signature = f"{self.is_word}"
-        for char in sorted(self.edges.keys()):
-            signature += f"|{char}:{self.edges[char].id}"
-        return signature
+    def _compute_signature(self):
+        # Tupla plana: (final, c1, id1, c2, id2, ...)
+        signature = [self.is_word]
+        for char in sorted(self.edges):
+            signature.append(char)
+            signature.append(self.edges[char].id)
+        return tuple(signature)
 
-    def __hash__(self):
-        return hash(self.__repr__())
+    def freeze(self):
+        """
+        Calcula a assinatura uma única vez, quando o nó não muda mais
+        (todos os filhos já foram minimizados).
+        """
+        if self.signature is None:
+            self.signature = self._compute_signature()
+            self.measure()
+        return self.signature
 
-    def __eq__(self, other):
-        return self.__repr__() == other.__repr__()
+    def measure(self):
+        """Limites de comprimento e contagem de palavras a partir dos filhos (que já estão congelados)."""
+        children = self.edges.values()
+        self.shortest = 0 if self.is_word else min((c.shortest for c in children), default=-1) + 1
+        self.longest = max((c.longest + 1 for c in children), default=0)
+        self.words = self.is_word + sum(c.words for c in children)
 
-class DAWG:
+class DAWG(AutomatonSearchMixin):
     """
     Autômato Finito Determinístico Mínimo.
-    Exige inserção em ordem alfabética.
+    A construção (insert) exige ordem alfabética; depois de finalizado, o
+    grafo aceita add()/remove() em qualquer ordem, continuando mínimo.
     """
     def __init__(self):
         self.root = DawgNode()
         self.unchecked_nodes = [] # Caminho da última palavra
-        self.minimized_nodes = {} # Registro de nós únicos
+        self.minimized_nodes = {} # Registro de nós únicos: assinatura -> nó
+        self.previous_word = None # Garante a ordem alfabética estrita
+        self.updatable = False    # refs e registro prontos para add()/remove()
+        self.register_released = False # Registro descartado por release_register()
 
     def insert(self, word: str):
+        if self.updatable or self.register_released:
+            raise ValueError("DAWG já finalizado (add()/remove() ou release_register()): use add() para novas palavras.")
+        if self.previous_word is not None:
+            if word == self.previous_word:
+                return # Palavra repetida: já está no grafo
+            if word < self.previous_word:
+                raise ValueError(f"DAWG exige ordem alfabética: '{word}' veio depois de '{self.previous_word}'.")
+        self.previous_word = word
+
         # Encontrar prefixo comum com a última palavra inserida
         common_prefix = 0
         for i in range(min(len(word), len(self.unchecked_nodes))):
@@ -67,57 +112,231 @@ class DAWG:
         # Percorre de trás para frente, fundindo estados equivalentes
         for i in range(len(self.unchecked_nodes) - 1, down_to - 1, -1):
             char, parent, child = self.unchecked_nodes.pop()
-            if child in self.minimized_nodes:
+            signature = child.freeze()
+            existing = self.minimized_nodes.get(signature)
+            if existing is not None:
                 # Reutiliza nó existente
-                parent.edges[char] = self.minimized_nodes[child]
+                parent.edges[char] = existing
             else:
                 # Registra novo nó único
-                self.minimized_nodes[child] = child
+                self.minimized_nodes[signature] = child
 
     def finish(self):
         """Minimiza os nós restantes após a última palavra."""
         self._minimize(0)
+        self.root.measure()
+
+    def release_register(self):
+        """
+        Finaliza a construção e descarta o registro de minimização (uma
+        entrada por estado), que a busca não usa. Depois disso, novas
+        palavras só entram por add(), que refaz o registro na primeira vez.
+        """
+        self.finish()
+        self.minimized_nodes = {}
+        self.register_released = True
+
+    # Atualização incremental (Carrasco & Forcada, 2002; Daciuk et al., 2000, caso não ordenado)
+    def _prepare_updates(self):
+        """
+        Uma única vez, antes do primeiro add()/remove(): finaliza a construção
+        e conta as arestas de entrada de cada nó. Também refaz o registro de
+        minimização se release_register() o descartou.
+        """
+        if not self.updatable:
+            self.finish()
+            for node in self._iter_nodes():
+                for child in node.edges.values():
+                    child.refs += 1
+            self.updatable = True
+        if self.register_released:
+            for node in self._iter_nodes():
+                if node is not self.root:
+                    self.minimized_nodes[node.freeze()] = node
+            self.register_released = False
+
+    def _iter_nodes(self):
+        """Cada nó do grafo uma vez (a raiz primeiro)."""
+        seen = {id(self.root)}
+        pending = [self.root]
+        while pending:
+            node = pending.pop()
+            yield node
+            for child in node.edges.values():
+                if id(child) not in seen:
+                    seen.add(id(child))
+                    pending.append(child)
+
+    def _prefix_path(self, word: str) -> list:
+        """Estados do maior prefixo de 'word' presente no grafo, a partir da raiz."""
+        path = [self.root]
+        for char in word:
+            child = path[-1].edges.get(char)
+            if child is None:
+                break
+            path.append(child)
+        return path
+
+    def _unregister(self, node):
+        if self.minimized_nodes.get(node.signature) is node:
+            del self.minimized_nodes[node.signature]
+        node.signature = None
+
+    def _unshare(self, path: list, word: str):
+        """
+        Prepara o caminho para ser alterado: os estados saem do registro (a
+        linguagem à direita deles vai mudar) e, a partir do primeiro estado de
+        confluência, cada estado é clonado, para que as outras palavras que
+        passam por ele não sejam afetadas.
+        """
+        cloning = False
+        for i in range(1, len(path)):
+            node = path[i]
+            cloning = cloning or node.refs > 1
+            if not cloning:
+                self._unregister(node)
+                continue
+            clone = DawgNode()
+            clone.edges = dict(node.edges)
+            clone.is_word = node.is_word
+            clone.refs = 1
+            for child in clone.edges.values():
+                child.refs += 1
+            node.refs -= 1
+            path[i - 1].edges[word[i - 1]] = clone
+            path[i] = clone
+
+    def _reminimize(self, path: list, word: str):
+        """
+        Do fim do caminho até a raiz: cada estado alterado é trocado por um
+        equivalente já registrado ou entra no registro.
+        """
+        for i in range(len(path) - 1, 0, -1):
+            node = path[i]
+            node.signature = None
+            signature = node.freeze()
+            existing = self.minimized_nodes.get(signature)
+            if existing is None:
+                self.minimized_nodes[signature] = node
+            else:
+                path[i - 1].edges[word[i - 1]] = existing
+                existing.refs += 1
+                for child in node.edges.values(): # 'node' sai do grafo
+                    child.refs -= 1
+        self.root.measure()
 
-    def load_from_file(self, file_path: Path):
+    def add(self, word: str) -> bool:
+        """
+        Insere uma palavra em qualquer ordem no DAWG finalizado, mantendo-o
+        mínimo. Custo proporcional ao tamanho da palavra (mais a preparação
+        única de _prepare_updates()). Retorna False se ela já existia.
+        """
+        self._prepare_updates()
+        path = self._prefix_path(word)
+        if len(path) == len(word) + 1 and path[-1].is_word:
+            return False
+
+        self._unshare(path, word)
+        node = path[-1]
+        for char in word[len(path) - 1:]:
+            child = DawgNode()
+            child.refs = 1
+            node.edges[char] = child
+            path.append(child)
+            node = child
+        node.is_word = True
+        self._reminimize(path, word)
+        if self.weights is not None: # A numeração das palavras seguintes avança uma posição
+            self.weights.insert(self._word_index(word), 0)
+        return True
+
+    def remove(self, word: str) -> bool:
+        """
+        Remove uma palavra do DAWG finalizado, mantendo-o mínimo; estados que
+        deixam de levar a alguma palavra são descartados. Custo proporcional
+        ao tamanho da palavra. Retorna False se ela não existia.
+        """
+        self._prepare_updates()
+        path = self._prefix_path(word)
+        if len(path) != len(word) + 1 or not path[-1].is_word:
+            return False
+        if self.weights is not None:
+            self.weights.pop(self._word_index(word))
+
+        self._unshare(path, word)
+        path[-1].is_word = False
+        while len(path) > 1 and not path[-1].edges and not path[-1].is_word:
+            path.pop()
+            del path[-1].edges[word[len(path) - 1]]
+        self._reminimize(path, word)
+        return True
+
+    def compile(self) -> CompiledAutomaton:
+        """
+        Congela o grafo minimizado em tabelas planas (CSR).
+        A forma compilada é somente leitura e também oferece search().
+        """
+        self.finish()
+        return CompiledAutomaton.from_root(self.root, lambda node: node.edges)
+
+    def load_from_stream(self, words: Iterable[str]):
+        """
+        Insere as palavras uma a uma, sem materializar a lista inteira.
+        O iterável precisa estar em ordem alfabética (verificado em insert()).
+        """
+        for word in words:
+            self.insert(word)
+        self.finish()
+
+    def load_from_file(self, file_path: Path, presorted: bool = False, chunk_size: int | None = None):
         """
         Lê e ordena o arquivo antes de inserir.
         DAWG exige ordem alfabética estrita.
+
+        Args:
+            presorted: O arquivo já está ordenado (após lower()); é lido em
+                streaming e uma palavra fora de ordem gera ValueError.
+            chunk_size: Ordenação externa em blocos desse tamanho, usando
+                arquivos temporários (memória limitada). Sem ele, a
+                ordenação é feita inteira em memória.
         """
         if not file_path.exists():
             raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
             
         with file_path.open('r', encoding='utf-8') as f:
-            # Ordenação em memória
-            words = sorted([line.strip().lower() for line in f if line.strip()])
-            for w in words:
-                self.insert(w)
-        self.finish()
+            words = (line.strip().lower() for line in f if line.strip())
+            if presorted:
+                self.load_from_stream(words)
+            elif chunk_size:
+                self.load_from_stream(external_sort(words, chunk_size))
+            else:
+                # Ordenação em memória
+                self.load_from_stream(sorted(words))
 
-    def search(self, word: str, max_k: int):
-        """Mesma lógica de busca da Trie, mas navegando no grafo minimizado."""
-        word = word.lower()
-        current_row = range(len(word) + 1)
-        results = []
+    # Navegação usada pela busca compartilhada (AutomatonSearchMixin)
+    def _root_state(self):
+        return self.root
 
-        for char, node in self.root.edges.items():
-            self._search_recursive(node, char, word, current_row, results, max_k, char)
-        
-        return sorted(results, key=lambda x: x[1])
+    def _edges(self, node):
+        return node.edges.items()
+
+    def _is_final(self, node):
+        return node.is_word
 
-    def _search_recursive(self, node, char, target_word, prev_row, results, max_k, current_word):
-        # Lógica idêntica à Trie, apenas mudando 'children' para 'edges'
-        columns = len(target_word) + 1
-        current_row = [prev_row[0] + 1]
+    def _step(self, node, char):
+        return node.edges.get(char)
 
-        for col in range(1, columns):
-            insert_cost = current_row[col - 1] + 1
-            delete_cost = prev_row[col] + 1
-            replace_cost = prev_row[col - 1] + (0 if target_word[col - 1] == char else 1)
-            current_row.append(min(insert_cost, delete_cost, replace_cost))
+    def _estimated_bytes(self, nodes) -> int:
+        # Nó + dicionário de arestas + assinatura; o registro de minimização à parte
+        total = sys.getsizeof(self.minimized_nodes) + sys.getsizeof(self.unchecked_nodes)
+        for node in nodes:
+            total += sys.getsizeof(node) + sys.getsizeof(node.edges)
+            if node.signature is not None:
+                total += sys.getsizeof(node.signature)
+        return total
 
-        if current_row[-1] <= max_k and node.is_word:
-            results.append((current_word, current_row[-1]))
+    def _length_bounds(self, node):
+        return node.shortest, node.longest
 
-        if min(current_row) <= max_k:
-            for next_char, next_node in node.edges.items():
-                self._search_recursive(next_node, next_char, target_word, current_row, results, max_k, current_word + next_char)
+    def _word_count(self, node):
+        return node.words
@@ -0,0 +1,47 @@
+import heapq
+import tempfile
+from typing import Iterable, Iterator
+
+def _spill(chunk: list[str], tmp_dir):
+    """Ordena um bloco em memória e grava em um arquivo temporário."""
+    chunk.sort()
+    f = tempfile.TemporaryFile("w+", encoding="utf-8", dir=tmp_dir)
+    f.writelines(w + "\n" for w in chunk)
+    f.seek(0)
+    return f
+
+def external_sort(words: Iterable[str], chunk_size: int = 100_000, tmp_dir=None) -> Iterator[str]:
+    """
+    Ordenação externa (merge sort em disco) para listas maiores que a RAM.
+    Mantém no máximo `chunk_size` palavras em memória: cada bloco é ordenado
+    e gravado em um arquivo temporário, e os blocos são intercalados com
+    heapq.merge, palavra a palavra. As palavras não podem conter '\\n'.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size deve ser positivo.")
+
+    files = []
+    try:
+        chunk = []
+        for word in words:
+            chunk.append(word)
+            if len(chunk) >= chunk_size:
+                files.append(_spill(chunk, tmp_dir))
+                chunk = []
+
+        # Tudo coube em um único bloco: não precisa tocar o disco
+        if not files:
+            chunk.sort()
+            yield from chunk
+            return
+
+        if chunk:
+            files.append(_spill(chunk, tmp_dir))
+        del chunk
+
+        streams = [(line.rstrip("\n") for line in f) for f in files]
+        yield from heapq.merge(*streams)
+    finally:
+        # TemporaryFile é apagado ao fechar
+        for f in files:
+            f.close()
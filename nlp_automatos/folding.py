@@ -0,0 +1,104 @@
+import unicodedata
+from array import array
+from .dawg import DAWG
+from .levenshtein import edit_distance
+
+class _FoldTable(dict):
+    """Tabela de str.translate preenchida sob demanda: cada caractere é decomposto uma única vez."""
+
+    def __missing__(self, code: int) -> str:
+        decomposed = unicodedata.normalize('NFD', chr(code))
+        folded = self[code] = "".join(char for char in decomposed if not unicodedata.combining(char))
+        return folded
+
+_FOLD_TABLE = _FoldTable()
+
+def fold(word: str) -> str:
+    """Minúsculas e sem diacríticos: 'Ação' -> 'acao', 'Aarão' -> 'aarao'."""
+    return word.lower().translate(_FOLD_TABLE)
+
+class FoldedIndex:
+    """
+    Índice secundário sem acentos: as chaves dobradas (fold()) formam um
+    DAWG compilado próprio e cada chave aponta para as formas originais do
+    dicionário ('acao' -> ação, acão...).
+
+    Armazenamento, sem dicionário por palavra: o número de cada chave no
+    DAWG (word_index(), a ordem alfabética das chaves) indexa starts, que
+    delimita o intervalo das suas formas; as formas ficam concatenadas em
+    uma str + offsets, agrupadas por chave.
+
+    A busca roda sobre as chaves dobradas, então diferenças só de acento não
+    gastam o orçamento k: 'acao' encontra 'ação' com k = 0. Com
+    accent_cost > 0, cada edição que existe só por causa dos acentos soma
+    essa fração à distância (os resultados passam a ter distância float), e
+    max_k limita o custo total: formas que passam dele ficam de fora.
+    """
+
+    def __init__(self, words):
+        pairs = sorted((fold(word), word) for word in words)
+        keys = DAWG()
+        starts = array('I', [0])
+        offsets = array('I', [0])
+        chunks = []
+        previous = None
+        for key, word in pairs:
+            if key != previous:
+                if previous is not None:
+                    starts.append(len(chunks))
+                keys.insert(key)
+                previous = key
+            chunks.append(word)
+            offsets.append(offsets[-1] + len(word))
+        starts.append(len(chunks))
+        keys.finish()
+
+        self.keys = keys.compile()
+        self.keys._number_words() # Numeração na construção, não na primeira consulta
+        self.starts = starts
+        self.offsets = offsets
+        self.forms = "".join(chunks)
+
+    def __len__(self):
+        return len(self.starts) - 1
+
+    def _form(self, form_id: int) -> str:
+        return self.forms[self.offsets[form_id]:self.offsets[form_id + 1]]
+
+    def forms_of(self, key: str) -> list[str]:
+        """Formas originais de uma chave já dobrada (lista vazia se não existe)."""
+        index = self.keys.word_index(key)
+        if index is None:
+            return []
+        return [self._form(i) for i in range(self.starts[index], self.starts[index + 1])]
+
+    def search(self, word: str, max_k: int, accent_cost: float = 0.0, limit: int | None = None):
+        """
+        (forma original, distância) a até max_k edições, sem contar acentos,
+        ordenadas pela distância. Com accent_cost, a distância vira
+        d + accent_cost * (edições reais - d), onde d é a distância sem acentos,
+        e só entram as formas com esse custo <= max_k (como custo >= d, a
+        busca pelas chaves a até max_k não perde nenhuma).
+        """
+        query = word.lower()
+        folded = fold(query)
+        if max_k == 0:
+            keys = [(folded, 0)] if self.keys.contains(folded) else []
+        elif accent_cost == 0 and limit is not None:
+            keys = self.keys.search(folded, max_k, limit=limit) # Cada chave rende ao menos uma forma
+        else:
+            keys = self.keys.search(folded, max_k)
+
+        results = []
+        for key, distance in keys:
+            for form in self.forms_of(key):
+                if accent_cost:
+                    extra = edit_distance(query, form, len(query) + len(form)) - distance
+                    cost = distance + accent_cost * extra
+                    if cost <= max_k:
+                        results.append((form, cost))
+                else:
+                    results.append((form, distance))
+        if accent_cost:
+            results.sort(key=lambda x: x[1])
+        return results if limit is None else results[:limit]
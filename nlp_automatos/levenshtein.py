@@ -0,0 +1,500 @@
+from itertools import islice
+from .levenshtein_automaton import (MAX_TABLE_K, _match_masks, levenshtein_search_automaton,
+                                   levenshtein_search_many_automaton)
+from .ranking import WordRankingMixin
+from .search_stats import SearchStats, instrument
+from .structure import structure_stats
+
+# Consultas até este tamanho usam a linha bit-paralela (uma palavra de máquina)
+WORD_SIZE = 64
+ROW_ENGINES = ('auto', 'classic', 'bitparallel', 'automaton', 'qgram')
+
+def edit_distance(a: str, b: str, max_k: int) -> int:
+    """
+    Distância de Levenshtein entre duas palavras, limitada: retorna max_k + 1
+    assim que a distância certamente passa de max_k. Usada para verificar
+    candidatos dos índices que não são autômatos (SymSpell, q-gramas).
+    """
+    if abs(len(a) - len(b)) > max_k:
+        return max_k + 1
+    prev_row = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current_row = [i]
+        row_min = i
+        for col in range(1, len(b) + 1):
+            cost = prev_row[col - 1] + (char != b[col - 1])
+            if prev_row[col] + 1 < cost:
+                cost = prev_row[col] + 1
+            if current_row[col - 1] + 1 < cost:
+                cost = current_row[col - 1] + 1
+            current_row.append(cost)
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_k:
+            return max_k + 1
+        prev_row = current_row
+    return prev_row[-1] if prev_row[-1] <= max_k else max_k + 1
+
+def _out_of_reach(shortest: int, longest: int, n: int, depth: int, max_k: int, budget: int) -> bool:
+    """
+    Poda por comprimento para as linhas de DP: só colunas j com
+    |depth - j| <= max_k podem estar vivas, então sobram entre
+    n - min(n, depth + max_k) e n - max(0, depth - max_k) caracteres da
+    consulta. Um sufixo de comprimento r custa ao menos a distância de r a
+    esse intervalo, que precisa caber no orçamento (max_k - mínimo da linha).
+    """
+    most = n - depth + max_k if depth > max_k else n
+    least = n - depth - max_k if depth + max_k < n else 0
+    return shortest > most + budget or longest < least - budget
+
+def _advance_row(prev_row: list, current_row: list, word: str, char: str, depth: int) -> int:
+    """
+    Preenche current_row, a linha da matriz na profundidade 'depth' (prefixo
+    terminado em 'char'), a partir de prev_row. Retorna o mínimo da linha;
+    a distância do prefixo até a consulta inteira fica em current_row[-1].
+    """
+    current_row[0] = row_min = left = depth
+    diagonal = prev_row[0]
+    for col in range(1, len(current_row)):
+        up = prev_row[col]
+        cost = diagonal if word[col - 1] == char else diagonal + 1
+        if up + 1 < cost:
+            cost = up + 1
+        if left + 1 < cost:
+            cost = left + 1
+        current_row[col] = cost
+        if cost < row_min:
+            row_min = cost
+        diagonal = up
+        left = cost
+    return row_min
+
+def levenshtein_search(root, edges_of, is_final, word: str, max_k: int, root_edges=None, bounds_of=None):
+    """
+    Núcleo da busca de Levenshtein, comum a todos os autômatos.
+
+    Percorre o grafo em profundidade com pilha explícita (sem recursão),
+    reaproveitando uma linha da matriz por profundidade e um único buffer
+    de caracteres para o prefixo atual. A palavra só é montada quando um
+    estado final fica dentro da distância.
+
+    Args:
+        root: Estado inicial.
+        edges_of: Função estado -> iterável de (caractere, próximo estado).
+        is_final: Função estado -> bool.
+        word: Palavra buscada.
+        max_k: Distância máxima.
+        root_edges: Arestas da raiz a percorrer (padrão: todas). Permite
+            dividir a busca por subárvores da raiz.
+        bounds_of: Função estado -> (menor, maior) comprimento de sufixo que
+            completa uma palavra abaixo do estado. Se informada, ramos cujos
+            comprimentos não alcançam a consulta dentro de max_k são podados.
+
+    Gera os pares (palavra, distância) sob demanda, na ordem de visita.
+    """
+    columns = len(word) + 1
+    rows = [list(range(columns))] # rows[d]: linha da profundidade d
+    prefix = []                   # prefix[d - 1]: caractere da profundidade d
+    stack = [iter(edges_of(root) if root_edges is None else root_edges)]
+
+    while stack:
+        depth = len(stack)
+        for char, node in stack[-1]:
+            if depth == len(rows):
+                rows.append([0] * columns)
+                prefix.append(char)
+            else:
+                prefix[depth - 1] = char
+
+            # Lógica de Programação Dinâmica para Levenshtein
+            row_min = _advance_row(rows[depth - 1], rows[depth], word, char, depth)
+            distance = rows[depth][-1]
+
+            # Verifica se é estado final e se a distância é aceitável
+            if distance <= max_k and is_final(node):
+                yield ("".join(prefix[:depth]), distance)
+
+            # Poda (Pruning): desce apenas se algum custo ainda cabe em max_k
+            if row_min <= max_k:
+                if bounds_of is not None:
+                    shortest, longest = bounds_of(node)
+                    if _out_of_reach(shortest, longest, columns - 1, depth, max_k, max_k - row_min):
+                        continue
+                stack.append(iter(edges_of(node)))
+                break
+        else:
+            stack.pop()
+
+_DELTA_TABLES = None
+
+def _delta_tables():
+    """
+    Tabelas de 8 bits para o mínimo da coluna no modo bit-paralelo.
+    Índice (VP << 8) | VN de um bloco de 8 deltas verticais:
+      sums[i]: soma dos deltas do bloco;
+      minimum[i]: menor soma de prefixo do bloco (incluindo o vazio).
+    """
+    global _DELTA_TABLES
+    if _DELTA_TABLES is None:
+        sums = [0] * 65536
+        minimum = [0] * 65536
+        for index in range(65536):
+            positive, negative = index >> 8, index & 0xFF
+            total = low = 0
+            for bit in range(8):
+                total += (positive >> bit & 1) - (negative >> bit & 1)
+                if total < low:
+                    low = total
+            sums[index] = total
+            minimum[index] = low
+        _DELTA_TABLES = (sums, minimum)
+    return _DELTA_TABLES
+
+def levenshtein_search_bitparallel(root, edges_of, is_final, word: str, max_k: int, root_edges=None, bounds_of=None):
+    """
+    Mesma busca de levenshtein_search(), com a linha codificada em bits
+    (Myers/Hyyrö): cada coluna vira os vetores de deltas verticais VP/VN e
+    a distância da última posição. Avançar uma aresta custa poucas operações
+    inteiras, independente do tamanho da consulta.
+
+    Exige 1 <= len(word) <= WORD_SIZE. bounds_of é aceito pela assinatura
+    comum, mas ignorado: sem o mínimo da linha a poda por comprimento quase
+    não corta e custa mais do que economiza (benchmarks/length_bounds.py).
+    """
+    m = len(word)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+
+    peq = _match_masks(word)
+    sums, minimum = _delta_tables()
+    vp_rows, vn_rows, scores = [mask], [0], [m] # Profundidade 0: D[i][0] = i
+    prefix = []
+    stack = [iter(edges_of(root) if root_edges is None else root_edges)]
+
+    while stack:
+        depth = len(stack)
+        for char, node in stack[-1]:
+            if depth == len(scores):
+                vp_rows.append(0)
+                vn_rows.append(0)
+                scores.append(0)
+                prefix.append(char)
+            else:
+                prefix[depth - 1] = char
+
+            vp = vp_rows[depth - 1]
+            vn = vn_rows[depth - 1]
+            score = scores[depth - 1]
+
+            eq = peq.get(char, 0)
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            hp = vn | ~(xh | vp)
+            hn = vp & xh
+            if hp & high:
+                score += 1
+            elif hn & high:
+                score -= 1
+            # Distância global: D[0][j] = j, então entra um delta +1 no topo
+            hp = ((hp << 1) | 1) & mask
+            hn = (hn << 1) & mask
+            vp = (hn | ~(xv | hp)) & mask
+            vn = hp & xv
+
+            vp_rows[depth] = vp
+            vn_rows[depth] = vn
+            scores[depth] = score
+
+            if score <= max_k and is_final(node):
+                yield ("".join(prefix[:depth]), score)
+
+            # Poda: o mínimo da coluna só é calculado se a última célula não basta
+            alive = score <= max_k
+            if not alive:
+                running = depth
+                alive = running <= max_k
+                while not alive and (vp or vn):
+                    index = ((vp & 0xFF) << 8) | (vn & 0xFF)
+                    alive = running + minimum[index] <= max_k
+                    running += sums[index]
+                    vp >>= 8
+                    vn >>= 8
+
+            if alive:
+                stack.append(iter(edges_of(node)))
+                break
+        else:
+            stack.pop()
+
+class AutomatonSearchMixin(WordRankingMixin):
+    """
+    Busca de Levenshtein compartilhada por Trie, DAWG e a forma compilada.
+    As classes concretas só informam como navegar no próprio grafo. A
+    numeração das palavras e a ordenação por frequência vêm de ranking.py.
+    """
+    __slots__ = ()
+
+    # Índice de q-gramas opcional (build_qgram_index), usado só com search(..., row_engine='qgram')
+    qgram_index = None
+
+    # Índice sem acentos opcional (build_folded_index), usado por search_folded()
+    folded_index = None
+
+    # Callback opcional que recebe o SearchStats de cada search() (ex.: exportar métricas)
+    stats_hook = None
+
+    # Motores que guardam limites de comprimento por estado trocam por um
+    # método estado -> (menor, maior) comprimento de sufixo até um final.
+    _length_bounds = None
+
+    def _root_state(self):
+        raise NotImplementedError
+
+    def _edges(self, state):
+        """Iterável de (caractere, próximo estado)."""
+        raise NotImplementedError
+
+    def _is_final(self, state) -> bool:
+        raise NotImplementedError
+
+    def _step(self, state, char):
+        """Próximo estado pela aresta 'char', ou None se ela não existe."""
+        raise NotImplementedError
+
+    def _state_key(self, state):
+        """Chave que identifica um estado distinto (objetos: id; estados inteiros: o próprio número)."""
+        return id(state)
+
+    def _estimated_bytes(self, states) -> int:
+        """Memória estimada dos estados (tamanho profundo dos objetos de cada motor)."""
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        """
+        Estatísticas estruturais: estados, arestas, finais, palavras, tamanho
+        do alfabeto, distribuição de profundidade, estados da Trie equivalente
+        (e a razão de compressão) e bytes estimados. Ver structure.py.
+        """
+        return structure_stats(self)
+
+    def contains(self, word: str) -> bool:
+        """Pertinência exata: segue as arestas caractere a caractere, sem DP."""
+        state = self._root_state()
+        for char in word.lower():
+            state = self._step(state, char)
+            if state is None:
+                return False
+        return bool(self._is_final(state))
+
+    def __contains__(self, word: str) -> bool:
+        return self.contains(word)
+
+    def contains_many(self, words) -> list[bool]:
+        """contains() para uma lista de tokens; repetições são resolvidas uma vez."""
+        seen = {}
+        flags = []
+        for word in words:
+            found = seen.get(word)
+            if found is None:
+                found = seen[word] = self.contains(word)
+            flags.append(found)
+        return flags
+
+    def search(self, word: str, max_k: int, row_engine: str = 'auto', limit: int | None = None,
+               stats: SearchStats | None = None):
+        """
+        Retorna as palavras a até max_k edições de 'word', ordenadas pela distância.
+
+        Args:
+            limit: Quantidade máxima de resultados (top-N). A busca é feita
+                por aprofundamento iterativo (iter_search()) e para assim
+                que os N primeiros são conhecidos; é igual a search(...)[:N].
+            row_engine: 'classic' (linha de inteiros), 'bitparallel'
+                (Myers/Hyyrö), 'automaton' (autômato de Levenshtein
+                universal, k <= MAX_TABLE_K) ou 'auto', que escolhe o
+                autômato quando há tabelas para max_k e, senão, a linha
+                bit-paralela sempre que a consulta cabe em WORD_SIZE.
+                'qgram' filtra os candidatos pelo índice de q-gramas
+                (build_qgram_index()); 'auto' nunca o escolhe, porque
+                medido ele perde da travessia na grande maioria das
+                consultas (benchmarks/qgram_filter.py).
+            stats: SearchStats a preencher com os contadores da busca. Com
+                um stats_hook no motor, toda busca é medida e o hook recebe
+                as estatísticas. Sem nenhum dos dois, nada é contado.
+        """
+        if stats is None and self.stats_hook is None:
+            return self._search(word, max_k, row_engine, limit, None)
+
+        if stats is None:
+            stats = SearchStats()
+        stats.start(word, max_k)
+        results = self._search(word, max_k, row_engine, limit, stats)
+        stats.stop(results)
+        if self.stats_hook is not None:
+            self.stats_hook(stats)
+        return results
+
+    def _search(self, word: str, max_k: int, row_engine: str, limit: int | None, stats: SearchStats | None):
+        if row_engine == 'qgram':
+            if self.qgram_index is None:
+                raise ValueError("Índice de q-gramas não construído: chame build_qgram_index().")
+            if stats is not None:
+                stats.core = 'qgram'
+            results = self.qgram_index.search(word, max_k)
+            if self.weights is not None:
+                results = self._ranked(results)
+            return results if limit is None else results[:limit]
+
+        if limit is not None:
+            # Para no meio da distância que completa os N; as seguintes nem são percorridas
+            return list(islice(self.iter_search(word, max_k, row_engine, stats), limit))
+
+        word = word.lower()
+        core = self._instrumented(self._search_core(word, max_k, row_engine), word, stats)
+        results = core(self._root_state(), self._edges, self._is_final, word, max_k,
+                       bounds_of=self._length_bounds)
+        return self._ranked(results)
+
+    @staticmethod
+    def _instrumented(core, word: str, stats: SearchStats | None):
+        """O próprio núcleo, ou uma versão que conta o trabalho em 'stats'."""
+        if stats is None:
+            return core
+        stats.core = core.__name__
+        # Núcleos de autômato fazem uma consulta à tabela por estado; os de linha, len(word) células
+        cells_per_state = 1 if core.__name__.endswith('_automaton') else len(word)
+        return instrument(core, stats, cells_per_state)
+
+    def search_many(self, queries, max_k: int, row_engine: str = 'auto', limit: int | None = None):
+        """
+        search() para um lote de consultas, devolvendo as listas na ordem
+        de entrada. Com o autômato de Levenshtein (k <= MAX_TABLE_K) o grafo
+        é percorrido uma única vez para o lote inteiro; nos outros casos cada
+        consulta distinta faz a sua própria busca.
+
+        Com limit (top-N), cada consulta distinta usa o aprofundamento
+        iterativo de search(..., limit=N): para quem só mostra N sugestões,
+        parar cedo em cada palavra sai bem mais barato que a travessia
+        completa do lote com k grande.
+        """
+        words = [q.lower() for q in queries]
+        unique = list(dict.fromkeys(words))
+        core = None if row_engine == 'qgram' else self._search_core(unique[0] if unique else "", max_k, row_engine)
+
+        if limit is not None:
+            by_query = {q: self.search(q, max_k, row_engine, limit=limit) for q in unique}
+        elif core is levenshtein_search_automaton and self.stats_hook is None:
+            # Com stats_hook, cada consulta precisa da própria travessia medida (ramo abaixo)
+            found = [[] for _ in unique]
+            batch = levenshtein_search_many_automaton(self._root_state(), self._edges, self._is_final, unique, max_k)
+            for qi, word, distance in batch:
+                found[qi].append((word, distance))
+            by_query = {q: self._ranked(r) for q, r in zip(unique, found)}
+        else:
+            by_query = {q: self.search(q, max_k, row_engine) for q in unique}
+
+        return [list(by_query[w]) for w in words]
+
+    def search_partition(self, word: str, max_k: int, first_chars, row_engine: str = 'auto'):
+        """
+        search() restrita às subárvores da raiz cujas arestas estão em
+        first_chars. Concatenar as partições na ordem das arestas da raiz e
+        ordenar pela distância reproduz search().
+        """
+        word = word.lower()
+        core = self._search_core(word, max_k, row_engine)
+        root = self._root_state()
+        wanted = set(first_chars)
+        root_edges = [(label, state) for label, state in self._edges(root) if label[0] in wanted]
+        return list(core(root, self._edges, self._is_final, word, max_k, root_edges, self._length_bounds))
+
+    def iter_words(self):
+        """Todas as palavras do autômato, na ordem da travessia (DFS) das buscas."""
+        root = self._root_state()
+        if self._is_final(root):
+            yield ""
+
+        parts = []
+        stack = [iter(self._edges(root))]
+        while stack:
+            for label, state in stack[-1]:
+                parts.append(label)
+                if self._is_final(state):
+                    yield "".join(parts)
+                stack.append(iter(self._edges(state)))
+                break
+            else:
+                stack.pop()
+                if parts:
+                    parts.pop()
+
+    def build_qgram_index(self, q: int = 2):
+        """Indexa as palavras por q-gramas para search(..., row_engine='qgram') (ver qgram.py)."""
+        from .qgram import QGramIndex # Import local: qgram.py depende deste módulo
+        self.qgram_index = QGramIndex(self.iter_words(), q)
+        return self.qgram_index
+
+    def build_folded_index(self):
+        """Indexa as palavras pela forma sem acentos (ver folding.py)."""
+        from .folding import FoldedIndex # Import local: folding.py depende deste módulo
+        self.folded_index = FoldedIndex(self.iter_words())
+        return self.folded_index
+
+    def search_folded(self, word: str, max_k: int, accent_cost: float = 0.0, limit: int | None = None):
+        """
+        Busca que ignora acentos: 'acao' encontra 'ação' com k = 0, e o
+        orçamento k fica para os erros de verdade. accent_cost > 0 cobra uma
+        fração por edição de acento, e o custo total continua <= max_k. Exige build_folded_index(); com
+        frequências carregadas, empates saem da forma mais frequente.
+        """
+        if self.folded_index is None:
+            raise ValueError("Índice sem acentos não construído: chame build_folded_index().")
+        if self.weights is None:
+            return self.folded_index.search(word, max_k, accent_cost, limit)
+        results = self.folded_index.search(word, max_k, accent_cost)
+        results.sort(key=lambda x: (x[1], -self.frequency(x[0])))
+        return results if limit is None else results[:limit]
+
+    def iter_search(self, word: str, max_k: int, row_engine: str = 'auto', stats: SearchStats | None = None):
+        """
+        Versão preguiçosa de search(): gera (palavra, distância) em ordem não
+        decrescente de distância, na mesma ordem da lista de search().
+
+        Cada distância d é uma passada limitada a k = d (a de d = 0 é um
+        contains()), que só é executada se o chamador pedir mais resultados.
+        Passadas com k pequeno são muito mais baratas que a de max_k. Com
+        frequências carregadas, a passada de cada distância termina antes
+        do primeiro resultado dela, que saem da mais frequente para a menos.
+        """
+        word = word.lower()
+        self._search_core(word, max_k, row_engine) # Valida os parâmetros já na chamada
+        return self._iter_search(word, max_k, row_engine, stats)
+
+    def _iter_search(self, word: str, max_k: int, row_engine: str, stats: SearchStats | None):
+        if max_k >= 0 and self.contains(word):
+            yield (word, 0)
+
+        for k in range(1, max_k + 1):
+            core = self._instrumented(self._search_core(word, k, row_engine), word, stats)
+            level = (result for result in core(self._root_state(), self._edges, self._is_final, word, k,
+                                               bounds_of=self._length_bounds) if result[1] == k)
+            if self.weights is None:
+                yield from level
+            else:
+                yield from sorted(level, key=self._rank_key)
+
+    @staticmethod
+    def _search_core(word: str, max_k: int, row_engine: str):
+        """Escolhe a função de travessia para a consulta."""
+        if row_engine not in ROW_ENGINES:
+            raise ValueError(f"Motor de linha desconhecido: {row_engine}. Use {', '.join(ROW_ENGINES)}.")
+        if row_engine == 'qgram':
+            raise ValueError("O índice de q-gramas não é uma travessia: use search() ou search_many().")
+
+        if row_engine == 'automaton' and not 0 <= max_k <= MAX_TABLE_K:
+            raise ValueError(f"O autômato de Levenshtein suporta apenas 0 <= k <= {MAX_TABLE_K}.")
+        if row_engine in ('auto', 'automaton') and 0 <= max_k <= MAX_TABLE_K:
+            return levenshtein_search_automaton
+        if row_engine != 'classic' and 0 < len(word) <= WORD_SIZE:
+            return levenshtein_search_bitparallel
+        return levenshtein_search
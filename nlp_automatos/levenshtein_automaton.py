@@ -0,0 +1,226 @@
+"""
+Autômato de Levenshtein universal (Schulz & Mihov, 2002).
+
+Um estado do autômato determinístico de (consulta, k) é um conjunto de
+posições (i, e): "i caracteres da consulta consumidos com e erros". Esse
+conjunto só depende da consulta através do vetor característico do
+caractere lido em uma janela de 2k + 1 posições a partir do menor i (o
+deslocamento). Assim, as transições podem ser tabeladas uma única vez por
+k, para qualquer consulta (tabelas paramétricas), e a busca vira apenas:
+    (deslocamento, estado) --vetor característico--> (deslocamento', estado')
+"""
+from functools import lru_cache
+
+# Maior k com tabelas paramétricas (o slider do app vai de 0 a 3)
+MAX_TABLE_K = 3
+DEAD = -1
+
+def _step(positions, width, chi, k):
+    """Transições elementares (sem transposição) de todas as posições."""
+    reached = set()
+    for d, e in positions:
+        if d < width and chi >> d & 1:
+            reached.add((d + 1, e))         # casamento
+        if e < k:
+            reached.add((d, e + 1))         # inserção
+            if d < width:
+                reached.add((d + 1, e + 1)) # substituição
+            for j in range(1, k - e + 1):   # j remoções seguidas de casamento
+                if d + j < width and chi >> (d + j) & 1:
+                    reached.add((d + j + 1, e + j))
+    return reached
+
+def _reduce(positions):
+    """Remove posições subsumidas: (d, e) cobre (d', e') se e < e' e |d - d'| <= e' - e."""
+    return {(d2, e2) for d2, e2 in positions
+            if not any(e < e2 and abs(d2 - d) <= e2 - e for d, e in positions)}
+
+class ParametricTables:
+    """
+    Tabelas universais para um k fixo.
+      transitions[w][state * 2**w + chi] = (novo_estado << 4) | deslocamento,
+        ou DEAD, onde w = min(2k + 1, caracteres restantes da consulta);
+      accept_base[state] = min(e - d): a distância de uma palavra aceita no
+        deslocamento b é (n - b) + accept_base[state];
+      min_error[state], span[state]: menor e e maior d do estado, usados
+        na poda por comprimento (limites de comprimento dos nós).
+    """
+    __slots__ = ['k', 'window', 'states', 'transitions', 'accept_base', 'min_error', 'span']
+
+    def __init__(self, k: int):
+        self.k = k
+        self.window = 2 * k + 1
+        initial = ((0, 0),)
+        index = {initial: 0}
+        self.states = [initial]
+        raw = {}
+
+        # BFS sobre todos os estados alcançáveis, para todas as larguras de janela
+        for state_id, state in enumerate(self.states):
+            for width in range(self.window + 1):
+                # Estados com posições além do fim da consulta nunca ocorrem
+                if any(d > width for d, _ in state):
+                    continue
+                for chi in range(1 << width):
+                    reached = _reduce(_step(state, width, chi, k))
+                    if not reached:
+                        continue
+                    shift = min(d for d, _ in reached)
+                    key = tuple(sorted((d - shift, e) for d, e in reached))
+                    if key not in index:
+                        index[key] = len(self.states)
+                        self.states.append(key)
+                    raw[width, state_id, chi] = (index[key] << 4) | shift
+
+        self.transitions = []
+        for width in range(self.window + 1):
+            table = [DEAD] * (len(self.states) << width)
+            for state_id in range(len(self.states)):
+                base = state_id << width
+                for chi in range(1 << width):
+                    table[base + chi] = raw.get((width, state_id, chi), DEAD)
+            self.transitions.append(table)
+
+        self.accept_base = [min(e - d for d, e in state) for state in self.states]
+        self.min_error = [min(e for _, e in state) for state in self.states]
+        self.span = [max(d for d, _ in state) for state in self.states]
+
+@lru_cache(maxsize=None)
+def parametric_tables(k: int) -> ParametricTables:
+    """Tabelas de k (calculadas na primeira chamada e reutilizadas pelo processo)."""
+    if not 0 <= k <= MAX_TABLE_K:
+        raise ValueError(f"Tabelas paramétricas disponíveis apenas para 0 <= k <= {MAX_TABLE_K}.")
+    return ParametricTables(k)
+
+def _match_masks(word: str) -> dict:
+    """Máscara de ocorrências de cada caractere na consulta: bit i ligado se word[i] == caractere."""
+    peq = {}
+    for i, char in enumerate(word):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    return peq
+
+def _transition(transitions, window: int, peq: dict, n: int, offset: int, state: int, char: str) -> int:
+    """
+    Um passo do autômato de (consulta, k) pelo caractere 'char': o vetor
+    característico na janela a partir do deslocamento e a consulta à tabela.
+    Retorna (novo_estado << 4) | avanço do deslocamento, ou DEAD.
+    """
+    width = n - offset
+    if width > window:
+        width = window
+    chi = (peq.get(char, 0) >> offset) & ((1 << width) - 1)
+    return transitions[width][(state << width) | chi]
+
+def levenshtein_search_automaton(root, edges_of, is_final, word: str, max_k: int, root_edges=None, bounds_of=None):
+    """
+    Busca percorrendo o dicionário em paralelo com o autômato de Levenshtein
+    de (word, max_k). Cada aresta custa um vetor característico e uma
+    consulta à tabela; estados mortos podam o ramo imediatamente.
+
+    Com bounds_of, um ramo também é podado quando nenhum comprimento de
+    sufixo abaixo do nó consegue alcançar a parte restante da consulta
+    dentro do orçamento de erros que sobra no estado.
+    """
+    tables = parametric_tables(max_k)
+    transitions = tables.transitions
+    accept_base = tables.accept_base
+    min_error = tables.min_error
+    span = tables.span
+    window = tables.window
+    n = len(word)
+
+    peq = _match_masks(word)
+    offsets, states = [0], [0]
+    prefix = []
+    stack = [iter(edges_of(root) if root_edges is None else root_edges)]
+
+    while stack:
+        depth = len(stack)
+        for char, node in stack[-1]:
+            entry = _transition(transitions, window, peq, n, offsets[depth - 1], states[depth - 1], char)
+            if entry == DEAD:
+                continue
+
+            state = entry >> 4
+            offset = offsets[depth - 1] + (entry & 15)
+            if depth == len(states):
+                offsets.append(offset)
+                states.append(state)
+                prefix.append(char)
+            else:
+                offsets[depth] = offset
+                states[depth] = state
+                prefix[depth - 1] = char
+
+            distance = n - offset + accept_base[state]
+            if distance <= max_k and is_final(node):
+                yield ("".join(prefix[:depth]), distance)
+
+            if bounds_of is not None:
+                # Faltam n - offset - d caracteres da consulta em cada posição (d, e)
+                shortest, longest = bounds_of(node)
+                rest = n - offset
+                budget = max_k - min_error[state]
+                if shortest > rest + budget or longest < rest - span[state] - budget:
+                    continue
+
+            stack.append(iter(edges_of(node)))
+            break
+        else:
+            stack.pop()
+
+def levenshtein_search_many_automaton(root, edges_of, is_final, words: list[str], max_k: int):
+    """
+    Várias consultas em uma única travessia do dicionário.
+
+    Cada profundidade guarda a lista de consultas ainda vivas com o seu
+    (deslocamento, estado) no autômato de Levenshtein; uma consulta sai da
+    lista quando chega a um estado morto e o ramo é podado quando nenhuma
+    sobra. Prefixos comuns perto da raiz são pagos uma vez por lote.
+
+    Gera triplas (índice da consulta, palavra, distância) na ordem de visita.
+    """
+    tables = parametric_tables(max_k)
+    transitions = tables.transitions
+    accept_base = tables.accept_base
+    window = tables.window
+
+    lengths = [len(word) for word in words]
+    peqs = [_match_masks(word) for word in words]
+
+    # alive[d]: [(consulta, deslocamento, estado), ...] na profundidade d
+    alive = [[(qi, 0, 0) for qi in range(len(words))]]
+    prefix = []
+    stack = [iter(edges_of(root))]
+
+    while stack:
+        depth = len(stack)
+        for char, node in stack[-1]:
+            survivors = []
+            for qi, offset, state in alive[depth - 1]:
+                entry = _transition(transitions, window, peqs[qi], lengths[qi], offset, state, char)
+                if entry != DEAD:
+                    survivors.append((qi, offset + (entry & 15), entry >> 4))
+            if not survivors:
+                continue
+
+            if depth == len(alive):
+                alive.append(survivors)
+                prefix.append(char)
+            else:
+                alive[depth] = survivors
+                prefix[depth - 1] = char
+
+            if is_final(node):
+                word = None
+                for qi, offset, state in survivors:
+                    distance = lengths[qi] - offset + accept_base[state]
+                    if distance <= max_k:
+                        if word is None:
+                            word = "".join(prefix[:depth])
+                        yield (qi, word, distance)
+
+            stack.append(iter(edges_of(node)))
+            break
+        else:
+            stack.pop()
@@ -1,36 +1,125 @@
 from pathlib import Path
 from .trie import Trie
 from .dawg import DAWG
+from .radix_trie import RadixTrie
+from .symspell import SymSpell
 from .downloader import download_dictionary
+from .storage import load_automaton, save_automaton
+from .cache import CachedEngine
+from .parallel import ParallelSearcher
 
 # Armazena as instâncias carregadas na memória RAM
 _ENGINES = {
     'trie': None,
-    'dawg': None
+    'dawg': None,
+    'radix': None,
+    'symspell': None
 }
 
+# Classe de cada motor
+_ENGINE_CLASSES = {
+    'trie': Trie,
+    'dawg': DAWG,
+    'radix': RadixTrie,
+    'symspell': SymSpell
+}
+
+# Caches de consultas (opcionais), um por motor
+_QUERY_CACHES = {}
+
+# Pools de busca paralela, um por motor
+_PARALLEL = {}
+
 # Configurações Padrão
 DEFAULT_URL = "https://www.ime.usp.br/~pf/dicios/br-utf8.txt"
 DEFAULT_FILENAME = "dicionario_pt.txt"
 
-def get_engine(algorithm_type: str, data_dir: str = "data"):
+def get_engine(algorithm_type: str, data_dir: str = "data", use_cache: bool = True,
+               cache_entries: int = 0, cache_bytes: int | None = None, qgram: int = 0,
+               frequencies: str | Path | None = None, fold_accents: bool = False,
+               max_k: int | None = None):
     """
     Factory que retorna a instância única do motor solicitado.
     Gerencia download e carregamento automático.
     
     Args:
-        algorithm_type: 'trie' ou 'dawg'
+        algorithm_type: 'trie', 'dawg', 'radix' ou 'symspell'
         data_dir: Pasta onde salvar o dicionário
+        use_cache: Usa o autômato compilado em disco (mmap), gravando-o
+            na primeira execução. O cache é refeito se o dicionário mudar.
+        cache_entries: Se > 0, devolve o motor atrás de um cache LRU de
+            consultas (CachedEngine) com até esse número de entradas.
+        cache_bytes: Orçamento opcional de memória do cache de consultas.
+        qgram: Se > 0, constrói um índice de q-gramas (q = qgram), usado
+            por search(..., row_engine='qgram').
+        frequencies: Arquivo 'palavra contagem' opcional (DAWG/Trie
+            compiladas); os resultados passam a ser ordenados por
+            (distância, -frequência).
+        fold_accents: Constrói o índice sem acentos usado por
+            search_folded() ('acao' -> 'ação' com k = 0).
+        max_k: Maior k que o motor precisa atender. Só o SymSpell depende
+            dele (índice de remoções, padrão 2); se o já carregado foi
+            construído para um k menor, ele é refeito.
     """
     algo = algorithm_type.lower()
     
     if algo not in _ENGINES:
-        raise ValueError(f"Algoritmo desconhecido: {algo}. Use 'trie' ou 'dawg'.")
+        raise ValueError(f"Algoritmo desconhecido: {algo}. Use {', '.join(repr(a) for a in _ENGINES)}.")
+
+    # Se já está na memória (e atende max_k), reaproveita
+    loaded = _ENGINES[algo]
+    if loaded is None or (max_k is not None and getattr(loaded, 'max_k', max_k) < max_k):
+        _ENGINES[algo] = _load_engine(algo, data_dir, use_cache, max_k)
 
-    # Se já está na memória, retorna
-    if _ENGINES[algo] is not None:
+    engine = _ENGINES[algo]
+    if qgram > 0 and hasattr(engine, 'build_qgram_index') and engine.qgram_index is None:
+        engine.build_qgram_index(qgram)
+        print(f"[Loader] Índice de {qgram}-gramas construído para {algo.upper()}.")
+
+    if fold_accents and hasattr(engine, 'build_folded_index') and engine.folded_index is None:
+        engine.build_folded_index()
+        print(f"[Loader] Índice sem acentos construído para {algo.upper()}.")
+
+    if frequencies is not None and hasattr(engine, 'load_frequencies') and engine.weights is None:
+        matched = engine.load_frequencies(Path(frequencies))
+        print(f"[Loader] Frequências carregadas para {algo.upper()}: {matched} palavras.")
+
+    if cache_entries <= 0:
         return _ENGINES[algo]
 
+    cached = _QUERY_CACHES.get(algo)
+    if cached is None or cached.engine is not _ENGINES[algo]:
+        cached = _QUERY_CACHES[algo] = CachedEngine(_ENGINES[algo], cache_entries, cache_bytes)
+    return cached
+
+def get_parallel_engine(algorithm_type: str, data_dir: str = "data",
+                        max_workers: int | None = None, min_parallel_k: int = 2):
+    """
+    Devolve um ParallelSearcher (um por motor) cujos processos abrem o
+    autômato compilado em disco. Garante antes, via get_engine(), que o
+    cache binário existe e está atualizado. Só motores compiláveis (com
+    compile()) têm esse cache.
+    """
+    algo = algorithm_type.lower()
+    compilable = [name for name, cls in _ENGINE_CLASSES.items() if hasattr(cls, 'compile')]
+    if algo not in compilable:
+        raise ValueError(f"Busca paralela exige um motor compilável: {algo}. "
+                         f"Use {', '.join(repr(a) for a in compilable)}.")
+    engine = get_engine(algo, data_dir)
+
+    if algo not in _PARALLEL:
+        file_path = Path(data_dir) / DEFAULT_FILENAME
+        _PARALLEL[algo] = ParallelSearcher(_binary_path(file_path, algo), algo, file_path,
+                                           max_workers, min_parallel_k)
+        # Mesma numeração de palavras: as frequências já carregadas valem para a mescla
+        _PARALLEL[algo].engine.weights = getattr(engine, 'weights', None)
+    return _PARALLEL[algo]
+
+def _binary_path(file_path: Path, algo: str) -> Path:
+    return file_path.with_suffix(f".{algo}.bin")
+
+def _load_engine(algo: str, data_dir: str, use_cache: bool, max_k: int | None = None):
+    """Baixa (se preciso) o dicionário e constrói ou abre o autômato."""
     # Processo de Inicialização 
     
     # Definir caminhos com pathlib
@@ -43,18 +132,34 @@ def get_engine(algorithm_type: str, data_dir: str = "data"):
     if not file_path:
         raise RuntimeError("Impossível inicializar engine: Falha no download do dicionário.")
 
+    # Tentar abrir o autômato já compilado (zero-copy via mmap).
+    # Só motores com compile() têm forma binária (Radix e SymSpell não são DFAs de caracteres).
+    engine_class = _ENGINE_CLASSES[algo]
+    use_cache = use_cache and hasattr(engine_class, 'compile')
+    cache_path = _binary_path(file_path, algo)
+    if use_cache:
+        engine = load_automaton(cache_path, algo, file_path)
+        if engine is not None:
+            print(f"[Loader] {algo.upper()} aberta do cache binário: {cache_path.name}")
+            return engine
+
     # Construir o Autômato
     print(f"[Loader] Construindo {algo.upper()} a partir do disco...")
     
-    if algo == 'trie':
-        engine = Trie()
-    else:
-        engine = DAWG()
-        
+    # O índice do SymSpell é construído para um k máximo fixo
+    engine = engine_class(max_k) if algo == 'symspell' and max_k is not None else engine_class()
     engine.load_from_file(file_path)
+
+    if use_cache:
+        try:
+            save_automaton(engine.compile(), cache_path, algo, file_path)
+            print(f"[Loader] Cache binário gravado em: {cache_path.name}")
+            mapped = load_automaton(cache_path, algo, file_path)
+            if mapped is not None:
+                engine = mapped
+        except OSError as e:
+            print(f"[Loader] Não foi possível gravar o cache binário: {e}")
     
-    # Salvar na memória global
-    _ENGINES[algo] = engine
     print(f"[Loader] {algo.upper()} carregada e pronta para uso!")
     
-    return _ENGINES[algo]
+    return engine
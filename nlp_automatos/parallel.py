@@ -0,0 +1,89 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from .storage import load_automaton
+
+# Motor de cada processo trabalhador (aberto uma vez, no initializer)
+_WORKER_ENGINE = None
+
+def _init_worker(engine_path, kind, source_path):
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = load_automaton(engine_path, kind, source_path)
+    if _WORKER_ENGINE is None:
+        raise RuntimeError(f"Cache binário inválido ou desatualizado: {engine_path}")
+
+def _search_partition(word, max_k, first_chars, row_engine):
+    return _WORKER_ENGINE.search_partition(word, max_k, first_chars, row_engine)
+
+class ParallelSearcher:
+    """
+    Busca de Levenshtein dividida pelas arestas da raiz e executada em um
+    ProcessPoolExecutor persistente.
+
+    Cada trabalhador abre o mesmo autômato compilado via mmap (storage.py),
+    então as páginas do arquivo são compartilhadas entre os processos e a
+    inicialização é quase instantânea. Consultas baratas (k < min_parallel_k)
+    ficam no processo atual, onde o custo de IPC não compensa.
+    """
+
+    def __init__(self, engine_path: str | Path, kind: str, source_path: str | Path,
+                 max_workers: int | None = None, min_parallel_k: int = 2):
+        self.engine = load_automaton(engine_path, kind, source_path)
+        if self.engine is None:
+            raise RuntimeError(f"Cache binário inválido ou desatualizado: {engine_path}")
+
+        self.min_parallel_k = min_parallel_k
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.root_chars = [char for char, _ in self.engine._edges(self.engine._root_state())]
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(str(engine_path), kind, str(source_path)),
+        )
+
+    def _partitions(self):
+        """
+        Uma tarefa por aresta da raiz: dezenas de tarefas de tamanhos
+        diferentes, que o pool distribui dinamicamente entre os processos.
+        """
+        return [(char,) for char in self.root_chars]
+
+    def search(self, word: str, max_k: int, row_engine: str = 'auto', limit: int | None = None,
+               stats=None):
+        """
+        Mesmo contrato de search() dos motores: as partições são mescladas e
+        ordenadas por _ranked() do motor (distância e, com frequências
+        carregadas via load_frequencies(), frequência decrescente), e limit
+        corta o resultado já ordenado. Com stats, a busca roda no próprio
+        processo, porque os contadores não atravessam processos.
+        """
+        if max_k < self.min_parallel_k or stats is not None:
+            return self.engine.search(word, max_k, row_engine, limit=limit, stats=stats)
+
+        futures = [self._pool.submit(_search_partition, word, max_k, chars, row_engine)
+                   for chars in self._partitions()]
+        results = []
+        for future in futures: # Ordem das arestas da raiz = ordem da busca sequencial
+            results.extend(future.result())
+        results = self.engine._ranked(results)
+        return results if limit is None else results[:limit]
+
+    def search_many(self, queries, max_k: int, row_engine: str = 'auto', limit: int | None = None):
+        """search() paralela para cada consulta distinta do lote, na ordem de entrada."""
+        words = [q.lower() for q in queries]
+        by_query = {q: self.search(q, max_k, row_engine, limit) for q in dict.fromkeys(words)}
+        return [list(by_query[w]) for w in words]
+
+    def __getattr__(self, name):
+        if name == 'engine':
+            raise AttributeError(name)
+        return getattr(self.engine, name)
+
+    def close(self):
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,180 @@
+import re
+from collections import OrderedDict
+
+# Mesma tokenização do editor do app: palavras e os trechos entre elas
+_TOKEN_RE = re.compile(r'\w+|[^\w]+', re.UNICODE)
+
+class Token:
+    """
+    Um token do texto de entrada.
+      known: palavra do dicionário, ou token ignorado (pontuação, números,
+        tokens curtos);
+      suggestions: (palavra, distância) para palavras desconhecidas, senão None;
+      correction: forma escolhida para o texto corrigido (None = mantém).
+    """
+    __slots__ = ['text', 'known', 'suggestions', 'correction']
+
+    def __init__(self, text: str, known: bool = True, suggestions=None, correction=None):
+        self.text = text
+        self.known = known
+        self.suggestions = suggestions
+        self.correction = correction
+
+    def __repr__(self):
+        return f"Token({self.text!r}, known={self.known}, correction={self.correction!r})"
+
+class CorrectedChunk:
+    """Trecho de saída: texto original, texto corrigido e os tokens anotados."""
+    __slots__ = ['text', 'corrected', 'tokens']
+
+    def __init__(self, text: str, corrected: str, tokens: list[Token]):
+        self.text = text
+        self.corrected = corrected
+        self.tokens = tokens
+
+    @property
+    def unknown(self) -> list[Token]:
+        return [t for t in self.tokens if not t.known]
+
+def _match_case(original: str, word: str) -> str:
+    """Aplica à sugestão a caixa do token original (CAIXA, Título ou minúsculas)."""
+    if original.isupper() and len(original) > 1:
+        return word.upper()
+    if original[:1].isupper():
+        return word[:1].upper() + word[1:]
+    return word
+
+def first_suggestion(token: str, suggestions):
+    """Escolha padrão: a primeira sugestão (menor distância), ou None se não houver."""
+    return suggestions[0][0] if suggestions else None
+
+class CorrectionPipeline:
+    """
+    Correção de texto em streaming sobre qualquer motor com contains_many()
+    e search_many() (Trie, DAWG, compilado, CachedEngine, SymSpell...).
+
+    run() recebe um iterável de trechos (linhas ou blocos de um arquivo) e
+    gera um CorrectedChunk por trecho, sob demanda e na ordem de entrada.
+    Com split_words=True (blocos brutos de tamanho fixo), uma palavra
+    cortada no fim de um bloco é adiada para o bloco seguinte; concatenar
+    os textos de saída continua reproduzindo a entrada.
+
+    Memória constante, independente do tamanho do corpus:
+      - window: palavras já resolvidas (conhecida ou sugestões), em LRU;
+        repetições dentro da janela não voltam ao motor;
+      - batch_size: palavras desconhecidas distintas acumuladas antes de uma
+        única chamada a search_many();
+      - max_pending: trechos retidos enquanto o lote não fecha.
+    limit (top-N) segue para search_many(): quem só mostra N sugestões não
+    paga a travessia completa com k grande.
+    Tokens curtos (< min_length) ou com caracteres não alfabéticos (números,
+    '_') são ignorados sem consultar o motor.
+    """
+
+    def __init__(self, engine, max_k: int = 1, window: int = 50_000, batch_size: int = 256,
+                 max_pending: int = 1024, min_length: int = 2, choose=first_suggestion,
+                 limit: int | None = None):
+        self.engine = engine
+        self.max_k = max_k
+        self.limit = limit
+        self.window = window
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.min_length = min_length
+        self.choose = choose
+        self._resolved = OrderedDict() # palavra (minúsculas) -> None (conhecida) ou sugestões
+        # Contadores para monitoramento
+        self.tokens = 0
+        self.lookups = 0
+        self.searches = 0
+        self.batches = 0
+
+    def _remember(self, key: str, suggestions):
+        self._resolved[key] = suggestions
+        if len(self._resolved) > self.window:
+            self._resolved.popitem(last=False)
+
+    def run(self, chunks, split_words: bool = False):
+        pending = []    # [(texto, tokens, chaves pendentes por token)]
+        waiting = {}    # palavras desconhecidas aguardando o lote -> None
+        carry = ""
+
+        for chunk in chunks:
+            text = carry + chunk
+            if split_words:
+                # Uma palavra no fim do bloco pode continuar no próximo
+                match = re.search(r'\w+\Z', text)
+                carry = match.group() if match else ""
+                text = text[:len(text) - len(carry)]
+            if text:
+                pending.append(self._annotate(text, waiting))
+            if len(waiting) >= self.batch_size or len(pending) >= self.max_pending:
+                yield from self._flush(pending, waiting)
+
+        if carry:
+            pending.append(self._annotate(carry, waiting))
+        yield from self._flush(pending, waiting)
+
+    def _annotate(self, text: str, waiting: dict):
+        """Tokeniza e resolve o que já é conhecido; o resto espera o lote."""
+        tokens = []
+        keys = []
+        to_check = {}
+        for piece in _TOKEN_RE.findall(text):
+            token = Token(piece)
+            key = None
+            if len(piece) >= self.min_length and piece.isalpha():
+                key = piece.lower()
+                if key in self._resolved:
+                    self._resolved.move_to_end(key)
+                    self._apply(token, self._resolved[key])
+                    key = None
+                elif key not in waiting:
+                    to_check[key] = None
+            tokens.append(token)
+            keys.append(key)
+        self.tokens += len(tokens)
+
+        if to_check:
+            self.lookups += len(to_check)
+            for key, found in zip(to_check, self.engine.contains_many(list(to_check))):
+                if found:
+                    self._remember(key, None)
+                else:
+                    waiting[key] = None
+        return text, tokens, keys
+
+    def _flush(self, pending: list, waiting: dict):
+        batch = {}
+        if waiting:
+            words = list(waiting)
+            self.searches += len(words)
+            self.batches += 1
+            batch = dict(zip(words, self.engine.search_many(words, self.max_k, limit=self.limit)))
+            for word, suggestions in batch.items():
+                self._remember(word, suggestions)
+            waiting.clear()
+
+        for text, tokens, keys in pending:
+            parts = []
+            for token, key in zip(tokens, keys):
+                if key is not None and key in batch: # Fora do lote: contains() encontrou
+                    self._apply(token, batch[key])
+                parts.append(token.text if token.correction is None else token.correction)
+            yield CorrectedChunk(text, "".join(parts), tokens)
+        pending.clear()
+
+    def _apply(self, token: Token, suggestions):
+        """Marca o token como desconhecido (se houver sugestões guardadas) e escolhe a correção."""
+        if suggestions is None:
+            return
+        token.known = False
+        token.suggestions = suggestions
+        choice = self.choose(token.text, suggestions)
+        if choice is not None:
+            token.correction = _match_case(token.text, choice)
+
+def correct_lines(engine, lines, max_k: int = 1, **options):
+    """Atalho: gera o texto corrigido de cada linha (uma saída por item, sem juntar linhas)."""
+    for chunk in CorrectionPipeline(engine, max_k, **options).run(lines):
+        yield chunk.corrected
@@ -0,0 +1,87 @@
+from array import array
+from collections import Counter
+from .levenshtein import edit_distance
+
+class QGramIndex:
+    """
+    Índice invertido de q-gramas (com bordas '#'/'$') sobre as palavras do
+    dicionário, usado como filtro de candidatos quando pedido
+    (search(..., row_engine='qgram')). Não é escolhido automaticamente: no
+    dicionário completo a soma das listas de postings de 2-gramas passa de
+    200 mil entradas por consulta, e a travessia bit-paralela ganha na
+    grande maioria dos casos, para qualquer k (benchmarks/qgram_filter.py).
+
+    Filtros aplicados antes da verificação exata:
+      - comprimento: |len(w) - len(consulta)| <= k;
+      - contagem: cada edição destrói no máximo q q-gramas, então w precisa
+        ter ao menos max(G(consulta), G(w)) - k*q q-gramas distintos em comum.
+
+    Armazenamento: listas de postings ordenadas em array('I') por q-grama,
+    palavras concatenadas em uma str + offsets e o número de q-gramas
+    distintos de cada palavra em array('H'). Os ids seguem a ordem em que as
+    palavras foram dadas, então (distância, id) reproduz a ordem de search().
+    """
+
+    def __init__(self, words, q: int = 2):
+        self.q = q
+        postings = {}
+        gram_counts = array('H')
+        offsets = array('I', [0])
+        chunks = []
+        for word_id, word in enumerate(words):
+            grams = self._grams(word)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array('I')
+                posting.append(word_id)
+            chunks.append(word)
+            offsets.append(offsets[-1] + len(word))
+
+        self.postings = postings
+        self.gram_counts = gram_counts
+        self.offsets = offsets
+        self.words = "".join(chunks)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def _grams(self, word: str) -> set[str]:
+        padded = "#" * (self.q - 1) + word + "$" * (self.q - 1)
+        return {padded[i:i + self.q] for i in range(len(padded) - self.q + 1)}
+
+    def _word(self, word_id: int) -> str:
+        return self.words[self.offsets[word_id]:self.offsets[word_id + 1]]
+
+    def candidates(self, word: str, max_k: int):
+        """Ids das palavras que passam nos filtros de comprimento e contagem."""
+        grams = self._grams(word)
+        if len(grams) - max_k * self.q < 1:
+            raise ValueError("Filtro de q-gramas inválido para esta consulta (k grande demais).")
+
+        shared = Counter()
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is not None:
+                shared.update(posting)
+
+        n = len(word)
+        offsets = self.offsets
+        gram_counts = self.gram_counts
+        for word_id, count in shared.items():
+            if abs(offsets[word_id + 1] - offsets[word_id] - n) > max_k:
+                continue
+            if count >= max(len(grams), gram_counts[word_id]) - max_k * self.q:
+                yield word_id
+
+    def search(self, word: str, max_k: int):
+        """Candidatos filtrados e verificados, ordenados por (distância, id)."""
+        word = word.lower()
+        found = []
+        for word_id in self.candidates(word, max_k):
+            distance = edit_distance(word, self._word(word_id), max_k)
+            if distance <= max_k:
+                found.append((distance, word_id))
+        found.sort()
+        return [(self._word(word_id), distance) for distance, word_id in found]
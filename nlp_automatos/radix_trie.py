@@ -0,0 +1,197 @@
+import sys
+from pathlib import Path
+from .levenshtein import AutomatonSearchMixin, _advance_row
+from .levenshtein_automaton import DEAD, _match_masks, _transition, levenshtein_search_automaton, parametric_tables
+
+class RadixNode:
+    """
+    Nó da Trie Radix (Patricia).
+    O rótulo da aresta que chega ao nó pode ter vários caracteres, então
+    caudas sem ramificação ("-mente", "-ização") viram um único nó.
+    """
+    __slots__ = ['label', 'children', 'is_word']
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.children = {} # primeiro caractere do rótulo -> nó
+        self.is_word = False
+
+def radix_search_classic(root, edges_of, is_final, word: str, max_k: int, root_edges=None, bounds_of=None):
+    """
+    Busca de Levenshtein sobre arestas com rótulos de vários caracteres.
+    Avança uma linha da matriz por caractere do rótulo (buffers por
+    profundidade), podando no meio do rótulo quando nenhum custo cabe em max_k.
+    Os nós Radix não guardam limites de comprimento: bounds_of é sempre None.
+    """
+    columns = len(word) + 1
+    rows = [list(range(columns))]
+    prefix = []
+    stack = [iter(edges_of(root) if root_edges is None else root_edges)]
+    stack_depths = [0] # profundidade (em caracteres) do nó de cada nível da pilha
+
+    while stack:
+        for label, node in stack[-1]:
+            depth = stack_depths[-1]
+            alive = True
+            for char in label:
+                depth += 1
+                if depth == len(rows):
+                    rows.append([0] * columns)
+                    prefix.append(char)
+                else:
+                    prefix[depth - 1] = char
+
+                if _advance_row(rows[depth - 1], rows[depth], word, char, depth) > max_k:
+                    alive = False
+                    break
+
+            if not alive:
+                continue
+
+            distance = rows[depth][-1]
+            if distance <= max_k and is_final(node):
+                yield ("".join(prefix[:depth]), distance)
+
+            stack.append(iter(edges_of(node)))
+            stack_depths.append(depth)
+            break
+        else:
+            stack.pop()
+            stack_depths.pop()
+
+def radix_search_automaton(root, edges_of, is_final, word: str, max_k: int, root_edges=None, bounds_of=None):
+    """
+    Mesma travessia de radix_search_classic(), andando no autômato de
+    Levenshtein universal: uma consulta à tabela por caractere do rótulo.
+    """
+    tables = parametric_tables(max_k)
+    transitions = tables.transitions
+    accept_base = tables.accept_base
+    window = tables.window
+    n = len(word)
+
+    peq = _match_masks(word)
+    offsets, states = [0], [0]
+    prefix = []
+    stack = [iter(edges_of(root) if root_edges is None else root_edges)]
+    stack_depths = [0]
+
+    while stack:
+        for label, node in stack[-1]:
+            depth = stack_depths[-1]
+            offset = offsets[depth]
+            state = states[depth]
+            for char in label:
+                entry = _transition(transitions, window, peq, n, offset, state, char)
+                if entry == DEAD:
+                    break
+                state = entry >> 4
+                offset += entry & 15
+                depth += 1
+                if depth == len(states):
+                    offsets.append(offset)
+                    states.append(state)
+                    prefix.append(char)
+                else:
+                    offsets[depth] = offset
+                    states[depth] = state
+                    prefix[depth - 1] = char
+            else:
+                distance = n - offset + accept_base[state]
+                if distance <= max_k and is_final(node):
+                    yield ("".join(prefix[:depth]), distance)
+
+                stack.append(iter(edges_of(node)))
+                stack_depths.append(depth)
+                break
+        else:
+            stack.pop()
+            stack_depths.pop()
+
+class RadixTrie(AutomatonSearchMixin):
+    """
+    Trie com compressão de caminhos (Radix/Patricia).
+    As arestas carregam rótulos de vários caracteres; a busca avança as
+    linhas de Levenshtein ao longo do rótulo sem nós intermediários.
+    """
+    def __init__(self):
+        self.root = RadixNode()
+
+    def insert(self, word: str):
+        node = self.root
+        rest = word
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                leaf = RadixNode(rest)
+                leaf.is_word = True
+                node.children[rest[0]] = leaf
+                return
+
+            # Tamanho do prefixo comum entre o rótulo e o restante da palavra
+            label = child.label
+            common = 1
+            limit = min(len(label), len(rest))
+            while common < limit and label[common] == rest[common]:
+                common += 1
+
+            # Divide a aresta no ponto de divergência
+            if common < len(label):
+                middle = RadixNode(label[:common])
+                child.label = label[common:]
+                middle.children[child.label[0]] = child
+                node.children[rest[0]] = middle
+                child = middle
+
+            node = child
+            rest = rest[common:]
+
+        node.is_word = True
+
+    def load_from_file(self, file_path: Path):
+        """Lê o arquivo linha por linha e popula o autômato."""
+        if not file_path.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+
+        count = 0
+        with file_path.open('r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                word = line.strip().lower()
+                if word:
+                    self.insert(word)
+                    count += 1
+        print(f"[Radix] Total de palavras indexadas: {count}")
+
+    def contains(self, word: str) -> bool:
+        word = word.lower()
+        node = self.root
+        i = 0
+        while i < len(word):
+            node = node.children.get(word[i])
+            if node is None or not word.startswith(node.label, i):
+                return False
+            i += len(node.label)
+        return node.is_word
+
+    # Navegação usada pela busca compartilhada: arestas com rótulos longos
+    def _root_state(self):
+        return self.root
+
+    def _edges(self, node):
+        for child in node.children.values():
+            yield child.label, child
+
+    def _is_final(self, node):
+        return node.is_word
+
+    def _estimated_bytes(self, nodes) -> int:
+        return sum(sys.getsizeof(node) + sys.getsizeof(node.children) + sys.getsizeof(node.label)
+                   for node in nodes)
+
+    @staticmethod
+    def _search_core(word: str, max_k: int, row_engine: str):
+        core = AutomatonSearchMixin._search_core(word, max_k, row_engine)
+        if core is levenshtein_search_automaton:
+            return radix_search_automaton
+        # Linha bit-paralela não implementada para rótulos longos: usa a clássica
+        return radix_search_classic
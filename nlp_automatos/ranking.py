@@ -0,0 +1,118 @@
+"""
+Numeração das palavras e ordenação por frequência dos autômatos de
+dicionário. Em um autômato acíclico cujos estados sabem quantas palavras
+aceitam (DAWG e forma compilada), a posição alfabética de uma palavra sai
+do próprio caminho dela (hash perfeito mínimo), e um vetor de frequências
+indexado por essa posição ordena os resultados da busca sem nenhum
+dicionário por palavra.
+"""
+from array import array
+from operator import itemgetter
+from pathlib import Path
+
+class WordRankingMixin:
+    """
+    word_index()/word_at() e frequências (load_frequencies()) sobre a mesma
+    navegação da busca (_root_state, _edges, _is_final); _ranked() é a
+    ordenação que search() aplica aos resultados.
+    """
+    __slots__ = ()
+
+    # Motores que contam as palavras aceitas a partir de cada estado (DAWG e
+    # forma compilada) trocam por um método estado -> contagem. Com ele, as
+    # palavras são numeradas pela ordem alfabética (word_index/word_at).
+    _word_count = None
+
+    # Frequências opcionais (load_frequencies), indexadas pelo número da palavra
+    weights = None
+
+    def _check_numbering(self):
+        if self._word_count is None:
+            raise ValueError(f"{type(self).__name__} não numera as palavras (use DAWG ou a forma compilada).")
+
+    def word_index(self, word: str) -> int | None:
+        """
+        Número da palavra (0 .. total - 1) na ordem alfabética do dicionário,
+        ou None se ela não existe. É um hash perfeito mínimo: em cada estado
+        do caminho soma as palavras que terminam ali e as das arestas com
+        rótulo menor, sem nenhuma tabela por palavra.
+        """
+        return self._word_index(word.lower())
+
+    def _word_index(self, word: str) -> int | None:
+        self._check_numbering()
+        state = self._root_state()
+        index = 0
+        for char in word:
+            if self._is_final(state):
+                index += 1
+            next_state = None
+            for label, child in self._edges(state):
+                if label < char:
+                    index += self._word_count(child)
+                elif label == char:
+                    next_state = child
+            if next_state is None:
+                return None
+            state = next_state
+        return index if self._is_final(state) else None
+
+    def word_at(self, index: int) -> str:
+        """Inverso de word_index(): a palavra de número 'index'."""
+        self._check_numbering()
+        state = self._root_state()
+        if not 0 <= index < self._word_count(state):
+            raise IndexError(f"Número de palavra fora do intervalo: {index}")
+        chars = []
+        while True:
+            if self._is_final(state):
+                if index == 0:
+                    return "".join(chars)
+                index -= 1
+            for label, child in sorted(self._edges(state), key=itemgetter(0)):
+                count = self._word_count(child)
+                if index < count:
+                    chars.append(label)
+                    state = child
+                    break
+                index -= count
+
+    def load_frequencies(self, file_path: Path) -> int:
+        """
+        Lê um arquivo de frequências ('palavra contagem' por linha) para um
+        vetor compacto (uint32) indexado por word_index(). A partir daí a
+        busca ordena por (distância, -frequência). Palavras fora do
+        dicionário e linhas mal formadas são ignoradas; as ausentes ficam
+        com frequência 0. Retorna quantas linhas foram aproveitadas.
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+
+        self._check_numbering()
+        weights = array('I', bytes(4 * self._word_count(self._root_state())))
+        matched = 0
+        with file_path.open('r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) != 2 or not parts[1].isdigit():
+                    continue
+                index = self.word_index(parts[0])
+                if index is not None:
+                    weights[index] = min(weights[index] + int(parts[1]), 0xFFFFFFFF)
+                    matched += 1
+        self.weights = weights
+        return matched
+
+    def frequency(self, word: str) -> int:
+        """Frequência carregada para a palavra (0 se ausente ou sem frequências)."""
+        index = self.word_index(word) if self.weights is not None else None
+        return 0 if index is None else self.weights[index]
+
+    def _rank_key(self, result):
+        return result[1], -self.weights[self._word_index(result[0])]
+
+    def _ranked(self, results):
+        """Ordena pela distância e, com frequências carregadas, pela frequência decrescente."""
+        if self.weights is None:
+            return sorted(results, key=itemgetter(1))
+        return sorted(results, key=self._rank_key)
@@ -0,0 +1,86 @@
+import time
+
+class SearchStats:
+    """
+    Contadores de uma busca, preenchidos só quando pedidos (search(stats=...)
+    ou um stats_hook no motor). Sem eles, a busca usa os núcleos originais,
+    sem nenhum contador no laço.
+      nodes_visited: estados alcançados (linha ou transição calculada);
+      dp_cells: células de DP calculadas (len(consulta) por estado nas linhas
+        clássica e bit-paralela; uma transição por estado nos autômatos);
+      pruned: estados visitados cujos filhos não foram explorados;
+      results: pares (palavra, distância) devolvidos;
+      max_depth: maior profundidade (em arestas) alcançada;
+      elapsed_ms: tempo total da busca;
+      cache_hit: resposta veio do cache de consultas (CachedEngine), sem
+        travessia: os contadores de trabalho ficam zerados.
+    """
+    __slots__ = ['word', 'max_k', 'core', 'nodes_visited', 'dp_cells', 'pruned',
+                 'results', 'max_depth', 'elapsed_ms', 'cache_hit', '_start']
+
+    def __init__(self):
+        self.word = ""
+        self.max_k = 0
+        self.core = None
+        self.nodes_visited = 0
+        self.dp_cells = 0
+        self.pruned = 0
+        self.results = 0
+        self.max_depth = 0
+        self.elapsed_ms = 0.0
+        self.cache_hit = False
+        self._start = 0.0
+
+    def start(self, word: str, max_k: int):
+        self.word = word
+        self.max_k = max_k
+        self._start = time.perf_counter()
+
+    def stop(self, results):
+        self.results = len(results)
+        self.elapsed_ms = (time.perf_counter() - self._start) * 1000
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__ if not name.startswith('_')}
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.as_dict().items())
+        return f"SearchStats({fields})"
+
+def instrument(core, stats: SearchStats, cells_per_state: int):
+    """
+    Envolve um núcleo de busca para contar o trabalho em 'stats'.
+
+    Os contadores ficam só nos iteradores de arestas entregues ao núcleo:
+    cada aresta produzida é um estado visitado, cada chamada a edges_of é
+    um estado expandido e o fim de um iterador marca a volta de um nível.
+    """
+    def traverse(root, edges_of, is_final, word, max_k, root_edges=None, bounds_of=None):
+        depth = 0
+        visited = expanded = 0
+
+        def counted(edges):
+            nonlocal depth, visited
+            depth += 1
+            for edge in edges:
+                visited += 1
+                if depth > stats.max_depth:
+                    stats.max_depth = depth
+                yield edge
+            depth -= 1
+
+        def counted_edges_of(state):
+            nonlocal expanded
+            expanded += 1
+            return counted(edges_of(state))
+
+        first = counted(edges_of(root) if root_edges is None else root_edges)
+        try:
+            yield from core(root, counted_edges_of, is_final, word, max_k, first, bounds_of)
+        finally:
+            # Também roda se o consumidor parar antes (limit)
+            stats.nodes_visited += visited
+            stats.dp_cells += visited * cells_per_state
+            stats.pruned += visited - expanded
+
+    return traverse
@@ -0,0 +1,338 @@
+"""
+Servidor HTTP/JSON de consultas (asyncio, só biblioteca padrão) na frente
+de loader.get_engine().
+
+Endpoints:
+    GET  /contains?word=casa
+    GET  /search?word=caza&k=1&limit=10
+    POST /batch      {"words": ["caza", "escloa"], "k": 1, "limit": 10}
+    GET  /metrics    profundidade da fila, lotes e percentis de latência
+
+Requisições simultâneas são reunidas em micro-lotes: o primeiro item de
+um lote abre uma janela curta (window_ms); ao fim dela, ou quando o lote
+chega a max_batch itens, as palavras vão juntas para contains_many() /
+search_many() (uma chamada por k e limit; com limit, a busca para nos N
+primeiros de cada palavra). Pela linha de comando, a busca roda em
+processos trabalhadores (--workers, padrão 1), então o laço de eventos
+continua aceitando conexões; com --workers 0 ela roda em uma thread do
+próprio processo e disputa o GIL com o laço de eventos.
+
+Uso (a partir da raiz do projeto):
+    python -m nlp_automatos.server --algo dawg --port 8080
+"""
+import argparse
+import asyncio
+import contextlib
+import functools
+import json
+import sys
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+from .batch import PERCENTILES, percentile
+from .loader import get_engine
+
+# Motor de cada processo trabalhador (carregado uma vez, no initializer)
+_WORKER_ENGINE = None
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+def _init_worker(algorithm_type, data_dir, max_k=None):
+    global _WORKER_ENGINE
+    with contextlib.redirect_stdout(sys.stderr):
+        _WORKER_ENGINE = get_engine(algorithm_type, data_dir, max_k=max_k)
+
+def _run_group(engine, op: str, words: list, k: int | None, limit: int | None):
+    """Executa um grupo do micro-lote; engine None = motor do processo trabalhador."""
+    if engine is None:
+        engine = _WORKER_ENGINE
+    if op == 'contains':
+        return engine.contains_many(words)
+    return engine.search_many(words, k, limit=limit)
+
+class MicroBatcher:
+    """
+    Fila de consultas individuais despachada em lotes. Cada item é
+    (operação, palavra, k, limit, future); no despacho, os itens são
+    agrupados por (operação, k, limit) e cada grupo vira uma única chamada
+    run_group(op, palavras, k, limit) no executor.
+    """
+
+    def __init__(self, executor, run_group, window_ms: float = 2.0, max_batch: int = 256):
+        self.executor = executor
+        self.run_group = run_group
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._pending = []
+        self._timer = None
+        self._tasks = set() # Referências fortes às tarefas em andamento
+        self.in_flight = 0
+        self.batches = 0
+        self.items = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending) + self.in_flight
+
+    def submit(self, op: str, word: str, k: int | None = None, limit: int | None = None) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((op, word, k, limit, future))
+        if len(self._pending) >= self.max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._dispatch)
+        return future
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        groups = defaultdict(list)
+        for op, word, k, limit, future in pending:
+            groups[op, k, limit].append((word, future))
+        self.batches += 1
+        self.items += len(pending)
+        for (op, k, limit), items in groups.items():
+            task = asyncio.get_running_loop().create_task(self._run(op, k, limit, items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, op, k, limit, items):
+        self.in_flight += len(items)
+        try:
+            answers = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.run_group, op, [word for word, _ in items], k, limit)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), answer in zip(items, answers):
+                if not future.done(): # O cliente pode ter desconectado
+                    future.set_result(answer)
+        finally:
+            self.in_flight -= len(items)
+
+class QueryServer:
+    """
+    Servidor HTTP/1.1 mínimo (keep-alive, Content-Length) sobre
+    asyncio.start_server. Com um ProcessPoolExecutor, as buscas rodam em
+    processos com o motor carregado (autômato compilado compartilhado via
+    mmap). Sem executor, rodam em uma thread do próprio processo: serve para
+    testes e cargas leves, mas a busca em Python puro segura o GIL e o laço
+    de eventos espera por ela.
+    """
+
+    # Caminho -> (método, handler)
+    ROUTES = {"/contains": ("GET", "_contains"), "/search": ("GET", "_search"),
+              "/batch": ("POST", "_batch"), "/metrics": ("GET", "_metrics")}
+
+    def __init__(self, engine, executor=None, window_ms: float = 2.0, max_batch: int = 256,
+                 max_k: int = 3, max_words: int = 1000, max_body: int = 1 << 20, history: int = 10_000):
+        self.engine = engine
+        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+        # Threads usam o motor deste servidor; processos, o carregado no initializer
+        bound = None if isinstance(self.executor, ProcessPoolExecutor) else engine
+        self.batcher = MicroBatcher(self.executor, functools.partial(_run_group, bound), window_ms, max_batch)
+        # Motores com k máximo próprio (SymSpell) limitam o k aceito
+        self.max_k = min(max_k, getattr(engine, 'max_k', max_k))
+        self.max_words = max_words
+        self.max_body = max_body
+        self.requests = 0
+        self.errors = 0
+        self.latencies = defaultdict(lambda: deque(maxlen=history)) # endpoint -> ms (janela recente)
+        self._server = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080):
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    # Protocolo HTTP
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    break # Linha de requisição inválida: encerra a conexão
+                method, target, version = parts
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                start = time.perf_counter()
+                path = urlsplit(target).path
+                body_read = False # Corpo não consumido: o resto da conexão está dessincronizado
+                try:
+                    length = int(headers.get("content-length", 0))
+                    if length > self.max_body:
+                        raise HTTPError(413, "Corpo da requisição grande demais.")
+                    body = await reader.readexactly(length) if length else b""
+                    body_read = True
+                    status, payload = 200, await self._route(method, target, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except ValueError as e:
+                    status, payload = 400, {"error": str(e)}
+                except Exception as e:
+                    status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+
+                self.requests += 1
+                if status != 200:
+                    self.errors += 1
+                self.latencies[path if path in self.ROUTES else "other"].append((time.perf_counter() - start) * 1000)
+
+                # HTTP/1.1 mantém a conexão por padrão; HTTP/1.0 só com "Connection: keep-alive"
+                connection = headers.get("connection", "").lower()
+                keep_alive = body_read and (connection == "keep-alive"
+                                            or (version == "HTTP/1.1" and connection != "close"))
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, target: str, body: bytes):
+        url = urlsplit(target)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        if url.path not in self.ROUTES:
+            raise HTTPError(404, f"Endpoint desconhecido: {url.path}")
+        expected, handler_name = self.ROUTES[url.path]
+        if method != expected:
+            raise HTTPError(405, f"{url.path} aceita apenas {expected}.")
+        if method == "POST":
+            try:
+                params = json.loads(body or b"{}")
+            except json.JSONDecodeError as e:
+                raise HTTPError(400, f"JSON inválido: {e}") from None
+            if not isinstance(params, dict):
+                raise HTTPError(400, "O corpo deve ser um objeto JSON.")
+        return await getattr(self, handler_name)(params)
+
+    # Validação de parâmetros
+
+    def _word(self, params) -> str:
+        word = params.get("word")
+        if not isinstance(word, str) or not word:
+            raise HTTPError(400, "Parâmetro 'word' ausente.")
+        return word
+
+    def _k(self, params) -> int:
+        k = int(params.get("k", 1))
+        if not 0 <= k <= self.max_k:
+            raise HTTPError(400, f"k deve estar entre 0 e {self.max_k}.")
+        return k
+
+    def _limit(self, params) -> int | None:
+        limit = params.get("limit")
+        return None if limit is None else max(0, int(limit))
+
+    # Endpoints
+
+    async def _contains(self, params):
+        word = self._word(params)
+        return {"word": word, "found": await self.batcher.submit('contains', word)}
+
+    async def _search(self, params):
+        word, k, limit = self._word(params), self._k(params), self._limit(params)
+        results = await self.batcher.submit('search', word, k, limit)
+        return {"word": word, "k": k, "results": results}
+
+    async def _batch(self, params):
+        words = params.get("words")
+        if not isinstance(words, list) or not all(isinstance(w, str) and w for w in words):
+            raise HTTPError(400, "'words' deve ser uma lista de palavras.")
+        if len(words) > self.max_words:
+            raise HTTPError(413, f"No máximo {self.max_words} palavras por lote.")
+        k, limit = self._k(params), self._limit(params)
+        answers = await asyncio.gather(*(self.batcher.submit('search', w, k, limit) for w in words))
+        return {"k": k, "results": [{"word": w, "results": r} for w, r in zip(words, answers)]}
+
+    async def _metrics(self, params):
+        latency = {}
+        for path, values in self.latencies.items():
+            ordered = sorted(values)
+            latency[path] = {"count": len(ordered),
+                             **{f"p{p}_ms": round(percentile(ordered, p), 4) for p in PERCENTILES}}
+        batcher = self.batcher
+        return {
+            "queue_depth": batcher.queue_depth,
+            "in_flight": batcher.in_flight,
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": batcher.batches,
+            "mean_batch_size": round(batcher.items / batcher.batches, 2) if batcher.batches else 0.0,
+            "latency": latency,
+        }
+
+async def _serve(args):
+    with contextlib.redirect_stdout(sys.stderr):
+        engine = get_engine(args.algo, args.data, max_k=args.max_k)
+    executor = None
+    if args.workers > 0:
+        executor = ProcessPoolExecutor(args.workers, initializer=_init_worker,
+                                       initargs=(args.algo, args.data, args.max_k))
+    server = QueryServer(engine, executor, args.window_ms, args.max_batch, args.max_k)
+    host, port = await server.start(args.host, args.port)
+    print(f"[Server] {args.algo.upper()} em http://{host}:{port} "
+          f"(janela {args.window_ms} ms, lote até {args.max_batch})", file=sys.stderr)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor HTTP/JSON de consultas com micro-lotes.")
+    parser.add_argument("--algo", default="dawg", help="motor (padrão: dawg)")
+    parser.add_argument("--data", default="data", help="pasta do dicionário")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--window-ms", type=float, default=2.0, help="janela do micro-lote")
+    parser.add_argument("--max-batch", type=int, default=256, help="itens que fecham o lote antes da janela")
+    parser.add_argument("--max-k", type=int, default=3, help="maior k aceito")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processos de busca (padrão: 1). 0 = uma thread no próprio processo: "
+                             "sem processos extras, mas as buscas (Python puro) disputam o GIL "
+                             "com o laço de eventos e atrasam a aceitação de conexões")
+    args = parser.parse_args()
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from .compiled import CompiledAutomaton
+
+# Formato binário (little-endian), versionado:
+#   cabeçalho | offsets (uint32) | targets (uint32) | labels (UTF-32-LE)
+#   | shortest (uint16) | longest (uint16) | finals (bitmap)
+# O cabeçalho guarda tamanho e mtime do dicionário de origem para invalidar o cache.
+MAGIC = b"NLPAUTO\0"
+FORMAT_VERSION = 3
+_HEADER = struct.Struct("<8sI16sQQII")
+_KIND_SIZE = 16
+
+def _source_signature(source_path: Path):
+    stat = source_path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+def save_automaton(compiled: CompiledAutomaton, path: str | Path, kind: str, source_path: str | Path):
+    """
+    Grava o autômato compilado em disco.
+    A escrita é feita em arquivo temporário + rename, para que outros
+    processos nunca vejam um arquivo pela metade.
+    """
+    path = Path(path)
+    stored_kind = kind.encode("ascii")
+    if len(stored_kind) > _KIND_SIZE:
+        raise ValueError(f"Tipo de motor com mais de {_KIND_SIZE} caracteres: {kind}")
+    size, mtime_ns = _source_signature(Path(source_path))
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, stored_kind.ljust(_KIND_SIZE, b"\0"),
+                          size, mtime_ns, compiled.num_states, compiled.num_edges)
+
+    offsets = array("I", compiled.offsets)
+    targets = array("I", compiled.targets)
+    shortest = array("H", compiled.shortest)
+    longest = array("H", compiled.longest)
+    if sys.byteorder != "little":
+        for table in (offsets, targets, shortest, longest):
+            table.byteswap()
+
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with tmp_path.open("wb") as f:
+        f.write(header)
+        f.write(offsets.tobytes())
+        f.write(targets.tobytes())
+        f.write(compiled.labels.encode("utf-32-le"))
+        f.write(shortest.tobytes())
+        f.write(longest.tobytes())
+        f.write(bytes(compiled.finals))
+    os.replace(tmp_path, path)
+    return path
+
+def load_automaton(path: str | Path, kind: str, source_path: str | Path):
+    """
+    Abre o autômato com mmap (somente leitura).
+    As tabelas de inteiros apontam direto para as páginas do arquivo, que
+    são compartilhadas entre processos. Retorna None se o cache não existir,
+    for de outra versão/tipo ou estiver desatualizado em relação à origem.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, stored_kind, size, mtime_ns, num_states, num_edges = _HEADER.unpack_from(mm, 0)
+    if (magic != MAGIC or version != FORMAT_VERSION
+            or stored_kind.rstrip(b"\0").decode("ascii") != kind
+            or (size, mtime_ns) != _source_signature(Path(source_path))):
+        mm.close()
+        return None
+
+    view = memoryview(mm)
+    pos = _HEADER.size
+    offsets_end = pos + 4 * (num_states + 1)
+    targets_end = offsets_end + 4 * num_edges
+    labels_end = targets_end + 4 * num_edges
+    shortest_end = labels_end + 2 * num_states
+    longest_end = shortest_end + 2 * num_states
+    finals_end = longest_end + (num_states + 7) // 8
+    if len(mm) != finals_end:
+        view.release()
+        mm.close()
+        return None
+
+    if sys.byteorder == "little":
+        offsets = view[pos:offsets_end].cast("I")
+        targets = view[offsets_end:targets_end].cast("I")
+        shortest = view[labels_end:shortest_end].cast("H")
+        longest = view[shortest_end:longest_end].cast("H")
+    else:
+        # Sem zero-copy em máquinas big-endian
+        offsets = array("I", view[pos:offsets_end].tobytes())
+        targets = array("I", view[offsets_end:targets_end].tobytes())
+        shortest = array("H", view[labels_end:shortest_end].tobytes())
+        longest = array("H", view[shortest_end:longest_end].tobytes())
+        for table in (offsets, targets, shortest, longest):
+            table.byteswap()
+
+    # Os rótulos viram uma str compacta (1 byte por aresta no alfabeto latino)
+    labels = view[targets_end:labels_end].tobytes().decode("utf-32-le")
+    finals = view[longest_end:finals_end]
+    return CompiledAutomaton(offsets, labels, targets, finals, shortest, longest)
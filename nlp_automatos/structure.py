@@ -0,0 +1,125 @@
+"""
+Estatísticas estruturais de um autômato de dicionário (Trie, DAWG, Radix
+ou forma compilada): estados, arestas, finais, alfabeto, distribuição de
+profundidade, tamanho da Trie equivalente e memória estimada.
+
+Uso (a partir da raiz do projeto):
+    python -m nlp_automatos.structure [trie|dawg ...] [--file data/dicionario_pt.txt]
+"""
+import argparse
+from array import array
+from collections import deque
+from pathlib import Path
+
+def structure_stats(engine) -> dict:
+    """
+    Percorre o grafo uma vez em largura (sem recursão), numerando cada
+    estado distinto, e depois conta os caminhos em ordem topológica: o
+    número de caminhos até um estado é quantos nós da Trie equivalente ele
+    representa (1 na Trie, vários nos estados compartilhados do DAWG).
+
+    As arestas são guardadas em tabelas planas (CSR) durante a contagem,
+    para não criar uma lista por estado nos ~470 mil nós da Trie.
+    """
+    root = engine._root_state()
+    key = engine._state_key
+    index = {key(root): 0}
+    order = [root]
+    levels = array('I', [0])
+    indegree = array('I', [0])
+    offsets = array('I', [0])
+    targets = array('I')
+    label_lengths = array('I')
+    finals = array('B')
+    alphabet = set()
+
+    for state_id, state in enumerate(order): # BFS: 'order' cresce enquanto é percorrida
+        finals.append(1 if engine._is_final(state) else 0)
+        for label, child in engine._edges(state):
+            child_key = key(child)
+            child_id = index.get(child_key)
+            if child_id is None:
+                child_id = index[child_key] = len(order)
+                order.append(child)
+                levels.append(levels[state_id] + 1)
+                indegree.append(0)
+            indegree[child_id] += 1
+            targets.append(child_id)
+            label_lengths.append(len(label))
+            alphabet.update(label)
+        offsets.append(len(targets))
+
+    # Caminhos da raiz até cada estado, em ordem topológica (Kahn)
+    paths = [0] * len(order)
+    paths[0] = 1
+    trie_states = 1
+    pending = deque([0])
+    while pending:
+        state_id = pending.popleft()
+        for edge in range(offsets[state_id], offsets[state_id + 1]):
+            child_id = targets[edge]
+            paths[child_id] += paths[state_id]
+            # Um rótulo de L caracteres equivale a L nós da Trie (Radix)
+            trie_states += paths[state_id] * label_lengths[edge]
+            indegree[child_id] -= 1
+            if indegree[child_id] == 0:
+                pending.append(child_id)
+
+    depth_distribution = [0] * (max(levels) + 1)
+    for level in levels:
+        depth_distribution[level] += 1
+
+    return {
+        'states': len(order),
+        'edges': len(targets),
+        'finals': sum(finals),
+        'words': sum(count for count, final in zip(paths, finals) if final),
+        'alphabet_size': len(alphabet),
+        'depth_distribution': depth_distribution,
+        'trie_states': trie_states,
+        'compression_ratio': trie_states / len(order),
+        'estimated_bytes': engine._estimated_bytes(order),
+    }
+
+def format_stats(name: str, stats: dict) -> str:
+    """Relatório legível de structure_stats()."""
+    lines = [
+        f"[{name}] Estados: {stats['states']} | Arestas: {stats['edges']} | "
+        f"Finais: {stats['finals']} | Palavras: {stats['words']}",
+        f"[{name}] Alfabeto: {stats['alphabet_size']} símbolos | "
+        f"Trie equivalente: {stats['trie_states']} estados "
+        f"(compressão {stats['compression_ratio']:.2f}x)",
+        f"[{name}] Memória estimada: {stats['estimated_bytes'] / 2**20:.1f} MB",
+        f"[{name}] Estados por profundidade (BFS):",
+    ]
+    peak = max(stats['depth_distribution'])
+    for depth, count in enumerate(stats['depth_distribution']):
+        bar = "#" * max(1, round(40 * count / peak)) if count else ""
+        lines.append(f"  {depth:>3} {count:>8} {bar}")
+    return "\n".join(lines)
+
+def main():
+    # Imports locais: trie.py e dawg.py importam este módulo via levenshtein.py
+    from .dawg import DAWG
+    from .trie import Trie
+    engines = {'trie': Trie, 'dawg': DAWG}
+
+    parser = argparse.ArgumentParser(description="Estatísticas estruturais dos autômatos do dicionário.")
+    parser.add_argument("kinds", nargs="*", default=["trie", "dawg"], help="trie e/ou dawg (padrão: ambos)")
+    parser.add_argument("--file", type=Path, default=Path("data/dicionario_pt.txt"))
+    args = parser.parse_args()
+    unknown = set(args.kinds) - set(engines)
+    if unknown:
+        parser.error(f"Motor desconhecido: {', '.join(sorted(unknown))}. Use trie ou dawg.")
+
+    for kind in args.kinds:
+        engine = engines[kind]()
+        engine.load_from_file(args.file)
+        if kind == 'dawg':
+            engine.release_register() # Registro só é usado na construção
+        print(format_stats(kind.upper(), engine.stats()))
+        compiled = engine.compile()
+        print(f"[{kind.upper()}] Forma compilada (CSR): {compiled.nbytes() / 2**20:.1f} MB\n")
+
+if __name__ == "__main__":
+    main()
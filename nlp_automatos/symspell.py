@@ -0,0 +1,136 @@
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from .levenshtein import edit_distance
+from .search_stats import SearchStats
+
+# Cada entrada do índice é um uint64: hash da variante (40 bits) | id da palavra (24 bits)
+_ID_BITS = 24
+_HASH_MASK = (1 << 40) - 1
+
+def deletes(word: str, max_k: int) -> set[str]:
+    """Todas as variantes de 'word' com até max_k caracteres removidos (inclusive ela mesma)."""
+    variants = {word}
+    level = {word}
+    for _ in range(max_k):
+        level = {v[:i] + v[i + 1:] for v in level for i in range(len(v))}
+        variants |= level
+    return variants
+
+class SymSpell:
+    """
+    Índice de vizinhança por remoções (Symmetric Delete, estilo SymSpell).
+
+    Para cada palavra do dicionário, as variantes com até max_k remoções
+    (nos primeiros prefix_length caracteres) são indexadas. Na consulta, as
+    variantes da própria consulta são procuradas no índice e os candidatos
+    são verificados com a distância de Levenshtein exata. Custo quase
+    constante para k pequeno, em troca de construção e memória maiores.
+
+    Armazenamento compacto (sem dict de strings):
+      - index: array uint64 ordenado com hash(variante) | id da palavra;
+      - words: as palavras concatenadas em uma única str + offsets.
+    """
+
+    def __init__(self, max_k: int = 2, prefix_length: int = 7):
+        self.max_k = max_k
+        self.prefix_length = prefix_length
+        self.index = array('Q')
+        self.words = ""
+        self.offsets = array('I', [0])
+
+    @staticmethod
+    def _hash(variant: str) -> int:
+        return hash(variant) & _HASH_MASK
+
+    def build(self, words):
+        """Indexa as palavras (repetições são ignoradas)."""
+        unique = list(dict.fromkeys(words))
+        if len(unique) >= 1 << _ID_BITS:
+            raise ValueError(f"SymSpell suporta no máximo {(1 << _ID_BITS) - 1} palavras.")
+
+        self.words = "".join(unique)
+        self.offsets = array('I', [0])
+        entries = []
+        for word_id, word in enumerate(unique):
+            self.offsets.append(self.offsets[-1] + len(word))
+            for variant in deletes(word[:self.prefix_length], self.max_k):
+                entries.append((self._hash(variant) << _ID_BITS) | word_id)
+        entries.sort()
+        self.index = array('Q', entries)
+
+    def load_from_file(self, file_path: Path):
+        """Lê o arquivo e constrói o índice de remoções."""
+        if not file_path.exists():
+            raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+
+        with file_path.open('r', encoding='utf-8', errors='ignore') as f:
+            self.build(line.strip().lower() for line in f if line.strip())
+        print(f"[SymSpell] Total de palavras indexadas: {len(self)} | variantes: {len(self.index)}")
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def _word(self, word_id: int) -> str:
+        return self.words[self.offsets[word_id]:self.offsets[word_id + 1]]
+
+    def _postings(self, variant: str):
+        """Ids das palavras indexadas sob o hash da variante."""
+        key = self._hash(variant) << _ID_BITS
+        i = bisect_left(self.index, key)
+        while i < len(self.index) and self.index[i] >> _ID_BITS == key >> _ID_BITS:
+            yield self.index[i] & ((1 << _ID_BITS) - 1)
+            i += 1
+
+    def search(self, word: str, max_k: int, row_engine: str = 'auto', limit: int | None = None,
+               stats: SearchStats | None = None):
+        """
+        Mesmo contrato dos autômatos: (palavra, distância) ordenadas pela
+        distância. row_engine é aceito e ignorado (não há travessia de
+        autômato); stats recebe só a consulta, o tempo e os resultados.
+        """
+        if max_k > self.max_k:
+            raise ValueError(f"Índice SymSpell construído para k <= {self.max_k}.")
+        if stats is not None:
+            stats.start(word, max_k)
+            stats.core = 'symspell'
+        word = word.lower()
+
+        results = []
+        seen = set()
+        for variant in deletes(word[:self.prefix_length], max_k):
+            for word_id in self._postings(variant):
+                if word_id in seen:
+                    continue
+                seen.add(word_id)
+                candidate = self._word(word_id)
+                distance = edit_distance(word, candidate, max_k)
+                if distance <= max_k:
+                    results.append((candidate, distance))
+
+        results.sort(key=lambda x: (x[1], x[0]))
+        if limit is not None:
+            results = results[:limit]
+        if stats is not None:
+            stats.stop(results)
+        return results
+
+    def iter_search(self, word: str, max_k: int, row_engine: str = 'auto', stats: SearchStats | None = None):
+        """Os candidatos já saem verificados e ordenados: apenas itera sobre search()."""
+        return iter(self.search(word, max_k, stats=stats))
+
+    def search_many(self, queries, max_k: int, row_engine: str = 'auto', limit: int | None = None):
+        """Uma busca por consulta distinta, com as listas na ordem de entrada."""
+        words = [q.lower() for q in queries]
+        found = {w: self.search(w, max_k, limit=limit) for w in dict.fromkeys(words)}
+        return [list(found[w]) for w in words]
+
+    def contains(self, word: str) -> bool:
+        word = word.lower()
+        return any(self._word(word_id) == word for word_id in self._postings(word[:self.prefix_length]))
+
+    def __contains__(self, word: str) -> bool:
+        return self.contains(word)
+
+    def contains_many(self, words) -> list[bool]:
+        return [self.contains(w) for w in words]
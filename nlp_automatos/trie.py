@@ -1,17 +1,24 @@
+import sys
 from pathlib import Path
+from .compiled import CompiledAutomaton
+from .levenshtein import AutomatonSearchMixin
 
 class TrieNode:
     """
     Nó da Trie.
     Usa __slots__ para reduzir consumo de memória.
+    shortest/longest: menor e maior sufixo (em caracteres) que completa uma
+    palavra a partir do nó, mantidos a cada insert() para a poda da busca.
     """
-    __slots__ = ['children', 'is_word']
+    __slots__ = ['children', 'is_word', 'shortest', 'longest']
 
     def __init__(self):
         self.children = {}
         self.is_word = False
+        self.shortest = 0
+        self.longest = 0
 
-class Trie:
+class Trie(AutomatonSearchMixin):
     """
     Implementação de DFA de Prefixo otimizado para busca de Levenshtein.
     """
@@ -20,12 +27,22 @@ class Trie:
 
     def insert(self, word: str):
         node = self.root
+        remaining = len(word)
         for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
+            if remaining > node.longest:
+                node.longest = remaining
+            if remaining < node.shortest:
+                node.shortest = remaining
+            remaining -= 1
 
-        node.is_word = True 
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = TrieNode()
+                child.shortest = child.longest = remaining
+            node = child
+
+        node.is_word = True
+        node.shortest = 0
 
     def load_from_file(self, file_path: Path):
         """Lê o arquivo linha por linha e popula o autômato."""
@@ -41,35 +58,26 @@ class Trie:
                     count += 1
         print(f"[Trie] Total de palavras indexadas: {count}")
 
-    def search(self, word: str, max_k: int):
-        word = word.lower()
-        # Primeira linha da matriz de Levenshtein: 0, 1, 2...
-        current_row = range(len(word) + 1)
-        results = []
+    def compile(self) -> CompiledAutomaton:
+        """Congela a Trie em tabelas planas (CSR), sem fundir estados."""
+        return CompiledAutomaton.from_root(self.root, lambda node: node.children)
 
-        # Percorre o autômato recursivamente
-        for char, node in self.root.children.items():
-            self._search_recursive(node, char, word, current_row, results, max_k, char)
-        
-        return sorted(results, key=lambda x: x[1])
+    # Navegação usada pela busca compartilhada (AutomatonSearchMixin)
+    def _root_state(self):
+        return self.root
+
+    def _edges(self, node):
+        return node.children.items()
 
-    def _search_recursive(self, node, char, target_word, prev_row, results, max_k, current_word):
-        columns = len(target_word) + 1
-        current_row = [prev_row[0] + 1]
+    def _is_final(self, node):
+        return node.is_word
 
-        # Lógica de Programação Dinâmica para Levenshtein
-        for col in range(1, columns):
-            insert_cost = current_row[col - 1] + 1
-            delete_cost = prev_row[col] + 1
-            replace_cost = prev_row[col - 1] + (0 if target_word[col - 1] == char else 1)
-            
-            current_row.append(min(insert_cost, delete_cost, replace_cost))
+    def _step(self, node, char):
+        return node.children.get(char)
 
-        # Verifica se é estado final e se a distância é aceitável
-        if current_row[-1] <= max_k and node.is_word:
-            results.append((current_word, current_row[-1]))
+    def _estimated_bytes(self, nodes) -> int:
+        # Rótulos de um caractere são strings compartilhadas pelo interpretador
+        return sum(sys.getsizeof(node) + sys.getsizeof(node.children) for node in nodes)
 
-        # Poda (Pruning)
-        if min(current_row) <= max_k:
-            for next_char, next_node in node.children.items():
-                self._search_recursive(next_node, next_char, target_word, current_row, results, max_k, current_word + next_char)
+    def _length_bounds(self, node):
+        return node.shortest, node.longest
@@ -0,0 +1,53 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from nlp_automatos import loader
+from nlp_automatos.batch import correct_block, run_batch
+from nlp_automatos.trie import Trie
+
+WORDS = ["amar", "bar", "carro", "casa", "caso", "escola", "mar"]
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = Trie()
+        for w in WORDS:
+            self.trie.insert(w)
+
+    def test_correct_block_jsonl(self):
+        text, words, latencies = correct_block(self.trie, [(1, "Casa caza, 42"), (2, "caza")], (0, 1))
+        records = [json.loads(line) for line in text.splitlines()]
+        self.assertEqual(words, 3)
+        self.assertEqual([(r["line"], r["word"], r["known"]) for r in records],
+                         [(1, "Casa", True), (1, "caza", False), (2, "caza", False)])
+        self.assertEqual(records[1]["suggestions"], {"0": [], "1": [["casa", 1]]})
+        # 'caza' repetida no bloco é buscada uma única vez por k
+        self.assertEqual({k: len(v) for k, v in latencies.items()}, {0: 1, 1: 1})
+
+    def test_correct_block_tsv(self):
+        text, _, _ = correct_block(self.trie, [(7, "mar escloa")], (2,), limit=1, fmt='tsv')
+        self.assertEqual(text, "7\tmar\t1\t\t\n7\tescloa\t0\t2\tescola:2\n")
+
+    def test_run_batch_keeps_order(self):
+        """Blocos de uma linha, dois processos e um só bloco em voo: a saída segue a entrada."""
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / loader.DEFAULT_FILENAME).write_text("\n".join(WORDS) + "\n", encoding="utf-8")
+            lines = ["caza\n", "mar\n", "carrro\n", "\n", "bar casa\n"]
+            output = io.StringIO()
+            try:
+                report = run_batch(lines, output, 'radix', tmp, ks=(1,), workers=2,
+                                   block_lines=1, max_pending=1)
+            finally:
+                loader._ENGINES['radix'] = None
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([(r["line"], r["word"]) for r in records],
+                         [(1, "caza"), (2, "mar"), (3, "carrro"), (5, "bar"), (5, "casa")])
+        self.assertEqual(records[2]["suggestions"], {"1": [["carro", 1]]})
+        summary = report.summary()
+        self.assertEqual(summary["words"], 5)
+        self.assertEqual(summary["latency"]["k=1"]["searches"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
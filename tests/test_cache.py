@@ -0,0 +1,81 @@
+import threading
+import unittest
+from nlp_automatos.cache import CachedEngine
+from nlp_automatos.trie import Trie
+
+class CountingTrie(Trie):
+    """Trie que conta quantas buscas chegaram de fato ao autômato."""
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def search(self, word, max_k, **options):
+        self.calls += 1
+        return super().search(word, max_k, **options)
+
+class TestCachedEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = CountingTrie()
+        for w in ["casa", "caso", "causa", "cama", "carro", "escola"]:
+            self.trie.insert(w)
+        self.cached = CachedEngine(self.trie, max_entries=2)
+
+    def test_hit_and_miss_counters(self):
+        """Segunda consulta igual (mesmo após normalização) não toca o motor."""
+        first = self.cached.search("caza", 1)
+        second = self.cached.search("CAZA", 1)
+        self.assertEqual(first, second)
+        self.assertEqual(self.trie.calls, 1)
+        info = self.cached.cache_info()
+        self.assertEqual((info['hits'], info['misses']), (1, 1))
+
+    def test_smaller_k_is_filtered(self):
+        """Um resultado em k=2 responde k=1 e k=0 sem nova busca."""
+        expected = {k: self.trie.search("caza", k) for k in (0, 1)}
+        self.trie.calls = 0
+        self.cached.search("caza", 2)
+        for k in (1, 0):
+            self.assertEqual(self.cached.search("caza", k), expected[k])
+        self.assertEqual(self.trie.calls, 1)
+
+    def test_search_many_only_sends_misses(self):
+        """search_many pelo cache repassa ao motor apenas as consultas novas."""
+        self.cached.search("caza", 1)
+        self.assertEqual(self.cached.search_many(["caza", "escloa", "caza"], 1),
+                         [self.trie.search(q, 1) for q in ["caza", "escloa", "caza"]])
+        self.assertEqual(self.cached.cache_info()['hits'], 1)
+
+    def test_search_many_limit(self):
+        """limit segue para o motor e faz parte da chave: o top-N em lote reaproveita search(limit=N)."""
+        self.cached.search("caza", 2, limit=1)
+        self.assertEqual(self.cached.search_many(["caza"], 2, limit=1), [self.trie.search("caza", 2, limit=1)])
+        self.assertEqual(self.cached.cache_info()['hits'], 1)
+
+    def test_lru_eviction(self):
+        """Passando do limite, a entrada menos usada sai primeiro."""
+        self.cached.search("casa", 0)
+        self.cached.search("caso", 0)
+        self.cached.search("casa", 0) # 'casa' passa a ser a mais recente
+        self.cached.search("cama", 0)
+        self.assertEqual(self.cached.cache_info()['evictions'], 1)
+        calls = self.trie.calls
+        self.cached.search("casa", 0)
+        self.assertEqual(self.trie.calls, calls)
+        self.cached.search("caso", 0)
+        self.assertEqual(self.trie.calls, calls + 1)
+
+    def test_byte_budget_and_threads(self):
+        """Orçamento em bytes é respeitado sob acesso concorrente."""
+        cached = CachedEngine(self.trie, max_entries=1000, max_bytes=2000)
+        workers = [threading.Thread(target=lambda: [cached.search(w, 1) for w in ["casa", "cama", "escola", "carro"] * 20])
+                   for _ in range(4)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        self.assertLessEqual(cached.cache_info()['bytes'], 2000)
+        self.assertTrue(cached.contains("escola"))
+
+if __name__ == '__main__':
+    unittest.main()
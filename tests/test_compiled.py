@@ -0,0 +1,37 @@
+import unittest
+from nlp_automatos.dawg import DAWG
+from nlp_automatos.trie import Trie
+
+class TestCompiledAutomaton(unittest.TestCase):
+
+    def setUp(self):
+        """Monta o mesmo vocabulário em um DAWG e em uma Trie de referência."""
+        self.words = ["amar", "bar", "carro", "casa", "caso", "mar"]
+        self.dawg = DAWG()
+        self.trie = Trie()
+        for w in self.words:
+            self.dawg.insert(w)
+            self.trie.insert(w)
+        self.compiled = self.dawg.compile()
+
+    def test_structure_is_minimal(self):
+        """A forma compilada preserva os estados compartilhados do DAWG."""
+        self.assertLess(self.compiled.num_states, sum(len(w) for w in self.words) + 1)
+        self.assertFalse(self.compiled.is_final(0))
+
+    def test_search_matches_trie(self):
+        """Mesmos resultados da Trie para vários k."""
+        for query in ["casa", "cazo", "mar", "xyz"]:
+            for k in range(3):
+                self.assertEqual(sorted(self.compiled.search(query, k)),
+                                 sorted(self.trie.search(query, k)))
+
+    def test_contains(self):
+        """Pertinência exata com busca binária nos rótulos ordenados."""
+        for w in self.words:
+            self.assertIn(w, self.compiled)
+        self.assertEqual(self.compiled.contains_many(["am", "amar", "marr", ""]),
+                         [False, True, False, False])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
+import random
 import unittest
 from pathlib import Path
 from nlp_automatos.dawg import DAWG
+from nlp_automatos.trie import Trie
 
 class TestDAWG(unittest.TestCase):
     
@@ -34,5 +36,132 @@ class TestDAWG(unittest.TestCase):
         self.assertEqual(res[0][0], "zebra")
         self.assertEqual(res[0][1], 1)
 
+    def test_suffix_sharing(self):
+        """Sufixos iguais ('amar' e 'mar') apontam para o mesmo nó."""
+        dawg = DAWG()
+        for w in ["amar", "mar"]:
+            dawg.insert(w)
+        dawg.finish()
+        via_amar = dawg.root.edges["a"].edges["m"]
+        via_mar = dawg.root.edges["m"]
+        self.assertIs(via_amar, via_mar)
+        self.assertEqual(len(dawg.minimized_nodes), 4)
+
+    def test_structure_stats(self):
+        """stats(): a Trie equivalente do DAWG tem o tamanho da Trie de verdade."""
+        words = ["amar", "bar", "carro", "casa", "caso", "mar"]
+        dawg, trie = DAWG(), Trie()
+        for w in words:
+            dawg.insert(w)
+            trie.insert(w)
+        dawg.finish()
+
+        trie_stats, dawg_stats = trie.stats(), dawg.stats()
+        self.assertEqual(trie_stats['states'], 19)
+        self.assertEqual(trie_stats['edges'], 18)
+        self.assertEqual(trie_stats['depth_distribution'], [1, 4, 4, 5, 4, 1])
+        self.assertEqual(trie_stats['compression_ratio'], 1.0)
+        self.assertEqual(dawg_stats['trie_states'], trie_stats['states'])
+        self.assertEqual((dawg_stats['words'], dawg_stats['finals']), (6, 1))
+        self.assertEqual(dawg_stats['alphabet_size'], 7)
+        self.assertGreater(dawg_stats['compression_ratio'], 1.0)
+        self.assertEqual(dawg.compile().stats()['states'], dawg_stats['states'])
+
+    def test_incremental_add_remove(self):
+        """add()/remove() em ordem aleatória mantêm o grafo igual ao construído do zero."""
+        def fresh(words):
+            dawg = DAWG()
+            dawg.load_from_stream(sorted(words))
+            return dawg
+
+        rng = random.Random(7)
+        current = {"".join(rng.choice("abc") for _ in range(rng.randint(1, 6))) for _ in range(40)}
+        dawg = fresh(current)
+        dawg.release_register() # Registro descartado: refeito no primeiro add()
+        for _ in range(150):
+            word = "".join(rng.choice("abc") for _ in range(rng.randint(0, 6)))
+            if rng.random() < 0.5:
+                self.assertEqual(dawg.add(word), word not in current)
+                current.add(word)
+            else:
+                self.assertEqual(dawg.remove(word), word in current)
+                current.discard(word)
+            self.assertEqual(sorted(dawg.iter_words()), sorted(current))
+            self.assertEqual(dawg.stats()['states'], fresh(current).stats()['states'])
+
+        # Limites de comprimento continuam corretos após as atualizações
+        node = dawg.root.edges["a"]
+        below = [len(w) - 1 for w in current if w.startswith("a")]
+        self.assertEqual((node.shortest, node.longest), (min(below), max(below)))
+        self.assertEqual(sorted(dawg.search("ab", 1)), sorted(fresh(current).search("ab", 1)))
+
+        with self.assertRaises(ValueError):
+            dawg.insert("zzz")
+
+    def test_release_register(self):
+        """release_register() libera o registro; add() o refaz, inclusive depois de outras atualizações."""
+        dawg = DAWG()
+        dawg.load_from_stream(["amar", "bar", "mar"])
+        dawg.release_register()
+        self.assertEqual(dawg.minimized_nodes, {})
+        with self.assertRaises(ValueError):
+            dawg.insert("zar")
+        dawg.add("car")
+        dawg.release_register()
+        dawg.add("par")
+        expected = DAWG()
+        expected.load_from_stream(["amar", "bar", "car", "mar", "par"])
+        self.assertEqual(sorted(dawg.iter_words()), sorted(expected.iter_words()))
+        self.assertEqual(dawg.stats()['states'], expected.stats()['states'])
+
+    def test_word_numbering(self):
+        """word_index() é a posição alfabética da palavra, no DAWG e na forma compilada."""
+        words = sorted({"a", "amar", "bar", "carro", "casa", "caso", "mar", "marca"})
+        dawg = DAWG()
+        dawg.load_from_stream(words)
+        for engine in (dawg, dawg.compile()):
+            self.assertEqual([engine.word_index(w) for w in words], list(range(len(words))))
+            self.assertEqual([engine.word_at(i) for i in range(len(words))], words)
+            self.assertIsNone(engine.word_index("ca"))
+            self.assertIsNone(engine.word_index("zebra"))
+            with self.assertRaises(IndexError):
+                engine.word_at(len(words))
+        with self.assertRaises(ValueError):
+            Trie().word_index("casa")
+
+    def test_frequency_ranking(self):
+        """Com frequências, empates de distância saem da mais para a menos frequente."""
+        freq_file = Path("test_freq_dawg.txt")
+        freq_file.write_text("caso 50\ncasa 7\nCASA 3\ncava 90\nzzz 5\nmal formada\n", encoding="utf-8")
+        dawg = DAWG()
+        dawg.load_from_stream(["casa", "caso", "cava", "cavo", "coisa"])
+        try:
+            self.assertEqual(dawg.load_frequencies(freq_file), 4)
+        finally:
+            freq_file.unlink()
+        self.assertEqual(dawg.frequency("casa"), 10)
+        self.assertEqual(dawg.search("caza", 2), [("cava", 1), ("casa", 1), ("caso", 2), ("cavo", 2)])
+        self.assertEqual(dawg.search("caza", 2, limit=3), [("cava", 1), ("casa", 1), ("caso", 2)])
+        self.assertEqual(list(dawg.iter_search("caza", 2)), dawg.search("caza", 2))
+        self.assertEqual(dawg.search_many(["caza"], 1), [[("cava", 1), ("casa", 1)]])
+
+        # add()/remove() deslocam o vetor de pesos junto com a numeração
+        dawg.add("cama")
+        dawg.remove("caso")
+        self.assertEqual([dawg.frequency(w) for w in ("cama", "casa", "caso", "cava")], [0, 10, 0, 90])
+
+    def test_external_sort_load(self):
+        """Ordenação externa em blocos pequenos gera o mesmo grafo."""
+        dawg = DAWG()
+        dawg.load_from_file(self.test_file, chunk_size=1)
+        self.assertEqual(dawg.search("casa", 0), [("casa", 0)])
+        self.assertEqual(dawg.search("zebra", 0), [("zebra", 0)])
+
+    def test_presorted_rejects_unsorted_file(self):
+        """Streaming de arquivo 'já ordenado' valida a ordem."""
+        dawg = DAWG()
+        with self.assertRaises(ValueError):
+            dawg.load_from_file(self.test_file, presorted=True)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
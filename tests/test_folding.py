@@ -0,0 +1,54 @@
+import unittest
+from nlp_automatos.dawg import DAWG
+from nlp_automatos.folding import FoldedIndex, fold
+from nlp_automatos.trie import Trie
+
+WORDS = ["a", "aarão", "ação", "acaso", "cão", "coração", "esta", "está", "à"]
+
+class TestFoldedIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = Trie()
+        for w in WORDS:
+            self.trie.insert(w)
+        self.trie.build_folded_index()
+
+    def test_fold(self):
+        self.assertEqual(fold("Aarão"), "aarao")
+        self.assertEqual(fold("CORAÇÃO"), "coracao")
+        self.assertEqual(fold("à"), "a")
+
+    def test_index_layout(self):
+        index = FoldedIndex(WORDS)
+        self.assertEqual(len(index), 7) # 'a'/'à' e 'esta'/'está' dividem a chave
+        self.assertEqual(index.forms_of("esta"), ["esta", "está"])
+        self.assertEqual(index.forms_of("estas"), [])
+
+    def test_accents_are_free(self):
+        """Erros só de acento saem com k = 0, e o orçamento k fica para os erros reais."""
+        self.assertEqual(self.trie.search_folded("coracao", 0), [("coração", 0)])
+        self.assertEqual(self.trie.search("coracao", 1), [])
+        self.assertEqual(self.trie.search_folded("Acao", 0), [("ação", 0)])
+        self.assertEqual(self.trie.search_folded("corasao", 1), [("coração", 1)])
+        self.assertEqual(self.trie.search_folded("a", 0), [("a", 0), ("à", 0)])
+
+    def test_fractional_accent_cost(self):
+        """Com accent_cost, a forma que confere com os acentos digitados vem antes e o custo total fica <= k."""
+        self.assertEqual(self.trie.search_folded("está", 1, accent_cost=0.5), [("está", 0.0), ("esta", 0.5)])
+        self.assertEqual(self.trie.search_folded("está", 0, accent_cost=0.5), [("está", 0.0)])
+        self.assertEqual(self.trie.search_folded("acao", 0, accent_cost=0.5), [])
+        self.assertEqual(self.trie.search_folded("acao", 1, accent_cost=0.25), [("ação", 0.5), ("acaso", 1.0)])
+        self.assertEqual(self.trie.search_folded("cao", 1, accent_cost=0.5, limit=1), [("cão", 0.5)])
+
+    def test_requires_index_and_same_on_dawg(self):
+        with self.assertRaises(ValueError):
+            Trie().search_folded("acao", 0)
+        dawg = DAWG()
+        dawg.load_from_stream(sorted(WORDS))
+        compiled = dawg.compile()
+        compiled.build_folded_index()
+        for query in ("acao", "coracao", "esta", "aarao"):
+            self.assertEqual(compiled.search_folded(query, 1), self.trie.search_folded(query, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import random
+import unittest
+from nlp_automatos.dawg import DAWG
+from nlp_automatos.levenshtein_automaton import parametric_tables
+from nlp_automatos.trie import Trie
+
+def edit_distance(a, b):
+    """Levenshtein de referência (matriz completa)."""
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(cur[j - 1] + 1, prev[j] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+class TestLevenshteinSearch(unittest.TestCase):
+
+    def setUp(self):
+        """Vocabulário aleatório (semente fixa) em Trie e DAWG."""
+        rng = random.Random(42)
+        self.words = sorted({"".join(rng.choice("abcão") for _ in range(rng.randint(1, 8)))
+                             for _ in range(300)})
+        self.queries = ["".join(rng.choice("abcdão") for _ in range(rng.randint(0, 9)))
+                        for _ in range(40)]
+        self.trie = Trie()
+        self.dawg = DAWG()
+        for w in self.words:
+            self.trie.insert(w)
+            self.dawg.insert(w)
+        self.dawg.finish()
+
+    def expected(self, query, k):
+        return sorted((w, d) for w in self.words if (d := edit_distance(query, w)) <= k)
+
+    def test_matches_brute_force(self):
+        """Trie, DAWG e forma compilada concordam com a força bruta."""
+        compiled = self.dawg.compile()
+        for query in self.queries:
+            for k in range(4):
+                expected = self.expected(query, k)
+                for engine in (self.trie, self.dawg, compiled):
+                    self.assertEqual(sorted(engine.search(query, k)), expected)
+
+    def test_bitparallel_matches_classic(self):
+        """Diferencial: linha bit-paralela == linha clássica (mesma ordem)."""
+        for engine in (self.trie, self.dawg):
+            for query in self.queries:
+                for k in range(4):
+                    self.assertEqual(engine.search(query, k, row_engine='bitparallel'),
+                                     engine.search(query, k, row_engine='classic'))
+
+    def test_automaton_matches_classic(self):
+        """Diferencial: autômato de Levenshtein == linha clássica, k de 0 a 3."""
+        for engine in (self.trie, self.dawg, self.dawg.compile()):
+            for query in self.queries:
+                for k in range(4):
+                    self.assertEqual(engine.search(query, k, row_engine='automaton'),
+                                     engine.search(query, k, row_engine='classic'))
+
+    def test_length_bounds(self):
+        """Menor/maior sufixo de cada estado == força bruta sobre as palavras do estado."""
+        compiled = self.dawg.compile()
+        for engine in (self.trie, self.dawg, compiled):
+            pending = [(engine._root_state(), "")]
+            while pending:
+                state, prefix = pending.pop()
+                below = [len(w) - len(prefix) for w in self.words if w.startswith(prefix)]
+                if prefix:
+                    self.assertEqual(engine._length_bounds(state), (min(below), max(below)))
+                pending.extend((child, prefix + char) for char, child in engine._edges(state))
+
+    def test_length_bounds_prune(self):
+        """A poda por comprimento visita menos nós e não muda o resultado."""
+        for row_engine in ('classic', 'automaton'):
+            visits = []
+            for bounds_of in (None, self.trie._length_bounds):
+                seen = []
+                def edges_of(node):
+                    seen.append(node)
+                    return self.trie._edges(node)
+                core = self.trie._search_core("ab", 1, row_engine)
+                found = list(core(self.trie.root, edges_of, self.trie._is_final, "ab", 1, bounds_of=bounds_of))
+                visits.append((len(seen), found))
+            self.assertLess(visits[1][0], visits[0][0])
+            self.assertEqual(visits[1][1], visits[0][1])
+
+    def test_parametric_state_counts(self):
+        """Número de estados universais conhecido da literatura (sem transposição)."""
+        self.assertEqual(len(parametric_tables(1).states), 5)
+        self.assertEqual(len(parametric_tables(2).states), 30)
+        with self.assertRaises(ValueError):
+            self.trie.search("abc", 4, row_engine='automaton')
+
+    def test_iter_search_order_and_limit(self):
+        """Gerador em ordem não decrescente == search(); limit == search()[:N]."""
+        for query in self.queries[:10]:
+            for k in range(4):
+                full = self.dawg.search(query, k)
+                self.assertEqual(list(self.dawg.iter_search(query, k)), full)
+                self.assertEqual(self.trie.search(query, k, limit=3), self.trie.search(query, k)[:3])
+
+    def test_search_many_matches_search(self):
+        """Lote (com repetições) == uma busca por consulta, na ordem de entrada."""
+        batch = self.queries[:15] + [self.queries[0].upper()]
+        for engine in (self.trie, self.dawg.compile()):
+            for k in range(5):
+                self.assertEqual(engine.search_many(batch, k), [engine.search(q, k) for q in batch])
+        self.assertEqual(self.trie.search_many([], 2), [])
+
+    def test_search_many_limit(self):
+        """Top-N em lote == search(..., limit=N) por consulta."""
+        batch = self.queries[:10]
+        for engine in (self.trie, self.dawg.compile()):
+            for k in (1, 3):
+                self.assertEqual(engine.search_many(batch, k, limit=3), [engine.search(q, k, limit=3) for q in batch])
+
+    def test_long_query_falls_back_to_classic(self):
+        """Consultas maiores que WORD_SIZE usam a linha clássica."""
+        long_query = "ab" * 40
+        self.trie.insert(long_query[:-1])
+        self.assertEqual(self.trie.search(long_query, 1), [(long_query[:-1], 1)])
+        with self.assertRaises(ValueError):
+            self.trie.search("abc", 1, row_engine='simd')
+
+    def test_long_word_without_recursion_limit(self):
+        """Palavras mais longas que o limite de recursão não quebram a busca."""
+        trie = Trie()
+        long_word = "a" * 5000
+        trie.insert(long_word)
+        # Consulta curta com k grande: força a descida até a profundidade 5000
+        self.assertEqual(trie.search("a", 5000), [(long_word, 4999)])
+
+if __name__ == '__main__':
+    unittest.main()
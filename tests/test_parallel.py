@@ -0,0 +1,59 @@
+import unittest
+from pathlib import Path
+from nlp_automatos.dawg import DAWG
+from nlp_automatos.loader import get_parallel_engine
+from nlp_automatos.parallel import ParallelSearcher
+from nlp_automatos.storage import save_automaton
+
+class TestParallelSearcher(unittest.TestCase):
+
+    def setUp(self):
+        """Dicionário temporário compilado em disco para os trabalhadores."""
+        self.test_file = Path("test_dict_parallel.txt")
+        self.bin_file = Path("test_dict_parallel.dawg.bin")
+        with open(self.test_file, "w", encoding="utf-8") as f:
+            f.write("amar\nbar\ncarro\ncasa\ncaso\ncausa\nescola\nmar\nzebra\n")
+        self.dawg = DAWG()
+        self.dawg.load_from_file(self.test_file)
+        save_automaton(self.dawg.compile(), self.bin_file, "dawg", self.test_file)
+        self.searcher = ParallelSearcher(self.bin_file, "dawg", self.test_file, max_workers=2, min_parallel_k=1)
+
+    def tearDown(self):
+        self.searcher.close()
+        for path in (self.test_file, self.bin_file):
+            if path.exists():
+                path.unlink()
+
+    def test_same_results_as_sequential(self):
+        """Partições mescladas == busca sequencial (inclusive a ordem)."""
+        for query in ["caza", "escloa", "mar", "zzz"]:
+            for k in range(4):
+                self.assertEqual(self.searcher.search(query, k), self.dawg.search(query, k))
+
+    def test_limit_frequencies_and_batches(self):
+        """limit e frequências seguem a busca sequencial; search_many também é paralela."""
+        freq_file = Path("test_freq_parallel.txt")
+        freq_file.write_text("caso 50\ncausa 90\n", encoding="utf-8")
+        try:
+            self.searcher.load_frequencies(freq_file)
+            self.dawg.load_frequencies(freq_file)
+        finally:
+            freq_file.unlink()
+        for limit in (None, 1, 2):
+            self.assertEqual(self.searcher.search("casa", 2, limit=limit), self.dawg.search("casa", 2, limit=limit))
+        self.assertEqual(self.searcher.search_many(["casa", "mar", "casa"], 2, limit=2),
+                         self.dawg.search_many(["casa", "mar", "casa"], 2, limit=2))
+
+    def test_cheap_queries_stay_in_process(self):
+        """Abaixo do limiar, a busca roda no próprio processo."""
+        self.assertEqual(self.searcher.search("casa", 0), [("casa", 0)])
+        self.assertTrue(self.searcher.contains("zebra"))
+
+    def test_loader_rejects_engines_without_cache(self):
+        """Radix e SymSpell não têm autômato compilado: erro claro antes de carregar."""
+        for algo in ("radix", "symspell", "nada"):
+            with self.assertRaisesRegex(ValueError, "compilável"):
+                get_parallel_engine(algo, data_dir="pasta_inexistente")
+
+if __name__ == '__main__':
+    unittest.main()
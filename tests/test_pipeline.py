@@ -0,0 +1,72 @@
+import unittest
+from nlp_automatos.pipeline import CorrectionPipeline, correct_lines
+from nlp_automatos.trie import Trie
+
+class CountingTrie(Trie):
+    """Trie que registra as chamadas em lote feitas pelo pipeline."""
+
+    def __init__(self):
+        super().__init__()
+        self.contains_calls = []
+        self.search_calls = []
+
+    def contains_many(self, words):
+        self.contains_calls.append(list(words))
+        return super().contains_many(words)
+
+    def search_many(self, words, max_k, **options):
+        self.search_calls.append(list(words))
+        return super().search_many(words, max_k, **options)
+
+class TestCorrectionPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = CountingTrie()
+        for w in ["a", "casa", "de", "escola", "fica", "minha", "na", "perto"]:
+            self.trie.insert(w)
+
+    def test_round_trip_across_chunks(self):
+        """Palavras cortadas entre blocos são adiadas; a saída reproduz a entrada."""
+        text = "A escloa fica perto de minha caza, na casa 12."
+        chunks = [text[i:i + 5] for i in range(0, len(text), 5)]
+        output = list(CorrectionPipeline(self.trie, 2).run(chunks, split_words=True))
+        self.assertEqual("".join(c.text for c in output), text)
+        self.assertEqual("".join(c.corrected for c in output), "A escola fica perto de minha casa, na casa 12.")
+        self.assertEqual([t.text for c in output for t in c.unknown], ["escloa", "caza"])
+
+    def test_case_and_skipped_tokens(self):
+        """A correção herda a caixa; números e tokens curtos não vão ao motor."""
+        self.assertEqual(list(correct_lines(self.trie, ["Caza ESCLOA x 42\n"], 2)), ["Casa ESCOLA x 42\n"])
+        self.assertEqual(self.trie.contains_calls, [["caza", "escloa"]])
+
+    def test_lines_without_newline(self):
+        """Linhas de splitlines()/rstrip() são corrigidas uma a uma, sem se juntar."""
+        self.assertEqual(list(correct_lines(self.trie, ["caza", "escloa", "de"], 2)), ["casa", "escola", "de"])
+        lines = "minha caza\nfica perto".splitlines()
+        self.assertEqual(list(correct_lines(self.trie, lines, 1)), ["minha casa", "fica perto"])
+
+    def test_limit_is_passed_down(self):
+        pipeline = CorrectionPipeline(self.trie, 2, limit=1)
+        chunk, = pipeline.run(["caza"])
+        self.assertEqual(chunk.tokens[0].suggestions, [("casa", 1)])
+        self.assertEqual(chunk.tokens[0].suggestions, self.trie.search("caza", 2, limit=1))
+
+    def test_window_dedup_and_batching(self):
+        pipeline = CorrectionPipeline(self.trie, 2, batch_size=2)
+        lines = ["caza escloa\n", "caza de casa\n", "fika caza\n", "de pertu\n"]
+        corrected = [c.corrected for c in pipeline.run(lines)]
+        self.assertEqual(corrected, ["casa escola\n", "casa de casa\n", "fica casa\n", "de perto\n"])
+        # Cada palavra distinta vai ao motor uma única vez
+        self.assertEqual(pipeline.lookups, 6)
+        self.assertEqual(pipeline.searches, 4)
+        self.assertEqual(self.trie.search_calls, [["caza", "escloa"], ["fika", "pertu"]])
+
+    def test_window_eviction(self):
+        """Com a janela cheia, palavras antigas são consultadas de novo, sem mudar o resultado."""
+        pipeline = CorrectionPipeline(self.trie, 1, window=1, batch_size=1)
+        corrected = [c.corrected for c in pipeline.run(["caza ", "fika ", "caza."])]
+        self.assertEqual(corrected, ["casa ", "fica ", "casa."])
+        self.assertEqual(pipeline.searches, 3)
+
+if __name__ == '__main__':
+    unittest.main()
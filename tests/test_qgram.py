@@ -0,0 +1,60 @@
+import random
+import unittest
+from nlp_automatos.qgram import QGramIndex
+from nlp_automatos.search_stats import SearchStats
+from nlp_automatos.trie import Trie
+
+class TestQGramIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Vocabulário aleatório (semente fixa) com palavras longas o bastante para k grande."""
+        rng = random.Random(5)
+        self.words = ["".join(rng.choice("abcdeão") for _ in range(rng.randint(1, 22))) for _ in range(400)]
+        self.queries = [w[:3] + "x" + w[5:] for w in rng.sample(self.words, 30)]
+        self.queries += ["".join(rng.choice("abcdeão") for _ in range(rng.randint(12, 22))) for _ in range(20)]
+        self.trie = Trie()
+        for w in self.words:
+            self.trie.insert(w)
+
+    def test_iter_words(self):
+        self.assertEqual(sorted(self.trie.iter_words()), sorted(set(self.words)))
+
+    def test_filters_keep_every_result(self):
+        """Os filtros de comprimento e contagem nunca descartam uma resposta verdadeira."""
+        index = QGramIndex(self.trie.iter_words(), q=2)
+        for query in self.queries:
+            for k in range(7):
+                if len(index._grams(query)) - 2 * k < 1:
+                    continue
+                expected = sorted(self.trie.search(query, k, row_engine='classic'))
+                self.assertEqual(sorted(index.search(query, k)), expected)
+
+    def test_opt_in_index(self):
+        """'auto' nunca troca para o índice; row_engine='qgram' devolve a mesma lista de search()."""
+        compiled = self.trie.compile()
+        # Cada motor tem a sua ordem de arestas (a Trie segue a ordem de inserção)
+        index = QGramIndex([], q=2)
+        expected = {(q, k): (self.trie.search(q, k), compiled.search(q, k)) for q in self.queries for k in (4, 5)
+                    if len(index._grams(q)) - 2 * k >= 1} # Filtro de contagem válido
+        with self.assertRaises(ValueError):
+            self.trie.search(self.queries[0], 4, row_engine='qgram')
+        self.trie.build_qgram_index()
+        compiled.build_qgram_index()
+
+        stats = SearchStats()
+        self.trie.search(self.queries[0], 4, stats=stats)
+        self.assertNotEqual(stats.core, 'qgram')
+        for (query, k), (from_trie, from_compiled) in expected.items():
+            self.assertEqual(self.trie.search(query, k, row_engine='qgram'), from_trie)
+            self.assertEqual(compiled.search(query, k, row_engine='qgram'), from_compiled)
+            self.assertEqual(compiled.search(query, k, row_engine='qgram', limit=3), from_compiled[:3])
+        queries = [q for q, k in expected if k == 4][:3]
+        self.assertEqual(compiled.search_many(queries, 4, row_engine='qgram'), [expected[q, 4][1] for q in queries])
+
+    def test_invalid_threshold(self):
+        index = QGramIndex(["abc"], q=2)
+        with self.assertRaises(ValueError):
+            list(index.candidates("abc", 2))
+
+if __name__ == '__main__':
+    unittest.main()
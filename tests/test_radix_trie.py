@@ -0,0 +1,48 @@
+import random
+import unittest
+from pathlib import Path
+from nlp_automatos.radix_trie import RadixTrie
+from nlp_automatos.trie import Trie
+
+class TestRadixTrie(unittest.TestCase):
+
+    def setUp(self):
+        """Cria dicionário temporário com caudas longas sem ramificação."""
+        self.test_file = Path("test_dict_radix.txt")
+        with open(self.test_file, "w", encoding="utf-8") as f:
+            f.write("rapidamente\nrapidez\nrápido\ncasa\ncasamento\n")
+        self.radix = RadixTrie()
+        self.radix.load_from_file(self.test_file)
+
+    def tearDown(self):
+        if self.test_file.exists():
+            self.test_file.unlink()
+
+    def test_paths_are_compressed(self):
+        """Caudas sem ramificação viram uma única aresta."""
+        casa = self.radix.root.children["c"]
+        self.assertEqual(casa.label, "casa")
+        self.assertTrue(casa.is_word)
+        self.assertEqual(casa.children["m"].label, "mento")
+        self.assertTrue(self.radix.contains("rapidez"))
+        self.assertFalse(self.radix.contains("rapid"))
+        self.assertFalse(self.radix.contains("casamentos"))
+
+    def test_search_matches_trie(self):
+        """Mesmos resultados (e ordem) da Trie, nos dois núcleos de busca."""
+        rng = random.Random(7)
+        words = ["".join(rng.choice("abcão") for _ in range(rng.randint(1, 9))) for _ in range(300)]
+        trie = Trie()
+        radix = RadixTrie()
+        for w in words:
+            trie.insert(w)
+            radix.insert(w)
+        for _ in range(30):
+            query = "".join(rng.choice("abcdão") for _ in range(rng.randint(0, 9)))
+            for k in range(5):
+                expected = trie.search(query, k)
+                self.assertEqual(radix.search(query, k), expected)
+                self.assertEqual(radix.search(query, k, row_engine='classic'), expected)
+
+if __name__ == '__main__':
+    unittest.main()
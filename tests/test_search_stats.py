@@ -0,0 +1,70 @@
+import unittest
+from nlp_automatos.cache import CachedEngine
+from nlp_automatos.search_stats import SearchStats
+from nlp_automatos.trie import Trie
+
+class TestSearchStats(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ["amar", "bar", "carro", "casa", "caso", "mar"]
+        self.trie = Trie()
+        for w in self.words:
+            self.trie.insert(w)
+        self.num_nodes = len({w[:i] for w in self.words for i in range(1, len(w) + 1)})
+
+    def test_full_traversal(self):
+        """Com k maior que qualquer palavra nada é podado: todos os nós são visitados."""
+        stats = SearchStats()
+        results = self.trie.search("casa", 5, row_engine='classic', stats=stats)
+        self.assertEqual(results, self.trie.search("casa", 5, row_engine='classic'))
+        self.assertEqual(stats.nodes_visited, self.num_nodes)
+        self.assertEqual(stats.dp_cells, self.num_nodes * len("casa"))
+        self.assertEqual(stats.pruned, 0)
+        self.assertEqual(stats.max_depth, 5)
+        self.assertEqual(stats.results, len(self.words))
+        self.assertEqual(stats.core, 'levenshtein_search')
+
+    def test_pruning_counts(self):
+        stats = SearchStats()
+        results = self.trie.search("casa", 1, stats=stats)
+        self.assertEqual(results, [("casa", 0), ("caso", 1)])
+        self.assertEqual(stats.core, 'levenshtein_search_automaton')
+        self.assertEqual(stats.dp_cells, stats.nodes_visited)
+        self.assertGreater(stats.pruned, 0)
+        self.assertLess(stats.nodes_visited, self.num_nodes)
+        self.assertEqual(stats.as_dict()["results"], 2)
+
+    def test_hook_and_limit(self):
+        """O hook recebe as estatísticas de toda busca, inclusive o top-N."""
+        exported = []
+        self.trie.stats_hook = exported.append
+        self.assertEqual(self.trie.search("cas", 2, limit=2), [("casa", 1), ("caso", 1)])
+        self.trie.search("mar", 0)
+        self.assertEqual([(s.word, s.max_k, s.results) for s in exported], [("cas", 2, 2), ("mar", 0, 1)])
+
+    def test_cache_bypass(self):
+        """Um pedido de estatísticas não é respondido pelo cache."""
+        cached = CachedEngine(self.trie)
+        cached.search("casa", 1)
+        stats = SearchStats()
+        cached.search("casa", 1, stats=stats)
+        self.assertGreater(stats.nodes_visited, 0)
+        self.assertEqual(cached.cache_info()["hits"], 0)
+
+    def test_hook_through_cache(self):
+        """O hook posto no cache chega ao motor (faltas) e também recebe os acertos."""
+        exported = []
+        cached = CachedEngine(self.trie)
+        cached.stats_hook = exported.append
+        self.assertIs(self.trie.stats_hook, cached.stats_hook)
+        cached.search("casa", 1)
+        cached.search("mar", 0)
+        cached.search("CASA", 1)
+        cached.search_many(["mar", "bar"], 0)
+        self.assertEqual([(s.word, s.cache_hit) for s in exported],
+                         [("casa", False), ("mar", False), ("CASA", True), ("mar", True), ("bar", False)])
+        self.assertEqual(exported[2].results, 2)
+        self.assertEqual(exported[2].nodes_visited, 0)
+
+if __name__ == '__main__':
+    unittest.main()
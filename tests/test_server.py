@@ -0,0 +1,122 @@
+import asyncio
+import json
+import unittest
+from nlp_automatos.server import QueryServer
+from nlp_automatos.symspell import SymSpell
+from nlp_automatos.trie import Trie
+
+class RecordingTrie(Trie):
+    """Trie que registra o (k, limit) de cada search_many()."""
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def search_many(self, queries, max_k, row_engine='auto', limit=None):
+        self.calls.append((len(queries), max_k, limit))
+        return super().search_many(queries, max_k, row_engine, limit)
+
+class TestQueryServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.trie = RecordingTrie()
+        for w in ["amar", "bar", "carro", "casa", "caso", "escola", "mar"]:
+            self.trie.insert(w)
+        self.server = QueryServer(self.trie, window_ms=20)
+        self.host, self.port = await self.server.start("127.0.0.1", 0)
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def request(self, method, target, payload=None):
+        """Uma requisição por conexão (Connection: close)."""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        body = json.dumps(payload).encode() if payload is not None else b""
+        writer.write(f"{method} {target} HTTP/1.1\r\nConnection: close\r\n"
+                     f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+        response = await reader.read()
+        writer.close()
+        head, _, data = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(data)
+
+    async def test_endpoints(self):
+        self.assertEqual(await self.request("GET", "/contains?word=Casa"), (200, {"word": "Casa", "found": True}))
+        status, payload = await self.request("GET", "/search?word=caza&k=1")
+        self.assertEqual((status, payload["results"]), (200, [["casa", 1]]))
+        status, payload = await self.request("POST", "/batch", {"words": ["mar", "escloa"], "k": 2, "limit": 1})
+        self.assertEqual(payload["results"], [{"word": "mar", "results": [["mar", 0]]},
+                                              {"word": "escloa", "results": [["escola", 2]]}])
+
+    async def test_errors(self):
+        self.assertEqual((await self.request("GET", "/search?word=caza&k=9"))[0], 400)
+        self.assertEqual((await self.request("GET", "/search"))[0], 400)
+        self.assertEqual((await self.request("GET", "/batch"))[0], 405)
+        self.assertEqual((await self.request("GET", "/nada"))[0], 404)
+        self.assertEqual((await self.request("POST", "/batch", ["caza"]))[0], 400)
+
+    async def raw(self, data: bytes, port=None) -> bytes:
+        """Envia bytes crus e lê até o servidor fechar a conexão."""
+        reader, writer = await asyncio.open_connection(self.host, port or self.port)
+        writer.write(data)
+        response = await asyncio.wait_for(reader.read(), timeout=2)
+        writer.close()
+        return response
+
+    async def test_connection_handling(self):
+        """HTTP/1.0 sem keep-alive fecha; um 413 fecha em vez de ler o corpo como requisição."""
+        response = await self.raw(b"GET /contains?word=casa HTTP/1.0\r\n\r\n")
+        self.assertIn(b"Connection: close", response)
+        self.assertTrue(response.endswith(b'"found": true}'))
+
+        self.server.max_body = 10
+        body = b'{"words": ["caza", "escloa"]}'
+        response = await self.raw(b"POST /batch HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body)
+                                  + body + b"GET /contains?word=casa HTTP/1.1\r\n\r\n")
+        self.assertTrue(response.startswith(b"HTTP/1.1 413"))
+        self.assertEqual(response.count(b"HTTP/1.1"), 1)
+
+    async def test_limit_reaches_the_engine(self):
+        """limit entra na chave do micro-lote e vai até search_many(), em vez de cortar depois."""
+        answers = await asyncio.gather(self.request("GET", "/search?word=caza&k=2&limit=1"),
+                                       self.request("GET", "/search?word=mar&k=2&limit=1"),
+                                       self.request("GET", "/search?word=caza&k=2"))
+        self.assertEqual([len(payload["results"]) for _, payload in answers],
+                         [1, 1, len(self.trie.search("caza", 2))])
+        self.assertEqual(sorted(self.trie.calls, key=str), [(1, 2, None), (2, 2, 1)])
+
+    async def test_max_k_follows_the_engine(self):
+        """Um SymSpell construído para k <= 1 limita o k aceito pelo servidor."""
+        index = SymSpell(max_k=1)
+        index.build(["casa", "caso"])
+        server = QueryServer(index)
+        try:
+            self.assertEqual(server.max_k, 1)
+        finally:
+            await server.close()
+
+    async def test_servers_keep_their_engines(self):
+        """Dois servidores no mesmo processo não trocam de motor."""
+        other = Trie()
+        other.insert("zebra")
+        second = QueryServer(other)
+        _, port = await second.start("127.0.0.1", 0)
+        try:
+            request = b"GET /contains?word=casa HTTP/1.0\r\n\r\n"
+            self.assertTrue((await self.raw(request)).endswith(b'"found": true}'))
+            self.assertTrue((await self.raw(request, port)).endswith(b'"found": false}'))
+        finally:
+            await second.close()
+
+    async def test_micro_batching_and_metrics(self):
+        """Buscas simultâneas na mesma janela viram um único lote."""
+        queries = ["caza", "caso", "mar", "bar", "carro"]
+        answers = await asyncio.gather(*(self.request("GET", f"/search?word={q}&k=1") for q in queries))
+        for query, (status, payload) in zip(queries, answers):
+            self.assertEqual(payload["results"], [list(r) for r in self.trie.search(query, 1)])
+        status, metrics = await self.request("GET", "/metrics")
+        self.assertEqual(metrics["batches"], 1)
+        self.assertEqual(metrics["mean_batch_size"], len(queries))
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertEqual(metrics["latency"]["/search"]["count"], len(queries))
+
+if __name__ == '__main__':
+    unittest.main()
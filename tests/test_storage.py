@@ -0,0 +1,53 @@
+import os
+import unittest
+from pathlib import Path
+from nlp_automatos.dawg import DAWG
+from nlp_automatos.storage import load_automaton, save_automaton
+
+class TestStorage(unittest.TestCase):
+
+    def setUp(self):
+        """Cria dicionário temporário e grava o DAWG compilado em disco."""
+        self.test_file = Path("test_dict_storage.txt")
+        self.bin_file = Path("test_dict_storage.dawg.bin")
+        with open(self.test_file, "w", encoding="utf-8") as f:
+            f.write("ação\ncasa\ncaso\nzebra\n")
+
+        self.dawg = DAWG()
+        self.dawg.load_from_file(self.test_file)
+        save_automaton(self.dawg.compile(), self.bin_file, "dawg", self.test_file)
+
+    def tearDown(self):
+        for path in (self.test_file, self.bin_file):
+            if path.exists():
+                path.unlink()
+
+    def test_roundtrip_mmap(self):
+        """O autômato aberto via mmap responde igual ao original."""
+        mapped = load_automaton(self.bin_file, "dawg", self.test_file)
+        self.assertIsNotNone(mapped)
+        for query, k in [("acao", 1), ("casa", 1), ("zebra", 0)]:
+            self.assertEqual(sorted(mapped.search(query, k)), sorted(self.dawg.search(query, k)))
+
+    def test_wrong_kind_is_rejected(self):
+        """Cache de outro tipo de motor não é reaproveitado."""
+        self.assertIsNone(load_automaton(self.bin_file, "trie", self.test_file))
+
+    def test_long_kind_roundtrip(self):
+        """Tipos com mais de 4 letras ('radix', 'symspell') são gravados inteiros."""
+        save_automaton(self.dawg.compile(), self.bin_file, "symspell", self.test_file)
+        self.assertIsNotNone(load_automaton(self.bin_file, "symspell", self.test_file))
+        self.assertIsNone(load_automaton(self.bin_file, "syms", self.test_file))
+        with self.assertRaises(ValueError):
+            save_automaton(self.dawg.compile(), self.bin_file, "x" * 17, self.test_file)
+
+    def test_invalidated_when_source_changes(self):
+        """Alterar o dicionário invalida o cache."""
+        with open(self.test_file, "a", encoding="utf-8") as f:
+            f.write("zumbi\n")
+        stat = self.test_file.stat()
+        os.utime(self.test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertIsNone(load_automaton(self.bin_file, "dawg", self.test_file))
+
+if __name__ == '__main__':
+    unittest.main()
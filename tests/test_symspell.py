@@ -0,0 +1,48 @@
+import random
+import unittest
+from nlp_automatos.cache import CachedEngine
+from nlp_automatos.search_stats import SearchStats
+from nlp_automatos.symspell import SymSpell, deletes
+from nlp_automatos.trie import Trie
+
+class TestSymSpell(unittest.TestCase):
+
+    def setUp(self):
+        """Vocabulário aleatório (semente fixa), com palavras maiores que o prefixo."""
+        rng = random.Random(3)
+        self.words = ["".join(rng.choice("abcão") for _ in range(rng.randint(1, 11))) for _ in range(300)]
+        self.queries = ["".join(rng.choice("abcdão") for _ in range(rng.randint(0, 11))) for _ in range(40)]
+        self.index = SymSpell(max_k=2, prefix_length=5)
+        self.index.build(self.words)
+        self.trie = Trie()
+        for w in self.words:
+            self.trie.insert(w)
+
+    def test_deletes(self):
+        self.assertEqual(deletes("abc", 1), {"abc", "bc", "ac", "ab"})
+
+    def test_matches_trie(self):
+        """Mesmo conjunto de resultados da Trie (verificação exata dos candidatos)."""
+        for query in self.queries:
+            for k in range(3):
+                self.assertEqual(sorted(self.index.search(query, k)), sorted(self.trie.search(query, k)))
+
+    def test_contains_and_k_limit(self):
+        self.assertTrue(self.index.contains(self.words[0]))
+        self.assertFalse(self.index.contains(self.words[0] + "x"))
+        with self.assertRaises(ValueError):
+            self.index.search("abc", 3)
+
+    def test_shared_search_keywords(self):
+        """row_engine e stats do contrato comum são aceitos, também atrás do cache."""
+        query = self.queries[0]
+        stats = SearchStats()
+        self.assertEqual(self.index.search(query, 2, row_engine='classic', limit=3, stats=stats),
+                         self.index.search(query, 2)[:3])
+        self.assertEqual((stats.core, stats.results), ('symspell', len(self.index.search(query, 2)[:3])))
+        cached = CachedEngine(self.index)
+        self.assertEqual(cached.search(query, 1, stats=SearchStats()), self.index.search(query, 1))
+        self.assertEqual(cached.search_many([query], 1, row_engine='auto'), [self.index.search(query, 1)])
+
+if __name__ == '__main__':
+    unittest.main()
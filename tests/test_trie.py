@@ -36,5 +36,13 @@ class TestTrie(unittest.TestCase):
         # 'caza' -> 'carro' (distância maior que 1, não deve vir)
         self.assertNotIn("carro", words)
 
+    def test_contains(self):
+        """Pertinência exata sem passar pela busca aproximada."""
+        self.assertTrue(self.trie.contains("casa"))
+        self.assertIn("CARRO", self.trie)
+        self.assertNotIn("cas", self.trie)
+        self.assertEqual(self.trie.contains_many(["casa", "caza", "casa", "causa"]),
+                         [True, False, True, True])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file